@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Alokasi kelas mahasiswa ke ruangan ujian (tahap 4).
+#
+# Kelas setiap mata kuliah disimpan dalam array berurutan per mata kuliah
+# (gaya CSR) dan sisa mahasiswanya dalam heap, sehingga kelas dengan sisa
+# terbesar bisa diambil dalam O(log k) tanpa mengurutkan ulang setiap baris.
+
+import heapq
+
+import numpy as np
+import pandas as pd
+
+
+class KelasIndex:
+    # Kelas mata kuliah ke-c berada pada baris indptr[c]:indptr[c + 1]
+    # dari array kelas, semester dan jumlah
+    __slots__ = ('course_id', 'indptr', 'kelas', 'semester', 'jumlah')
+
+    def __init__(self, df_makul):
+        df_makul = df_makul.drop_duplicates(['Mata Kuliah', 'Kelas'], keep='last')
+        codes, courses = pd.factorize(df_makul['Mata Kuliah'])
+
+        # Urutan kelas di dalam satu mata kuliah tetap mengikuti urutan baris
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+
+        self.course_id = {mata_kuliah: c for c, mata_kuliah in enumerate(courses)}
+        self.indptr = np.zeros(len(courses) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(codes[order], minlength=len(courses)), out=self.indptr[1:])
+        self.kelas = df_makul['Kelas'].to_numpy()[order]
+        self.semester = df_makul['Semester'].to_numpy()[order]
+        self.jumlah = df_makul['Jumlah Mahasiswa'].to_numpy()[order]
+
+
+def alokasi_kelas(index, mata_kuliah, jumlah_ruang):
+    # Mengalokasikan kelas ke setiap baris (mata kuliah, jumlah mahasiswa di
+    # ruangan) secara berurutan; mengembalikan daftar string "Kelas" per baris
+    # (None untuk mata kuliah yang tidak ada di index)
+    sisa_mahasiswa = index.jumlah.copy()
+    heaps = {}
+    hasil = []
+
+    for mk, ruangan_mahasiswa in zip(mata_kuliah, jumlah_ruang):
+        c = index.course_id.get(mk)
+        if c is None:
+            hasil.append(None)
+            continue
+
+        start, stop = index.indptr[c], index.indptr[c + 1]
+        heap = heaps.get(c)
+        if heap is None:
+            # Heap (-sisa, posisi): sisa terbesar dulu, seri diputus urutan kelas
+            heap = heaps[c] = [(-sisa_mahasiswa[k], k) for k in range(start, stop) if sisa_mahasiswa[k] > 0]
+            heapq.heapify(heap)
+        kelas_assigned = []
+
+        # Cek apakah ada kelas yang jumlah mahasiswanya sama dengan kapasitas ruangan
+        exact = np.flatnonzero(sisa_mahasiswa[start:stop] == ruangan_mahasiswa) if ruangan_mahasiswa > 0 else ()
+        if len(exact):
+            k = start + exact[0]
+            kelas_assigned.append(f"{index.semester[k]}{index.kelas[k]} ({sisa_mahasiswa[k]})")
+            # Entri heap kelas ini menjadi usang dan dibuang saat diambil
+            sisa_mahasiswa[k] = 0
+        else:
+            # Isi ruangan dari kelas dengan sisa mahasiswa terbesar
+            while ruangan_mahasiswa > 0 and heap:
+                neg_jumlah, k = heapq.heappop(heap)
+                jumlah_mahasiswa = sisa_mahasiswa[k]
+                if -neg_jumlah != jumlah_mahasiswa:
+                    continue
+
+                if jumlah_mahasiswa <= ruangan_mahasiswa:
+                    # Seluruh kelas muat dalam ruang
+                    kelas_assigned.append(f"{index.semester[k]}{index.kelas[k]} ({jumlah_mahasiswa})")
+                    ruangan_mahasiswa -= jumlah_mahasiswa
+                    sisa_mahasiswa[k] = 0
+                else:
+                    # Sebagian kelas masuk, sisanya kembali ke heap
+                    kelas_assigned.append(f"{index.semester[k]}{index.kelas[k]} ({ruangan_mahasiswa})")
+                    sisa_mahasiswa[k] -= ruangan_mahasiswa
+                    ruangan_mahasiswa = 0
+                    heapq.heappush(heap, (-sisa_mahasiswa[k], k))
+
+        hasil.append(", ".join(kelas_assigned))
+
+    return hasil
+
+
+def alokasi_mahasiswa(jadwal_lengkap, df_makul):
+    # Salin jadwal_lengkap agar tidak mengubah data asli
+    jadwal_updated = jadwal_lengkap.copy()
+
+    # Hasil alokasi dikumpulkan lalu ditulis sekaligus sebagai satu kolom
+    jadwal_updated['Kelas'] = alokasi_kelas(KelasIndex(df_makul), jadwal_updated['Mata Kuliah'].tolist(),
+                                            jadwal_updated['Jumlah Mahasiswa'].tolist())
+
+    return jadwal_updated
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark keempat tahap optimasi (sesi GA, ruangan, pengawas GA, alokasi
+# kelas) plus pembacaan input, pada instance sintetis ber-seed atau pada
+# workbook template. Setiap tahap dilaporkan: waktu, memori puncak
+# (tracemalloc), generasi/detik dan fitness akhir. Hasil bisa ditambahkan
+# ke file JSON Lines (satu baris per run, dengan commit git) dan dibandingkan
+# dengan run sebelumnya.
+#
+#   python bench.py --preset sedang --repeat 3 --output bench.jsonl
+#   python bench.py --template --compare bench.jsonl
+#   python bench.py --preset semua --engines ga,anneal --no-memory
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from instance import ProblemInstance
+from pipeline import DEFAULT_PARAMS, SESI_SOLVERS, read_input, stage_sesi, stage_ruang, stage_pengawas, stage_alokasi
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Template Plot Ujian DSB.xlsx')
+
+JAM = ['07.30 - 09.30', '10.00 - 12.00', '13.00 - 15.00', '15.30 - 17.30']
+
+# Ukuran instance sintetis
+PRESETS = {
+    'kecil': dict(n_courses=24, classes_per_course=3, n_sessions=12, n_rooms=9, n_lecturers=25),
+    'sedang': dict(n_courses=60, classes_per_course=4, n_sessions=30, n_rooms=16, n_lecturers=60),
+    'besar': dict(n_courses=150, classes_per_course=5, n_sessions=80, n_rooms=30, n_lecturers=120),
+}
+
+# Toleransi sebelum selisih waktu dianggap regresi saat --compare
+REGRESSION_RATIO = 1.2
+
+
+def synthetic_sheets(n_courses=24, classes_per_course=3, n_sessions=12, n_rooms=9, lab_fraction=0.2,
+                     n_lecturers=25, lab_course_fraction=0.15, n_tidak_ujian=2, sessions_per_day=3, seed=0):
+    # Lima sheet berformat "Template Plot Ujian DSB.xlsx" (termasuk sel
+    # kosong yang diisi ffill) untuk ukuran yang diminta
+    rng = np.random.default_rng(seed)
+    if n_courses - n_tidak_ujian > 2 * n_sessions:
+        raise ValueError("Sesi tidak cukup: maksimal 2 mata kuliah per sesi")
+
+    hari = [f'{d + 1:02d}. Hari {d + 1}' for d in range(-(-n_sessions // sessions_per_day))]
+    df_sesi = pd.DataFrame({
+        'Hari': [hari[s // sessions_per_day] if s % sessions_per_day == 0 else np.nan for s in range(n_sessions)],
+        'Jam': [JAM[s % sessions_per_day % len(JAM)] for s in range(n_sessions)],
+    })
+
+    capacity = rng.integers(25, 71, size=n_rooms)
+    pengawas = np.where(capacity >= 40, 2, 1)
+    if n_lecturers < pengawas.sum():
+        raise ValueError(f"Dosen terlalu sedikit: satu slot bisa butuh {pengawas.sum()} pengawas")
+    df_ruang = pd.DataFrame({
+        'Ruang': [f'R {r + 101}' for r in range(n_rooms)],
+        'Jumlah Pengawas': pengawas,
+        'Kapasitas': capacity,
+        'Lab': np.where(rng.random(n_rooms) < lab_fraction, 'y', None),
+    })
+
+    dosen = [f'D{j:03d}' for j in range(n_lecturers)]
+    courses = [f'Mata Kuliah {m + 1:03d}' for m in range(n_courses)]
+    rows = []
+    for mata_kuliah in courses:
+        semester = int(rng.integers(1, 9))
+        pengampu = ', '.join(rng.choice(dosen, size=int(rng.integers(1, 4)), replace=False))
+        for k in range(classes_per_course):
+            first = k == 0
+            rows.append([mata_kuliah if first else np.nan, float(semester) if first else np.nan,
+                         pengampu if first else np.nan, chr(ord('A') + k), int(rng.integers(20, 46))])
+    df_makul = pd.DataFrame(rows, columns=['Mata Kuliah', 'Semester', 'Dosen Pengampu', 'Kelas', 'Jumlah Mahasiswa'])
+
+    excluded = rng.choice(courses, size=n_tidak_ujian, replace=False)
+    df_tidak_ujian = pd.DataFrame({'Tidak Ujian': excluded})
+    n_lab = max(1, int(round(lab_course_fraction * n_courses)))
+    df_butuh_lab = pd.DataFrame({'Butuh Lab': rng.choice(courses, size=n_lab, replace=False)})
+    return df_sesi, df_ruang, df_makul, df_tidak_ujian, df_butuh_lab
+
+
+def workbook_bytes(sheets):
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        for name, df in zip(('Sesi', 'Ruangan', 'Makul', 'Tidak Ujian', 'Butuh Lab'), sheets):
+            df.to_excel(writer, sheet_name=name, index=False)
+    return output.getvalue()
+
+
+def _measure(fn, memory):
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+        wall = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return result, wall, peak
+
+
+def run_stages(data, params, memory=True):
+    # Satu run lengkap; hasil: {tahap: {wall_s, peak_mb, ...}}
+    params = {**DEFAULT_PARAMS, **params}
+    stages = {}
+
+    def record(name, fn):
+        result, wall, peak = _measure(fn, memory)
+        stages[name] = {'wall_s': wall, 'peak_mb': None if peak is None else peak / 2 ** 20}
+        return result
+
+    def record_ga(name, info):
+        # Generasi yang benar-benar dijalankan (bisa berhenti lebih awal)
+        stop = info['stop']
+        wall = stages[name]['wall_s']
+        stages[name].update(fitness=info['fitness'], generations=stop['generation'], stop=stop['reason'],
+                            generations_per_s=stop['generation'] / wall if wall > 0 else None)
+
+    instance = record('input', lambda: ProblemInstance(*read_input(data, cache_dir=None)))
+    jadwal_dan_makul, sesi_info = record('sesi', lambda: stage_sesi(instance, params))
+    record_ga('sesi', sesi_info)
+    jadwal_makul_dan_ruang, ruang_info = record('ruang', lambda: stage_ruang(instance, jadwal_dan_makul, params))
+    stages['ruang']['fitness'] = float(ruang_info['fitness'])
+    jadwal_lengkap, _, pengawas_info = record('pengawas',
+                                              lambda: stage_pengawas(instance, jadwal_makul_dan_ruang, params))
+    record_ga('pengawas', pengawas_info)
+    record('alokasi', lambda: stage_alokasi(jadwal_lengkap, jadwal_makul_dan_ruang, instance.df_makul,
+                                            params['decompose_workers'] if params['decompose'] else None))
+
+    size = {'n_makul': instance.n_makul, 'n_kelas': len(instance.df_makul), 'n_sesi': instance.n_sesi,
+            'n_ruang': instance.n_ruang, 'n_dosen': instance.n_dosen, 'n_baris_jadwal': len(jadwal_lengkap)}
+    return stages, size
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark(data, name, params=None, repeat=1, memory=True):
+    # Waktu terbaik dari beberapa ulangan tanpa tracemalloc; memori puncak
+    # diukur pada satu run tambahan karena tracemalloc memperlambat NumPy.
+    # Dengan seed yang sama fitness tidak berubah antar ulangan.
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    best, size = None, None
+    for _ in range(repeat):
+        stages, size = run_stages(data, params, memory=False)
+        if best is None:
+            best = stages
+        else:
+            for stage, metrics in stages.items():
+                if metrics['wall_s'] < best[stage]['wall_s']:
+                    best[stage] = metrics
+    if memory:
+        stages, _ = run_stages(data, params, memory=True)
+        for stage, metrics in stages.items():
+            best[stage]['peak_mb'] = metrics['peak_mb']
+    return {
+        'name': name,
+        'commit': _git_commit(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'repeat': repeat,
+        'params': params,
+        'size': size,
+        'stages': best,
+        'total_s': sum(metrics['wall_s'] for metrics in best.values()),
+    }
+
+
+def format_result(result, baseline=None):
+    lines = [f"{result['name']} @ {result['commit'] or '-'}: {result['size']}"]
+    lines.append(f"{'tahap':<10}{'waktu (s)':>11}{'memori (MB)':>13}{'gen/s':>10}{'fitness':>12}{'berhenti':>18}")
+    for stage, m in result['stages'].items():
+        peak = '-' if m['peak_mb'] is None else f"{m['peak_mb']:.1f}"
+        gps = f"{m['generations_per_s']:.0f}" if m.get('generations_per_s') else '-'
+        fit = f"{m['fitness']:.4g}" if 'fitness' in m else '-'
+        stop = f"{m['stop']} @ {m['generations']}" if 'stop' in m else '-'
+        line = f"{stage:<10}{m['wall_s']:>11.4f}{peak:>13}{gps:>10}{fit:>12}{stop:>18}"
+        if baseline and stage in baseline['stages']:
+            ratio = m['wall_s'] / max(baseline['stages'][stage]['wall_s'], 1e-9)
+            line += f"  x{ratio:.2f}" + ('  REGRESI' if ratio > REGRESSION_RATIO else '')
+        lines.append(line)
+    lines.append(f"{'total':<10}{result['total_s']:>11.4f}")
+    return '\n'.join(lines)
+
+
+def format_engines(results):
+    # Ringkasan perbandingan mesin sesi: satu baris per (instance, mesin)
+    lines = [f"{'instance':<14}{'mesin':<10}{'sesi (s)':>10}{'generasi':>10}{'fitness':>10}{'berhenti':>14}{'total (s)':>11}"]
+    for result in results:
+        sesi = result['stages']['sesi']
+        lines.append(f"{result['name'].split('/')[0]:<14}{result['params']['sesi_solver']:<10}{sesi['wall_s']:>10.4f}"
+                     f"{sesi['generations']:>10}{sesi['fitness']:>10.4g}{sesi['stop']:>14}{result['total_s']:>11.4f}")
+    return '\n'.join(lines)
+
+
+def load_baseline(path, name):
+    # Run terakhir dengan nama yang sama di file JSON Lines
+    baseline = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                if record['name'] == name:
+                    baseline = record
+    return baseline
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark tahap-tahap penjadwalan ujian.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--preset', choices=sorted(PRESETS) + ['semua'], default='kecil',
+                        help="Ukuran instance sintetis ('semua' = setiap preset)")
+    source.add_argument('--template', action='store_true', help="Pakai workbook template bawaan")
+    source.add_argument('--input', help="Pakai workbook .xlsx ini")
+    parser.add_argument('--instance-seed', type=int, default=0, help="Seed generator instance sintetis")
+    parser.add_argument('--repeat', type=int, default=1, help="Jumlah ulangan; waktu terbaik dilaporkan")
+    parser.add_argument('--no-memory', action='store_true', help="Lewati run tambahan untuk mengukur memori")
+    parser.add_argument('--output', help="Tambahkan hasil ke file JSON Lines ini")
+    parser.add_argument('--compare', help="Bandingkan dengan run terakhir bernama sama di file JSON Lines ini")
+    parser.add_argument('--engines', help="Bandingkan mesin sesi, dipisah koma (mis. ga,anneal); "
+                                          "pilihan: " + ", ".join(SESI_SOLVERS))
+    for key, default in DEFAULT_PARAMS.items():
+        parser.add_argument('--' + key.replace('_', '-'), type=type(default), default=default)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    params = {key: getattr(args, key) for key in DEFAULT_PARAMS}
+
+    if args.template or args.input:
+        path = args.input or TEMPLATE_PATH
+        with open(path, 'rb') as f:
+            instances = [(os.path.basename(path), f.read())]
+    else:
+        presets = sorted(PRESETS, key=lambda p: PRESETS[p]['n_courses']) if args.preset == 'semua' else [args.preset]
+        instances = [(f'{preset}-{args.instance_seed}',
+                      workbook_bytes(synthetic_sheets(**PRESETS[preset], seed=args.instance_seed)))
+                     for preset in presets]
+    engines = args.engines.split(',') if args.engines else [params['sesi_solver']]
+    unknown = [engine for engine in engines if engine not in SESI_SOLVERS]
+    if unknown:
+        print("Mesin sesi tidak dikenal: " + ", ".join(unknown), file=sys.stderr)
+        return 2
+
+    results = []
+    for instance_name, data in instances:
+        for engine in engines:
+            # Nama run memuat mesinnya bila lebih dari satu mesin dibandingkan
+            name = instance_name if len(engines) == 1 else f'{instance_name}/{engine}'
+            baseline = load_baseline(args.compare, name) if args.compare and os.path.exists(args.compare) else None
+            result = benchmark(data, name, {**params, 'sesi_solver': engine}, repeat=args.repeat,
+                               memory=not args.no_memory)
+            print(format_result(result, baseline))
+            results.append(result)
+
+            if args.output:
+                with open(args.output, 'a') as f:
+                    f.write(json.dumps(result) + '\n')
+    if len(engines) > 1:
+        print(format_engines(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
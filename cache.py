@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Cache hasil penjadwalan: LRU terbatas di memori dengan tingkat disk opsional.
+# Kunci dibentuk dari hash isi file yang diunggah ditambah parameter GA dan
+# seed, sehingga unggahan yang sama (dari sesi mana pun) memakai hasil yang
+# sama dan hanya dihitung sekali.
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+def content_key(data, **params):
+    digest = hashlib.sha256(data)
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, max_entries=16, disk_dir=None, max_disk_entries=256):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Satu lock per kunci yang sedang dihitung agar permintaan yang sama
+        # menunggu hasil perhitungan pertama, bukan menghitung ulang
+        self._inflight = {}
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key + '.pkl')
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), 'rb') as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                return _MISSING
+            self._remember(key, value)
+            return value
+        return _MISSING
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _write_disk(self, key, value):
+        path = self._disk_path(key)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+        # Buang file tertua jika tingkat disk melebihi batas
+        files = [os.path.join(self.disk_dir, name) for name in os.listdir(self.disk_dir)
+                 if name.endswith('.pkl')]
+        if len(files) > self.max_disk_entries:
+            files.sort(key=os.path.getmtime)
+            for old in files[:len(files) - self.max_disk_entries]:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.disk_dir:
+            self._write_disk(key, value)
+
+    def get_or_compute(self, key, compute):
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # Mungkin sudah dihitung oleh sesi lain selama menunggu
+                value = self._lookup(key)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+                self.misses += 1
+                value = compute()
+                self.put(key, value)
+                return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
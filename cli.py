@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Penjadwalan tanpa browser: satu atau banyak workbook berformat
+# "Template Plot Ujian DSB.xlsx" menjadi workbook Jadwal / Rekap Jaga.
+#
+#   python cli.py input.xlsx -o jadwal_ujian.xlsx
+#   python cli.py prodi/*.xlsx -o hasil/ --jobs 4
+#   python cli.py input.xlsx -o hasil/ --format csv
+#   python cli.py input.xlsx -o jadwal_baru.xlsx --previous jadwal_ujian.xlsx
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from export import FORMATS, export
+from pipeline import DEFAULT_PARAMS, run_pipeline
+
+
+def schedule_workbook(input_path, output_path, params, fmt='xlsx', previous_path=None):
+    # Dijalankan di proses worker; harus berada di level modul agar bisa di-pickle
+    start = time.perf_counter()
+    with open(input_path, 'rb') as f:
+        data = f.read()
+    previous = None
+    if previous_path:
+        with open(previous_path, 'rb') as f:
+            previous = f.read()
+    hasil = run_pipeline(data, params, previous=previous)
+    content = hasil['excel'] if fmt == 'xlsx' else export(hasil['jadwal'], hasil['rekap'], fmt)
+    with open(output_path, 'wb') as f:
+        f.write(content)
+    return output_path, time.perf_counter() - start
+
+
+def collect_inputs(paths):
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            inputs.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                 if name.endswith('.xlsx') and not name.startswith('~$')))
+        else:
+            inputs.append(path)
+    return inputs
+
+
+def output_paths(inputs, output, fmt='xlsx'):
+    # Satu input boleh langsung ditulis ke file; selain itu output adalah folder
+    ext = FORMATS[fmt][1]
+    if len(inputs) == 1 and output and output.endswith(ext):
+        return [output]
+    folder = output or '.'
+    os.makedirs(folder, exist_ok=True)
+    return [os.path.join(folder, os.path.splitext(os.path.basename(path))[0] + '_jadwal' + ext)
+            for path in inputs]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Penjadwalan ujian dari workbook template tanpa Streamlit.")
+    parser.add_argument('inputs', nargs='+', help="Workbook input (.xlsx) atau folder berisi workbook")
+    parser.add_argument('-o', '--output', help="File .xlsx (satu input) atau folder output (default: folder saat ini)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Jumlah proses paralel (default: 1)")
+    parser.add_argument('-f', '--format', choices=sorted(FORMATS), default='xlsx',
+                        help="Format output; csv dan parquet hanya berisi sheet Jadwal (default: xlsx)")
+    parser.add_argument('--previous', help="jadwal_ujian.xlsx sebelumnya: hanya bagian yang berubah dijadwalkan "
+                                           "ulang (hanya untuk satu input)")
+    for key, default in DEFAULT_PARAMS.items():
+        parser.add_argument('--' + key.replace('_', '-'), type=type(default), default=default)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    params = {key: getattr(args, key) for key in DEFAULT_PARAMS}
+    if args.format != 'xlsx' and params['export_split']:
+        parser.error("--export-split hanya tersedia untuk --format xlsx")
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("Tidak ada workbook input", file=sys.stderr)
+        return 2
+    # Jadwal sebelumnya milik satu workbook; warm start ke input lain akan
+    # mempertahankan jadwal yang salah
+    if args.previous and len(inputs) > 1:
+        parser.error(f"--previous hanya bisa dipakai dengan satu input ({len(inputs)} workbook diberikan)")
+    outputs = output_paths(inputs, args.output, args.format)
+
+    failed = 0
+    if args.jobs <= 1:
+        for input_path, output_path in zip(inputs, outputs):
+            try:
+                _, elapsed = schedule_workbook(input_path, output_path, params, args.format, args.previous)
+                print(f"{input_path} -> {output_path} ({elapsed:.1f} s)")
+            except Exception as e:
+                failed += 1
+                print(f"{input_path}: gagal ({e})", file=sys.stderr)
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(schedule_workbook, input_path, output_path, params, args.format,
+                                   args.previous): input_path
+                       for input_path, output_path in zip(inputs, outputs)}
+            for future in as_completed(futures):
+                input_path = futures[future]
+                try:
+                    output_path, elapsed = future.result()
+                    print(f"{input_path} -> {output_path} ({elapsed:.1f} s)")
+                except Exception as e:
+                    failed += 1
+                    print(f"{input_path}: gagal ({e})", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
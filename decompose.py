@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Mode dekomposisi untuk unggahan besar (satu fakultas). Setelah sesi
+# ditetapkan, tahap-tahap berikutnya dipecah menjadi sub-masalah yang
+# dijalankan paralel di process pool, lalu digabung kembali menjadi output
+# yang sama:
+#   - penempatan ruangan: per slot (Hari, Jam), hasilnya identik dengan
+#     solver serial karena setiap slot memang dikemas sendiri-sendiri;
+#   - alokasi kelas: per slot, identik karena satu mata kuliah hanya berada
+#     di satu slot;
+#   - pengawas: per hari (GA atau min-cost flow) pada sub-masalah yang sudah
+#     dienkode, lalu pass koordinasi global yang memindahkan tugas dari dosen
+#     berbeban tertinggi ke dosen yang bebas pada slot itu sampai selisih
+#     beban <= 1. Anggaran generasi GA dibagi antar hari sebanding jumlah
+#     baris, sehingga total kerja sama dengan satu GA serial.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from alokasi import alokasi_mahasiswa
+from island import island_seeds
+from pengawas import MAX_FITNESS, PengawasProblem, SupervisorLoad, solve_flow, solve_ga
+from ruang import generate_schedule, optimize_schedule
+from stopping import from_params as convergence_from_params
+
+# Instance masalah di proses worker, diset sekali oleh initializer pool
+_INSTANCE = None
+
+
+def _init_worker(instance):
+    global _INSTANCE
+    _INSTANCE = instance
+
+
+def run_tasks(fn, tasks, instance, workers=0):
+    # fn(*task) untuk setiap task, urutan hasil sama dengan urutan task.
+    # workers: 0 = satu per core, 1 = serial di proses ini
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        _init_worker(instance)
+        try:
+            return [fn(*task) for task in tasks]
+        finally:
+            _init_worker(None)
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(instance,)) as pool:
+        return list(pool.map(fn, *zip(*tasks), chunksize=chunksize))
+
+
+def _pack_task(df_slot, solver):
+    if solver == 'greedy':
+        return generate_schedule(df_slot, _INSTANCE), {}
+    return optimize_schedule(df_slot, _INSTANCE)
+
+
+def pack_rooms(instance, jadwal_dan_makul, solver='optimal', workers=0):
+    # Penempatan ruangan per slot secara paralel; slot diurutkan seperti
+    # pada solver serial sehingga baris hasil sama persis
+    tasks = [(df_slot, solver) for _, df_slot in jadwal_dan_makul.groupby(['Hari', 'Jam'], sort=True)]
+    # Tanpa slot sama sekali: satu task kosong agar kolom hasil tetap ada
+    tasks = tasks or [(jadwal_dan_makul, solver)]
+    results = run_tasks(_pack_task, tasks, instance, workers)
+    schedule = pd.concat([schedule for schedule, _ in results], ignore_index=True)
+    info = {}
+    for _, slot_info in results:
+        for key, value in slot_info.items():
+            info[key] = info.get(key, 0) + value
+    return schedule, info
+
+
+def _alokasi_task(df_slot, df_makul):
+    return alokasi_mahasiswa(df_slot, df_makul)['Kelas']
+
+
+def allocate_classes(jadwal_lengkap, df_makul, workers=0):
+    # Alokasi kelas per slot (Hari, Waktu) secara paralel; setiap task hanya
+    # membawa baris df_makul untuk mata kuliah di slotnya
+    groups = [df_slot for _, df_slot in jadwal_lengkap.groupby(['Hari', 'Waktu'], sort=False)]
+    tasks = [(df_slot, df_makul[df_makul['Mata Kuliah'].isin(df_slot['Mata Kuliah'])]) for df_slot in groups]
+    jadwal_updated = jadwal_lengkap.copy()
+    jadwal_updated['Kelas'] = None
+    for kelas in run_tasks(_alokasi_task, tasks, None, workers):
+        jadwal_updated.loc[kelas.index, 'Kelas'] = kelas
+    return jadwal_updated
+
+
+def _pengawas_task(problem, params, generations, seed):
+    # problem: sub-masalah satu hari (PengawasProblem.subproblem)
+    if params['pengawas_solver'] == 'flow':
+        return solve_flow(problem)
+    # Kriteria berhenti per hari (tanpa batas waktu: jam tidak dibagi antar proses)
+    convergence = convergence_from_params(params, MAX_FITNESS)
+    individual, _ = solve_ga(problem, generations, params['pengawas_population_size'], seed=seed,
+                             convergence=convergence)
+    return individual
+
+
+def balance(problem, individual):
+    # Pass koordinasi global: selama ada dosen a dan b dengan beban a >= beban b + 2
+    # dan b bebas pada slot salah satu baris a, pindahkan tugas itu ke b (jumlah
+    # kuadrat beban turun, jadi pasti berhenti). Pengampu baris diutamakan, lalu
+    # beban terendah. Baris tetap (warm start) tidak diubah. Mengembalikan
+    # jumlah pemindahan.
+    load = SupervisorLoad(problem, individual[None]).dosen_supervise_count[0]
+    busy = [0] * problem.n_slot
+    for r in range(problem.n_rows):
+        for d in individual[r][individual[r] >= 0]:
+            busy[problem.slot_of_row[r]] |= 1 << int(d)
+    free_row = np.zeros(problem.n_rows, dtype=bool)
+    free_row[problem.free_rows] = True
+
+    moves = 0
+    while True:
+        for a in np.argsort(-load, kind='stable'):
+            if load[a] - load.min() <= 1:
+                return moves
+            best = None
+            rows, cols = np.nonzero((individual == a) & free_row[:, None])
+            for r, c in zip(rows, cols):
+                slot = problem.slot_of_row[r]
+                for b in np.flatnonzero(load <= load[a] - 2):
+                    if busy[slot] >> int(b) & 1:
+                        continue
+                    key = (not problem.pengampu_mask[r] >> int(b) & 1, load[b], b)
+                    if best is None or key < best[0]:
+                        best = (key, r, c, b)
+            if best is not None:
+                _, r, c, b = best
+                slot = problem.slot_of_row[r]
+                individual[r, c] = b
+                busy[slot] = busy[slot] & ~(1 << int(a)) | 1 << int(b)
+                load[a] -= 1
+                load[b] += 1
+                moves += 1
+                break
+        else:
+            return moves
+
+
+def assign_supervisors(instance, df_jadwal, params, fixed=None, workers=0):
+    # Pengawas per hari (paralel) lalu penyeimbangan global; mengembalikan
+    # (problem global, individu, jumlah pemindahan pada pass koordinasi)
+    problem = PengawasProblem(instance, df_jadwal, fixed)
+    days = [np.flatnonzero(df_jadwal['Hari'].to_numpy() == hari) for hari in pd.unique(df_jadwal['Hari'])]
+    seeds = island_seeds(len(days), params['seed'])
+    tasks = [(problem.subproblem(rows), params, _day_generations(params['pengawas_generations'], len(rows),
+                                                                 problem.n_rows), seed)
+             for rows, seed in zip(days, seeds)]
+
+    individual = np.full((problem.n_rows, problem.max_pengawas), -1, dtype=np.intp)
+    for rows, day_individual in zip(days, run_tasks(_pengawas_task, tasks, None, workers)):
+        individual[rows, :day_individual.shape[1]] = day_individual
+    moves = balance(problem, individual)
+    return problem, individual, moves
+
+
+def _day_generations(generations, n_day_rows, n_rows):
+    # Bagian anggaran generasi untuk satu hari, sebanding jumlah barisnya
+    return max(1, -(-generations * n_day_rows // max(n_rows, 1)))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Ekspor jadwal: sheet Jadwal dan Rekap Jaga ditulis baris per baris dengan
+# xlsxwriter mode constant_memory (setiap baris langsung di-flush ke file
+# sementara), ke file di disk atau ke TemporaryFile yang dibaca sekali.
+# Baris dibaca satu per satu dari DataFrame (itertuples), tanpa salinan
+# tabel sebagai list Python. Opsional: sheet tambahan per hari atau per
+# ruang, serta CSV/Parquet. xlsxwriter baru diimpor saat workbook ditulis.
+
+import io
+import re
+import tempfile
+
+# Pengelompokan sheet tambahan: nilai opsi -> kolom jadwal
+SPLIT_COLUMNS = {'hari': 'Hari', 'ruang': 'Ruang'}
+
+# Format header seperti DataFrame.to_excel
+HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+
+def _sheet_name(name, used):
+    # Nama sheet Excel: maksimal 31 karakter, tanpa []:*?/\ dan unik
+    base = re.sub(r'[\[\]:*?/\\]', '-', str(name)).strip("'")[:31] or 'Sheet'
+    name, k = base, 1
+    while name.lower() in used:
+        k += 1
+        suffix = f' ({k})'
+        name = base[:31 - len(suffix)] + suffix
+    used.add(name.lower())
+    return name
+
+
+def _write_table(worksheet, header_format, df, index=False):
+    # Header lalu baris df satu per satu; index=True menulis index sebagai
+    # kolom pertama berformat header. Sel kosong/NaN dilewati.
+    offset = 1 if index else 0
+    for c, column in enumerate(df.columns):
+        worksheet.write(0, c + offset, column, header_format)
+
+    for r, row in enumerate(df.itertuples(index=index, name=None), start=1):
+        for c, value in enumerate(row):
+            if value is None or value != value:
+                continue
+            worksheet.write(r, c, value, header_format if index and c == 0 else None)
+
+
+def write_excel(target, jadwal, rekap, split=None):
+    # target: path atau file-like yang bisa di-seek
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(target, {'constant_memory': True})
+    header_format = workbook.add_format(HEADER_FORMAT)
+    used = set()
+
+    _write_table(workbook.add_worksheet(_sheet_name('Jadwal', used)), header_format, jadwal)
+    _write_table(workbook.add_worksheet(_sheet_name('Rekap Jaga', used)), header_format, rekap, index=True)
+
+    if split:
+        for key, group in jadwal.groupby(SPLIT_COLUMNS[split], sort=False):
+            _write_table(workbook.add_worksheet(_sheet_name(key, used)), header_format, group)
+
+    workbook.close()
+
+
+def to_excel(jadwal, rekap, split=None):
+    # Workbook ditulis ke file sementara lalu dibaca sekali sebagai bytes,
+    # tanpa salinan BytesIO tambahan
+    with tempfile.TemporaryFile() as f:
+        write_excel(f, jadwal, rekap, split)
+        f.seek(0)
+        return f.read()
+
+
+def to_csv(jadwal):
+    return jadwal.to_csv(index=False).encode('utf-8')
+
+
+def to_parquet(jadwal):
+    output = io.BytesIO()
+    jadwal.to_parquet(output, index=False)
+    return output.getvalue()
+
+
+def _jadwal_only(write):
+    # Format satu tabel: hanya sheet Jadwal, tanpa sheet tambahan
+    def export(jadwal, rekap, split=None):
+        if split:
+            raise ValueError("Sheet tambahan (split) hanya tersedia untuk format xlsx")
+        return write(jadwal)
+    return export
+
+
+# Format ekspor -> (fungsi, ekstensi file, mime)
+FORMATS = {
+    'xlsx': (to_excel, '.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': (_jadwal_only(to_csv), '.csv', 'text/csv'),
+    'parquet': (_jadwal_only(to_parquet), '.parquet', 'application/octet-stream'),
+}
+
+
+def export(jadwal, rekap, fmt='xlsx', split=None):
+    return FORMATS[fmt][0](jadwal, rekap, split)
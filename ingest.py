@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Membaca workbook input sekali jalan: file dibuka satu kali dengan openpyxl
+# (read-only, streaming) dan kelima sheet diambil sekaligus, lalu kolom dan
+# tipe data divalidasi sebelum penjadwalan dimulai. Hasil parsing bisa
+# disimpan sebagai Parquet per hash file agar unggahan yang sama tidak
+# di-parse ulang. openpyxl baru diimpor saat workbook benar-benar dibuka
+# (unggahan yang sudah ada di cache Parquet tidak memerlukannya).
+
+import hashlib
+import io
+import os
+import shutil
+import threading
+import zipfile
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+SHEETS = ('Sesi', 'Ruangan', 'Makul', 'Tidak Ujian', 'Butuh Lab')
+
+# Kolom wajib per sheet; True = harus berupa angka. Sheet 'Tidak Ujian'
+# cukup memiliki satu kolom (namanya diganti saat persiapan).
+REQUIRED_COLUMNS = {
+    'Sesi': {'Hari': False, 'Jam': False},
+    'Ruangan': {'Ruang': False, 'Jumlah Pengawas': True, 'Kapasitas': True, 'Lab': False},
+    'Makul': {'Mata Kuliah': False, 'Semester': True, 'Dosen Pengampu': False, 'Kelas': False,
+              'Jumlah Mahasiswa': True},
+    'Tidak Ujian': {},
+    'Butuh Lab': {'Butuh Lab': False},
+}
+
+# Kolom sheet 'Jadwal' pada jadwal_ujian.xlsx hasil sebelumnya (warm start)
+JADWAL_COLUMNS = {'Hari': False, 'Waktu': False, 'Mata Kuliah': False, 'Pengawas': False, 'Ruang': False,
+                  'Jumlah Mahasiswa': True, 'Kapasitas': True}
+
+
+class InputError(ValueError):
+    pass
+
+
+def _cell(value):
+    # Konversi sel sama seperti pd.read_excel: sel kosong menjadi '' (NaN
+    # setelah parsing) dan float bulat menjadi int
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _sheet_frame(worksheet):
+    worksheet.reset_dimensions()
+    rows = [[_cell(value) for value in row] for row in worksheet.iter_rows(values_only=True)]
+
+    # Buang baris kosong di akhir dan samakan panjang baris
+    while rows and all(value == '' for value in rows[-1]):
+        rows.pop()
+    width = max((len(row) for row in rows), default=0)
+    rows = [row + [''] * (width - len(row)) for row in rows]
+    if not rows:
+        return pd.DataFrame()
+    return TextParser(rows, header=0).read()
+
+
+def _open_workbook(data):
+    from openpyxl import load_workbook
+    try:
+        return load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, OSError) as e:
+        raise InputError(f"File bukan workbook .xlsx ({e})") from e
+
+
+def parse_workbook(data):
+    workbook = _open_workbook(data)
+    try:
+        missing = [name for name in SHEETS if name not in workbook.sheetnames]
+        if missing:
+            raise InputError("Sheet tidak ditemukan: " + ", ".join(missing))
+        return {name: _sheet_frame(workbook[name]) for name in SHEETS}
+    finally:
+        workbook.close()
+
+
+def validate(sheets, required=REQUIRED_COLUMNS):
+    problems = []
+    for name, columns in required.items():
+        df = sheets[name]
+        if len(df.columns) == 0:
+            problems.append(f"Sheet '{name}' kosong")
+            continue
+        for column, numeric in columns.items():
+            if column not in df.columns:
+                problems.append(f"Sheet '{name}': kolom '{column}' tidak ditemukan")
+            elif numeric and df[column].notna().any() and not pd.api.types.is_numeric_dtype(df[column]):
+                problems.append(f"Sheet '{name}': kolom '{column}' harus berupa angka")
+    if problems:
+        raise InputError("; ".join(problems))
+
+
+def read_jadwal(data):
+    # Sheet 'Jadwal' dari workbook output sebelumnya (bytes atau file-like)
+    if not isinstance(data, (bytes, bytearray)):
+        data = data.read()
+    workbook = _open_workbook(data)
+    try:
+        if 'Jadwal' not in workbook.sheetnames:
+            raise InputError("Sheet tidak ditemukan: Jadwal")
+        sheets = {'Jadwal': _sheet_frame(workbook['Jadwal'])}
+    finally:
+        workbook.close()
+    validate(sheets, {'Jadwal': JADWAL_COLUMNS})
+    return sheets['Jadwal']
+
+
+def _cache_path(cache_dir, data):
+    return os.path.join(cache_dir, hashlib.sha256(data).hexdigest())
+
+
+def _load_cached(path):
+    try:
+        return {name: pd.read_parquet(os.path.join(path, name + '.parquet')) for name in SHEETS}
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+def _store_cached(path, sheets):
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(tmp, exist_ok=True)
+        for name, df in sheets.items():
+            df.to_parquet(os.path.join(tmp, name + '.parquet'), index=False)
+        os.replace(tmp, path)
+    except (OSError, ImportError, ValueError, TypeError):
+        # pyarrow tidak tersedia atau kolom bertipe campuran: lewati cache
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def read_workbook(data, cache_dir=None):
+    # data: bytes atau file-like; mengembalikan df_sesi, df_ruang, df_makul,
+    # df_tidak_ujian, df_butuh_lab
+    if not isinstance(data, (bytes, bytearray)):
+        data = data.read()
+
+    sheets = None
+    if cache_dir:
+        path = _cache_path(cache_dir, data)
+        sheets = _load_cached(path) if os.path.isdir(path) else None
+    if sheets is None:
+        sheets = parse_workbook(data)
+        validate(sheets)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            _store_cached(path, sheets)
+    return tuple(sheets[name] for name in SHEETS)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Instance masalah penjadwalan: kelima sheet input dibersihkan sekali per
+# unggahan lalu diubah menjadi kode integer (Hari, Jam, Ruang, Mata Kuliah,
+# Dosen), grid slot (sesi x ruang), mask lab dan array kapasitas. Semua tahap
+# optimasi membaca dari objek ini alih-alih menurunkannya ulang dari DataFrame.
+# Objek ini tidak bisa diubah: array bersifat read-only, atribut hanya diisi
+# sekali, dan sheet input hanya bisa diambil sebagai salinan (df_sesi, dst.).
+
+import numpy as np
+import pandas as pd
+
+
+def _frozen(values, dtype=None):
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+class ProblemInstance:
+    __slots__ = (
+        # Sheet input yang sudah dibersihkan (untuk tampilan dan output);
+        # dibaca lewat properti df_* yang mengembalikan salinan
+        '_df_sesi', '_df_ruang', '_df_makul', '_df_tidak_ujian', '_df_butuh_lab',
+        # Sesi: kode hari, jam dan slot (Hari, Jam) per baris df_sesi
+        'hari', 'jam', 'sesi_hari', 'sesi_jam', 'sesi_slot', 'slot_hari', 'slot_jam',
+        'n_sesi', 'n_hari', 'n_slot',
+        # Ruang, urut seperti df_ruang
+        'ruang', 'ruang_capacity', 'ruang_is_lab', 'ruang_pengawas', 'n_ruang',
+        # Mata kuliah, urut nama; dosen pengampu dalam bentuk CSR:
+        # id dosen mata kuliah ke-m ada di makul_dosen[makul_dosen_ptr[m]:makul_dosen_ptr[m + 1]]
+        'makul', 'makul_semester', 'makul_sem', 'makul_lab', 'makul_pengampu',
+        'makul_dosen_ptr', 'makul_dosen', 'semester', 'n_makul',
+        'dosen', 'n_dosen',
+        # Grid slot jadwal: setiap pasangan (sesi, ruang)
+        'grid_sesi', 'grid_ruang',
+    )
+
+    def __init__(self, df_sesi, df_ruang, df_makul, df_tidak_ujian, df_butuh_lab):
+        df_makul = df_makul.ffill()
+        df_sesi = df_sesi.ffill()
+
+        # Mata kuliah yang tidak diujikan dibuang dari Makul dan Butuh Lab
+        df_tidak_ujian = df_tidak_ujian.set_axis(['Tidak Ujian'], axis=1)
+        tidak_ujian = df_tidak_ujian['Tidak Ujian']
+        df_butuh_lab = df_butuh_lab[~df_butuh_lab['Butuh Lab'].isin(tidak_ujian)].reset_index(drop=True)
+        df_makul = df_makul[~df_makul['Mata Kuliah'].isin(tidak_ujian)].reset_index(drop=True)
+        df_makul['Semester'] = df_makul['Semester'].astype(int)
+
+        self._df_sesi = df_sesi
+        self._df_ruang = df_ruang.copy()
+        self._df_makul = df_makul
+        self._df_tidak_ujian = df_tidak_ujian
+        self._df_butuh_lab = df_butuh_lab
+
+        # Sesi (kode menurut urutan kemunculan)
+        sesi_hari, hari = pd.factorize(df_sesi['Hari'])
+        sesi_jam, jam = pd.factorize(df_sesi['Jam'])
+        sesi_slot, slots = pd.factorize(sesi_hari * len(jam) + sesi_jam)
+        self.hari = _frozen(hari, dtype=object)
+        self.jam = _frozen(jam, dtype=object)
+        self.sesi_hari = _frozen(sesi_hari, dtype=np.intp)
+        self.sesi_jam = _frozen(sesi_jam, dtype=np.intp)
+        self.sesi_slot = _frozen(sesi_slot, dtype=np.intp)
+        self.slot_hari = _frozen(slots // max(len(jam), 1), dtype=np.intp)
+        self.slot_jam = _frozen(slots % max(len(jam), 1), dtype=np.intp)
+        self.n_sesi = len(df_sesi)
+        self.n_hari = len(hari)
+        self.n_slot = len(slots)
+
+        # Ruang
+        self.ruang = _frozen(df_ruang['Ruang'], dtype=object)
+        self.ruang_capacity = _frozen(df_ruang['Kapasitas'], dtype=np.int64)
+        self.ruang_is_lab = _frozen(df_ruang['Lab'] == 'y')
+        self.ruang_pengawas = _frozen(df_ruang['Jumlah Pengawas'], dtype=np.intp)
+        self.n_ruang = len(df_ruang)
+
+        # Mata kuliah: satu baris per mata kuliah, urut seperti groupby('Mata Kuliah')
+        first = df_makul.groupby('Mata Kuliah', sort=True)[['Semester', 'Dosen Pengampu']].first()
+        self.makul = _frozen(first.index, dtype=object)
+        self.makul_semester = _frozen(first['Semester'])
+        self.makul_lab = _frozen(np.isin(self.makul, df_butuh_lab['Butuh Lab'].to_numpy()))
+        self.makul_pengampu = _frozen(first['Dosen Pengampu'], dtype=object)
+        self.n_makul = len(first)
+        _, semester = pd.factorize(df_makul['Semester'])
+        self.semester = _frozen(semester)
+        self.makul_sem = _frozen(pd.Index(semester).get_indexer(self.makul_semester), dtype=np.intp)
+
+        # Dosen (urut nama) dan dosen pengampu setiap mata kuliah
+        pengampu = [p.split(', ') for p in self.makul_pengampu]
+        self.dosen = _frozen(sorted({d for names in pengampu for d in names}), dtype=object)
+        self.n_dosen = len(self.dosen)
+        dosen_id = {dosen: i for i, dosen in enumerate(self.dosen)}
+        self.makul_dosen_ptr = _frozen(np.concatenate(([0], np.cumsum([len(names) for names in pengampu]))),
+                                       dtype=np.intp)
+        self.makul_dosen = _frozen([dosen_id[d] for names in pengampu for d in names], dtype=np.intp)
+
+        # Grid slot jadwal (pengganti cross join dengan kolom dummy)
+        self.grid_sesi = _frozen(np.repeat(np.arange(self.n_sesi), self.n_ruang), dtype=np.intp)
+        self.grid_ruang = _frozen(np.tile(np.arange(self.n_ruang), self.n_sesi), dtype=np.intp)
+
+    def __setattr__(self, name, value):
+        # Setiap atribut hanya boleh diisi sekali
+        if hasattr(self, name):
+            raise AttributeError(f"ProblemInstance tidak bisa diubah ({name})")
+        object.__setattr__(self, name, value)
+
+    # Sheet input sebagai salinan: perubahan in-place oleh satu tahap tidak
+    # pernah sampai ke instance (dan ke tahap lain)
+    @property
+    def df_sesi(self):
+        return self._df_sesi.copy()
+
+    @property
+    def df_ruang(self):
+        return self._df_ruang.copy()
+
+    @property
+    def df_makul(self):
+        return self._df_makul.copy()
+
+    @property
+    def df_tidak_ujian(self):
+        return self._df_tidak_ujian.copy()
+
+    @property
+    def df_butuh_lab(self):
+        return self._df_butuh_lab.copy()
+
+    def pengampu_ids(self, m):
+        return self.makul_dosen[self.makul_dosen_ptr[m]:self.makul_dosen_ptr[m + 1]]
+
+    def slot_jadwal(self):
+        # Setiap sesi dipasangkan dengan setiap ruang (urut sesi lalu ruang)
+        sesi = self._df_sesi.iloc[self.grid_sesi].reset_index(drop=True)
+        ruang = self._df_ruang.iloc[self.grid_ruang].reset_index(drop=True)
+        return pd.concat([sesi, ruang], axis=1)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Instrumentasi penjadwalan: timer per tahap, rekaman per generasi (fitness
+# terbaik/rata-rata, jumlah pelanggaran, perbaikan crossover) dan profil
+# cProfile opsional; hit/miss cache dihitung oleh cache.ResultCache.
+# Listener dipanggil langsung setiap ada kejadian sehingga UI bisa
+# menampilkan progres saat GA berjalan; seluruh rekaman bisa diekspor
+# sebagai JSON atau CSV.
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Fungsi yang paling sering dipanggil (ditampilkan terpisah di laporan profil)
+HOT_FUNCTIONS = r'fitness_function|FitnessState|assign_pengawas|generate_schedule|_best_cover|alokasi_kelas'
+
+
+class GenerationLog(list):
+    # Pengganti list `history` di evolve(): setiap append juga diteruskan
+    # ke Instrument dengan nama tahapnya
+    def __init__(self, instrument, stage):
+        super().__init__()
+        self.instrument = instrument
+        self.stage = stage
+
+    def append(self, record):
+        super().append(record)
+        self.instrument.generations.append({'stage': self.stage, **record})
+        self.instrument.emit('generation', self.stage, record)
+
+
+class Instrument:
+    def __init__(self, listener=None, profile=False):
+        # listener(event, stage, record) dengan event 'stage_start',
+        # 'stage_end' atau 'generation'
+        self.listener = listener
+        self.timings = {}
+        self.generations = []
+        self.profiler = cProfile.Profile() if profile else None
+
+    def emit(self, event, stage, record=None):
+        if self.listener is not None:
+            self.listener(event, stage, record)
+
+    @contextmanager
+    def stage(self, name):
+        self.emit('stage_start', name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            self.emit('stage_end', name, {'seconds': self.timings[name]})
+
+    @contextmanager
+    def profiling(self):
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+
+    def history(self, stage):
+        return GenerationLog(self, stage)
+
+    def to_dict(self):
+        repairs = {}
+        for record in self.generations:
+            repairs[record['stage']] = repairs.get(record['stage'], 0) + record.get('repairs', 0)
+        return {
+            'timings': dict(self.timings),
+            'repairs': repairs,
+            'generations': list(self.generations),
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def generations_frame(self):
+        return pd.DataFrame(self.generations)
+
+    def to_csv(self):
+        return self.generations_frame().to_csv(index=False)
+
+    def profile_report(self, limit=25):
+        if self.profiler is None:
+            return ''
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative')
+        stats.print_stats(HOT_FUNCTIONS)
+        stats.print_stats(limit)
+        return stream.getvalue()
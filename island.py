@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Island model: K populasi independen (satu per core, masing-masing dengan
+# seed sendiri) berevolusi paralel di process pool. Setiap `migration_interval`
+# generasi, individu terbaik tiap pulau dipindah ke pulau berikutnya (ring),
+# lalu hasil terbaik dari semua pulau dikembalikan.
+#
+# Mesin pulau adalah objek dengan method init(seed), evolve(island, generations,
+# scale), emigrants(island, n) dan immigrate(island, migrants), misalnya
+# sesi.SesiIsland dan pengawas.PengawasIsland. evolve menjalankan laju
+# mutasi/crossover yang disesuaikan dengan `scale` (stopping.Convergence) dan
+# menyimpan keragaman populasi akhir epoch di island['diversity'].
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Mesin pulau di proses worker, diset sekali oleh initializer pool
+_ENGINE = None
+
+
+def _init_worker(engine):
+    global _ENGINE
+    _ENGINE = engine
+
+
+def _init_task(seed):
+    return _ENGINE.init(seed)
+
+
+def _evolve_task(island, generations, scale):
+    return _ENGINE.evolve(island, generations, scale)
+
+
+def island_seeds(n_islands, seed=None):
+    # Seed int yang berbeda untuk setiap pulau, diturunkan dari satu seed
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n_islands)]
+
+
+def run_islands(engine, n_islands=None, generations=100, migration_interval=10, n_migrants=2,
+                seed=None, max_workers=None, history=None, convergence=None):
+    n_islands = n_islands or os.cpu_count() or 1
+    max_workers = min(max_workers or os.cpu_count() or 1, n_islands)
+    seeds = island_seeds(n_islands, seed)
+
+    if max_workers > 1:
+        pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(engine,))
+        run_map = pool.map
+    else:
+        pool = None
+        _init_worker(engine)
+        run_map = map
+
+    try:
+        islands = list(run_map(_init_task, seeds))
+        done = 0
+        while done < generations:
+            step = min(migration_interval, generations - done)
+            # Skala laju adaptif dari epoch sebelumnya berlaku untuk semua pulau
+            scale = 1.0 if convergence is None else convergence.scale
+            islands = list(run_map(_evolve_task, islands, [step] * n_islands, [scale] * n_islands))
+            done += step
+            if history is not None:
+                # Satu rekaman per epoch: fitness terbaik dan rata-rata terbaik antar pulau
+                best_fitness = [island['best_fitness'] for island in islands]
+                history.append({'generation': done - 1, 'best_fitness': float(max(best_fitness)),
+                                'mean_fitness': float(np.mean(best_fitness))})
+            # Kriteria berhenti dicek per epoch pada fitness terbaik antar pulau;
+            # keragaman = pulau yang paling beragam (berhenti jika semua pulau
+            # sudah seragam)
+            if convergence is not None and convergence.update(
+                    max(island['best_fitness'] for island in islands),
+                    lambda: max(island['diversity'] for island in islands), step=step):
+                break
+
+            # Migrasi ring: terbaik pulau i menggantikan terburuk pulau i+1
+            if done < generations and n_islands > 1 and n_migrants > 0:
+                migrants = [engine.emigrants(island, n_migrants) for island in islands]
+                for i, group in enumerate(migrants):
+                    engine.immigrate(islands[(i + 1) % n_islands], group)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    best = max(islands, key=lambda island: island['best_fitness'])
+    return best['best_individual'], best['best_fitness'], islands
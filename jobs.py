@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Penjadwalan sebagai job latar belakang: pipeline dijalankan di process
+# pool lokal (tanpa broker), sehingga GA tidak berbagi GIL dengan thread
+# skrip Streamlit maupun dengan job lain. Id job = kunci cache (hash isi
+# file + parameter, plus jadwal sebelumnya untuk warm start), jadi unggahan
+# yang sama dari sesi mana pun memakai job dan hasil yang sama; hasil
+# selesai juga disimpan di pipeline.CACHE.
+#
+# Progres dan pembatalan melewati multiprocessing.Manager: worker mengirim
+# setiap kejadian Instrument ke satu antrian bersama yang dibaca thread
+# pengumpul di proses server, dan memeriksa Event pembatalan per job.
+# Pembatalan bersifat kooperatif: job yang masih antri langsung dibatalkan,
+# job yang sedang berjalan berhenti pada generasi GA atau tahap berikutnya.
+# Pool dan Manager baru dibuat saat job pertama dikirim (start method
+# 'spawn': fork dari server Streamlit yang ber-thread tidak aman).
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from instrument import Instrument
+from pipeline import CACHE, DEFAULT_PARAMS, cache_key, run_pipeline
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED = (DONE, FAILED, CANCELLED)
+
+STAGE_LABELS = {
+    'input': "Membaca input",
+    'sesi': "Menjadwalkan sesi",
+    'ruang': "Menempatkan ruangan",
+    'pengawas': "Menugaskan pengawas",
+    'alokasi': "Mengalokasikan kelas",
+    'export': "Menyusun Excel",
+}
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def _run_job(job_id, data, params, profile, previous, events, cancel):
+    # Dijalankan di proses worker. Setiap kejadian diteruskan ke antrian
+    # bersama; Event pembatalan diperiksa di setiap tahap dan generasi.
+    def listener(event, stage, record):
+        if cancel.is_set():
+            raise JobCancelled()
+        events.put((job_id, event, stage, record))
+
+    instrument = Instrument(listener=listener, profile=profile)
+    result = run_pipeline(data, params, instrument, previous)
+    if profile:
+        # cProfile.Profile tidak bisa dikirim antar proses, jadi laporannya saja
+        result['profile'] = instrument.profile_report()
+    return result
+
+
+class Job:
+    def __init__(self, job_id, data, params, profile=False, previous=None, cancel=None):
+        self.id = job_id
+        self.params = params
+        self.profile = profile
+        self.status = PENDING
+        self.stage = None
+        self.message = "Menunggu giliran"
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        # Rekaman per generasi yang sudah diterima dari worker
+        self.generations = []
+        self._data = data
+        self._previous = previous
+        self._cancel = cancel if cancel is not None else threading.Event()
+
+    def _on_event(self, event, stage, record):
+        # Dipanggil thread pengumpul untuk setiap kejadian dari worker. Kejadian
+        # bisa tiba setelah _done, jadi rekaman tetap disimpan tetapi status
+        # job yang sudah selesai tidak diubah lagi.
+        if event == 'generation':
+            self.generations.append({'stage': stage, **record})
+        if self.status in FINISHED:
+            return
+        if self.status == PENDING:
+            self.status = RUNNING
+            self.started = time.time()
+        total = self.params['generations'] + self.params['pengawas_generations']
+        offset = {'sesi': 0, 'pengawas': self.params['generations']}
+        if event == 'stage_start':
+            self.stage = stage
+            self.message = STAGE_LABELS.get(stage, stage)
+            if stage in ('alokasi', 'export'):
+                self.progress = 1.0
+        elif event == 'generation' and stage in offset:
+            done = offset[stage] + record['generation'] + 1
+            self.progress = min(done / total, 1.0) if total else 1.0
+            self.message = f"{STAGE_LABELS[stage]} (generasi {record['generation'] + 1})"
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            # Job yang masih antri langsung selesai lewat JobManager._done
+            self.future.cancel()
+
+    def _finish(self, status, message):
+        self.status = status
+        self.message = message
+        self.finished = time.time()
+        self._data = None
+        self._previous = None
+
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+class JobManager:
+    # max_workers = jumlah job (proses) yang berjalan bersamaan
+    def __init__(self, max_workers=2, max_jobs=64, cache=CACHE):
+        self.cache = cache
+        self.max_jobs = max_jobs
+        self.max_workers = max_workers
+        self._pool = None
+        self._manager = None
+        self._events = None
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _start(self):
+        # Dipanggil dengan self._lock terpegang
+        if self._pool is not None:
+            return
+        context = multiprocessing.get_context('spawn')
+        self._manager = context.Manager()
+        self._events = self._manager.Queue()
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        threading.Thread(target=self._collect, args=(self._events,), name='ujiandsb-job-events', daemon=True).start()
+
+    def _collect(self, events):
+        # Meneruskan kejadian dari worker ke Job-nya; None = berhenti
+        while True:
+            try:
+                item = events.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            job_id, event, stage, record = item
+            job = self.get(job_id)
+            if job is not None:
+                job._on_event(event, stage, record)
+
+    @staticmethod
+    def job_id(data, params=None, profile=False, previous=None):
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        return cache_key(data, params, previous) + ('-profil' if profile else '')
+
+    def submit(self, data, params=None, profile=False, previous=None):
+        # Job yang sama (isi file + parameter) tidak dijalankan dua kali
+        # kecuali sebelumnya gagal atau dibatalkan; profil selalu dihitung ulang
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        key = cache_key(data, params, previous)
+        job_id = self.job_id(data, params, profile, previous)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status not in (FAILED, CANCELLED):
+                self._jobs.move_to_end(job_id)
+                return job
+
+            cached = None if profile else self.cache.get(key)
+            if cached is not None:
+                job = Job(job_id, data, params, profile, previous)
+                job.result = cached
+                job.progress = 1.0
+                job.started = time.time()
+                job._finish(DONE, "Selesai (dari cache)")
+            else:
+                self._start()
+                job = Job(job_id, data, params, profile, previous, cancel=self._manager.Event())
+                job.future = self._pool.submit(_run_job, job_id, data, params, profile, previous, self._events,
+                                               job._cancel)
+                job.future.add_done_callback(lambda future: self._done(job, key, future))
+            self._jobs[job_id] = job
+            self._evict()
+        return job
+
+    def _done(self, job, key, future):
+        # Dipanggil di proses server saat worker selesai
+        if future.cancelled():
+            job._finish(CANCELLED, "Dibatalkan")
+            return
+        error = future.exception()
+        if isinstance(error, JobCancelled):
+            job._finish(CANCELLED, "Dibatalkan")
+        elif error is not None:
+            job.error = error
+            job._finish(FAILED, f"Gagal: {error}")
+        else:
+            if not job.profile:
+                self.cache.put(key, future.result())
+            job.result = future.result()
+            job.progress = 1.0
+            job._finish(DONE, "Selesai")
+
+    def _evict(self):
+        # Buang job selesai yang paling lama jika melebihi batas
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED]
+        for job_id in finished[:max(len(self._jobs) - self.max_jobs, 0)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, wait=True):
+        # Menghentikan pool, thread pengumpul dan Manager
+        with self._lock:
+            pool, manager, events = self._pool, self._manager, self._events
+            self._pool = self._manager = self._events = None
+        if pool is None:
+            return
+        pool.shutdown(wait=wait, cancel_futures=True)
+        events.put(None)
+        manager.shutdown()
+
+
+# Satu pool per proses server, dibagi oleh semua sesi Streamlit
+JOBS = JobManager(max_workers=int(os.environ.get('UJIANDSB_JOB_WORKERS', 2)))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Min-cost flow eksak (primal-dual): jarak terpendek dengan Dijkstra pada
+# biaya tereduksi (potensial node), lalu aliran blok ala Dinic pada sisi
+# yang biaya tereduksinya nol. Semua jalur terpendek dengan panjang yang
+# sama dialirkan dalam satu fase, sehingga jumlah Dijkstra sebanding dengan
+# jumlah nilai jarak yang berbeda, bukan dengan jumlah unit aliran.
+# Biaya sisi awal harus >= 0 dan bilangan bulat.
+
+import heapq
+from collections import deque
+
+INF = float('inf')
+
+
+class MinCostFlow:
+    # Graf residual dalam list paralel; sisi e dan e ^ 1 saling berpasangan
+    def __init__(self, n_nodes):
+        self.n_nodes = n_nodes
+        self.adj = [[] for _ in range(n_nodes)]
+        self.to = []
+        self.cap = []
+        self.cost = []
+
+    def add_node(self):
+        self.adj.append([])
+        self.n_nodes += 1
+        return self.n_nodes - 1
+
+    def add_edge(self, u, v, cap, cost=0):
+        # Mengembalikan id sisi; aliran pada sisi = flow(id)
+        e = len(self.to)
+        self.to += [v, u]
+        self.cap += [cap, 0]
+        self.cost += [cost, -cost]
+        self.adj[u].append(e)
+        self.adj[v].append(e + 1)
+        return e
+
+    def flow(self, e):
+        return self.cap[e ^ 1]
+
+    def _dijkstra(self, source, potential):
+        to, cap, cost, adj = self.to, self.cap, self.cost, self.adj
+        dist = [INF] * self.n_nodes
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            pu = potential[u]
+            for e in adj[u]:
+                if cap[e] > 0:
+                    v = to[e]
+                    nd = d + cost[e] + pu - potential[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+        return dist
+
+    def _admissible(self, u, e, potential):
+        return self.cap[e] > 0 and self.cost[e] + potential[u] - potential[self.to[e]] == 0
+
+    def _levels(self, source, sink, potential):
+        # BFS pada sisi admissible (biaya tereduksi nol)
+        level = [-1] * self.n_nodes
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for e in self.adj[u]:
+                v = self.to[e]
+                if level[v] < 0 and self._admissible(u, e, potential):
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        return level if level[sink] >= 0 else None
+
+    def _augment(self, source, sink, level, potential, limit):
+        # Satu jalur s-t sepanjang level dengan iterator sisi per node
+        # (current arc); mengembalikan jumlah unit yang dialirkan
+        to, cap, adj = self.to, self.cap, self.adj
+        pointer = [0] * self.n_nodes
+        pushed = 0
+        while pushed < limit:
+            path, u = [], source
+            while u != sink:
+                edges = adj[u]
+                while pointer[u] < len(edges):
+                    e = edges[pointer[u]]
+                    v = to[e]
+                    if level[v] == level[u] + 1 and self._admissible(u, e, potential):
+                        break
+                    pointer[u] += 1
+                else:
+                    # Jalan buntu: mundur satu langkah dan tutup sisi itu
+                    if not path:
+                        return pushed
+                    level[u] = -1
+                    e = path.pop()
+                    u = to[e ^ 1]
+                    pointer[u] += 1
+                    continue
+                path.append(e)
+                u = v
+            amount = min(limit - pushed, min(cap[e] for e in path))
+            for e in path:
+                cap[e] -= amount
+                cap[e ^ 1] += amount
+            pushed += amount
+        return pushed
+
+    def solve(self, source, sink, max_flow=INF):
+        # Mengembalikan (total aliran, total biaya)
+        potential = [0] * self.n_nodes
+        total_flow = total_cost = 0
+        while total_flow < max_flow:
+            dist = self._dijkstra(source, potential)
+            if dist[sink] == INF:
+                break
+            # Node yang lebih jauh dari sink dipotong di dist[sink] agar biaya
+            # tereduksi tetap >= 0 pada fase berikutnya
+            bound = dist[sink]
+            for v in range(self.n_nodes):
+                potential[v] += min(dist[v], bound)
+            while total_flow < max_flow:
+                level = self._levels(source, sink, potential)
+                if level is None:
+                    break
+                pushed = self._augment(source, sink, level, potential, max_flow - total_flow)
+                total_flow += pushed
+                total_cost += pushed * (potential[sink] - potential[source])
+        return total_flow, total_cost
@@ -0,0 +1,458 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Algoritma genetika penugasan pengawas ujian (tahap 3).
+# Satu individu adalah matriks int (n_baris_jadwal, max_pengawas) berisi id
+# dosen pada dosen_all (-1 = kosong), sehingga seluruh populasi adalah satu
+# array (P, n_baris, max_pengawas). Crossover dan mutasi berupa operasi slice;
+# kolom 'Pengawas' (string) hanya dibentuk sekali di akhir.
+# Alternatif deterministik: solve_flow (min-cost flow eksak).
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from mincostflow import MinCostFlow
+
+
+class PengawasProblem:
+    # Data jadwal ruang yang dihitung sekali per unggahan
+    __slots__ = ('dosen_all', 'n_dosen', 'n_rows', 'max_pengawas', 'required_by_room', 'required',
+                 'mask_by_course', 'pengampu_mask', 'all_mask', 'slot_of_row', 'n_slot', 'rows_of_slot',
+                 'fixed', 'free_rows')
+
+    def __init__(self, instance, df_jadwal, fixed=None):
+        # dosen_all = instance.dosen (semua dosen pengampu, urut nama)
+        self.dosen_all = instance.dosen
+        self.n_dosen = instance.n_dosen
+        self.n_rows = len(df_jadwal)
+
+        # Ruang -> jumlah pengawas yang dibutuhkan, lalu per baris jadwal
+        self.required_by_room = dict(zip(instance.ruang, instance.ruang_pengawas.tolist()))
+        self.required = np.array([self.required_by_room[ruang] for ruang in df_jadwal['Ruang']], dtype=np.intp)
+        self.max_pengawas = int(self.required.max()) if self.n_rows else 0
+
+        # Mata kuliah -> himpunan id dosen pengampu sebagai bitset (int Python,
+        # bit ke-i = dosen_all[i]), lalu per baris jadwal
+        self.mask_by_course = {mata_kuliah: _to_mask(instance.pengampu_ids(m))
+                               for m, mata_kuliah in enumerate(instance.makul)}
+        self.pengampu_mask = [self.mask_by_course[mata_kuliah] for mata_kuliah in df_jadwal['Mata Kuliah']]
+        self.all_mask = (1 << self.n_dosen) - 1
+
+        # Slot (Hari, Waktu) setiap baris dan baris-baris dalam setiap slot
+        slot_codes, _ = pd.MultiIndex.from_arrays([df_jadwal['Hari'], df_jadwal['Waktu']]).factorize()
+        self.slot_of_row = slot_codes.astype(np.intp)
+        self.n_slot = int(slot_codes.max()) + 1 if self.n_rows else 0
+        self.rows_of_slot = [np.flatnonzero(self.slot_of_row == slot) for slot in range(self.n_slot)]
+
+        # Warm start: matriks id pengawas tetap (baris dengan -1 di kolom
+        # pertama bebas dioptimasi); baris tetap tidak pernah dimutasi
+        self.fixed = fixed
+        self.free_rows = np.arange(self.n_rows) if fixed is None else np.flatnonzero(fixed[:, 0] < 0)
+
+    def subproblem(self, rows):
+        # Sub-masalah untuk baris `rows` (mis. satu hari) dari array yang
+        # sudah dienkode, tanpa membaca ulang DataFrame jadwal
+        sub = PengawasProblem.__new__(PengawasProblem)
+        sub.dosen_all = self.dosen_all
+        sub.n_dosen = self.n_dosen
+        sub.n_rows = len(rows)
+        sub.required_by_room = self.required_by_room
+        sub.required = self.required[rows]
+        sub.max_pengawas = int(sub.required.max()) if sub.n_rows else 0
+        sub.mask_by_course = self.mask_by_course
+        sub.pengampu_mask = [self.pengampu_mask[r] for r in rows]
+        sub.all_mask = self.all_mask
+        _, slot_codes = np.unique(self.slot_of_row[rows], return_inverse=True)
+        sub.slot_of_row = slot_codes.astype(np.intp)
+        sub.n_slot = int(slot_codes.max()) + 1 if sub.n_rows else 0
+        sub.rows_of_slot = [np.flatnonzero(sub.slot_of_row == slot) for slot in range(sub.n_slot)]
+        sub.fixed = None if self.fixed is None else self.fixed[rows, :sub.max_pengawas]
+        sub.free_rows = (np.arange(sub.n_rows) if sub.fixed is None
+                         else np.flatnonzero(sub.fixed[:, 0] < 0))
+        return sub
+
+    def decode(self, individual):
+        # Matriks id -> kolom Pengawas ("A, B")
+        return [', '.join(self.dosen_all[ids[ids >= 0]]) for ids in individual]
+
+    def encode(self, pengawas_column):
+        dosen_id = {dosen: i for i, dosen in enumerate(self.dosen_all)}
+        individual = np.full((self.n_rows, self.max_pengawas), -1, dtype=np.intp)
+        for r, pengawas in enumerate(pengawas_column):
+            ids = [dosen_id[p] for p in pengawas.split(', ')]
+            individual[r, :len(ids)] = ids
+        return individual
+
+
+class SupervisorLoad:
+    # Jumlah mengawas setiap dosen per individu beserta jumlah dan jumlah
+    # kuadratnya, sehingga std (dan fitness) dapat diperbarui dalam O(1) per
+    # pengawas yang berubah, tanpa menghitung ulang seluruh jadwal.
+    __slots__ = ('dosen_supervise_count', 'total', 'total_sq', 'n_dosen')
+
+    def __init__(self, problem, population):
+        self.n_dosen = problem.n_dosen
+        self.dosen_supervise_count = _supervise_counts(population, problem.n_dosen)
+        self.total = self.dosen_supervise_count.sum(axis=1)
+        self.total_sq = (self.dosen_supervise_count ** 2).sum(axis=1)
+
+    def replace(self, row, old, new):
+        # Ganti pengawas satu baris jadwal pada individu `row`
+        counts = self.dosen_supervise_count[row]
+        for p in old[old >= 0]:
+            self.total_sq[row] -= 2 * counts[p] - 1
+            counts[p] -= 1
+        for p in new[new >= 0]:
+            self.total_sq[row] += 2 * counts[p] + 1
+            counts[p] += 1
+        self.total[row] += (new >= 0).sum() - (old >= 0).sum()
+
+    def std(self):
+        mean = self.total / self.n_dosen
+        return np.sqrt(np.maximum(self.total_sq / self.n_dosen - mean * mean, 0.0))
+
+    def fitness(self):
+        # Fitness sebagai 1 / (1 + std)
+        return 1 / (1 + self.std())
+
+
+def _supervise_counts(population, n_dosen):
+    # (P, n_baris, k) id dosen -> (P, n_dosen) jumlah mengawas
+    flat = population.reshape(len(population), -1)
+    offsets = (np.arange(len(population)) * n_dosen)[:, None]
+    ids = np.where(flat >= 0, flat + offsets, -1).ravel()
+    counts = np.bincount(ids[ids >= 0], minlength=len(population) * n_dosen)
+    return counts.reshape(len(population), n_dosen).astype(np.int64)
+
+
+def _to_mask(ids):
+    mask = 0
+    for i in ids:
+        mask |= 1 << int(i)
+    return mask
+
+
+def _mask_ids(mask):
+    # Id dosen dari bitset, urut naik
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+def assign_pengawas(problem, r, busy, rng):
+    # `busy`: bitset dosen yang sudah mengawas pada slot (Hari, Waktu) baris r.
+    # Mengembalikan id pengawas terpilih dan bitset busy yang diperbarui.
+    jumlah_pengawas = problem.required[r]
+    free = problem.all_mask & ~busy
+
+    # Mencari pengawas yang merupakan pengampu dan belum ditugaskan pada hari dan waktu tersebut
+    possible_supervisors = problem.pengampu_mask[r] & free
+
+    # Jika pengampu yang memenuhi syarat kurang, pilih juga dari dosen lain yang belum ditugaskan
+    if possible_supervisors.bit_count() < jumlah_pengawas:
+        possible_supervisors = free
+
+    # Mengacak dan memilih pengawas sesuai dengan jumlah yang diperlukan
+    selected_supervisors = rng.choice(_mask_ids(possible_supervisors), jumlah_pengawas, replace=False)
+
+    # Update pengawas yang telah ditugaskan untuk hari dan waktu tersebut
+    return selected_supervisors, busy | _to_mask(selected_supervisors)
+
+
+# Fungsi untuk membuat jadwal pengawas secara acak
+def generate_schedule(problem, rng):
+    individual = np.full((problem.n_rows, problem.max_pengawas), -1, dtype=np.intp)
+    # Bitset pengawas yang sudah ditugaskan pada setiap slot (Hari, Waktu)
+    busy = [0] * problem.n_slot
+    if problem.fixed is not None:
+        for r in np.flatnonzero(problem.fixed[:, 0] >= 0):
+            ids = problem.fixed[r]
+            individual[r] = ids
+            busy[problem.slot_of_row[r]] |= _to_mask(ids[ids >= 0])
+    for r in problem.free_rows:
+        slot = problem.slot_of_row[r]
+        selected, busy[slot] = assign_pengawas(problem, r, busy[slot], rng)
+        individual[r, :len(selected)] = selected
+    return individual
+
+
+def crossover(parents1, parents2, rng):
+    # One-point crossover pada baris jadwal untuk semua pasangan sekaligus
+    cut = rng.integers(0, parents1.shape[1] + 1, size=len(parents1))
+    tail = (np.arange(parents1.shape[1]) >= cut[:, None])[:, :, None]
+    return np.where(tail, parents2, parents1), np.where(tail, parents1, parents2)
+
+
+def mutate(problem, population, load, rng, n_rows=1):
+    # Setiap individu: n_rows baris jadwal diberi pengawas baru secara acak,
+    # dari dosen yang tidak sedang mengawas ruang lain pada slot yang sama
+    if problem.free_rows.size == 0:
+        return
+    mutate_idx = problem.free_rows[rng.integers(0, problem.free_rows.size, size=(n_rows, len(population)))]
+    for i, r in itertools.chain.from_iterable(enumerate(idx) for idx in mutate_idx):
+        old = population[i, r].copy()
+        others = population[i, problem.rows_of_slot[problem.slot_of_row[r]]]
+        busy = _to_mask(others[others >= 0]) & ~_to_mask(old[old >= 0])
+        new = np.full(problem.max_pengawas, -1, dtype=np.intp)
+        selected, _ = assign_pengawas(problem, r, busy, rng)
+        new[:len(selected)] = selected
+        population[i, r] = new
+        load.replace(i, old, new)
+
+
+def clashes(problem, individual):
+    # Jumlah penugasan ganda: dosen yang mengawas lebih dari satu ruang pada slot yang sama
+    rows, cols = np.nonzero(individual >= 0)
+    keys = problem.slot_of_row[rows] * problem.n_dosen + individual[rows, cols]
+    return int(len(keys) - len(np.unique(keys)))
+
+
+def repair_clashes(problem, individual):
+    # Crossover per baris bisa menggabungkan baris satu slot dari dua induk
+    # sehingga satu dosen mengawas dua ruang sekaligus. Setiap penugasan ganda
+    # (selain yang pertama, dan tidak pada baris tetap) diganti in-place dengan
+    # dosen yang bebas pada slot itu: pengampu baris dulu, lalu beban terendah.
+    # Deterministik; mengembalikan jumlah penggantian.
+    load = _supervise_counts(individual[None], problem.n_dosen)[0]
+    free_row = np.zeros(problem.n_rows, dtype=bool)
+    free_row[problem.free_rows] = True
+    moves = 0
+    for rows in problem.rows_of_slot:
+        # Baris tetap diproses dulu agar pengawasnya tidak pernah dipindah
+        rows = sorted(rows, key=lambda r: free_row[r])
+        busy = 0
+        for r in rows:
+            for c in np.flatnonzero(individual[r] >= 0):
+                d = int(individual[r, c])
+                if not busy >> d & 1:
+                    busy |= 1 << d
+                    continue
+                candidates = _mask_ids(problem.all_mask & ~busy)
+                if not candidates:
+                    raise ValueError("Jumlah dosen tidak cukup untuk semua pengawas dalam satu slot")
+                b = min(candidates, key=lambda b: (not problem.pengampu_mask[r] >> b & 1, load[b], b))
+                individual[r, c] = b
+                busy |= 1 << b
+                load[d] -= 1
+                load[b] += 1
+                moves += 1
+    return moves
+
+
+def diversity(population, idx):
+    # Proporsi baris jadwal yang pengawasnya berbeda dari individu idx
+    return float((population != population[idx]).any(axis=2).mean())
+
+
+# Fitness maksimum: std jumlah mengawas = 0
+MAX_FITNESS = 1.0
+
+
+# Fungsi untuk melakukan seleksi, crossover, dan mutasi sebanyak `generations`
+# generasi dari populasi yang ada (dipakai juga per epoch oleh island model).
+# convergence (stopping.Convergence) dapat menghentikan loop lebih awal dan
+# menambah jumlah baris yang dimutasi saat stagnasi; n_mutations = jumlah
+# baris yang dimutasi per individu di awal.
+def evolve(problem, population, load, generations, population_size, rng,
+           best_individual=None, best_fitness=0, history=None, convergence=None, n_mutations=1):
+    for generation in range(generations):
+        # Fitness dibaca dari agregat yang dijaga inkremental
+        fitness_scores = load.fitness()
+
+        # Simpan individu dengan fitness terbaik
+        max_fitness_idx = int(np.argmax(fitness_scores))
+        if fitness_scores[max_fitness_idx] > best_fitness:
+            best_fitness = float(fitness_scores[max_fitness_idx])
+            best_individual = population[max_fitness_idx].copy()
+        if history is not None:
+            history.append({
+                'generation': len(history),
+                'best_fitness': float(fitness_scores[max_fitness_idx]),
+                'mean_fitness': float(fitness_scores.mean()),
+                'violations': clashes(problem, population[max_fitness_idx]),
+                'repairs': 0,
+            })
+        if convergence is not None:
+            if convergence.update(best_fitness, lambda: diversity(population, max_fitness_idx)):
+                break
+            n_mutations = max(1, int(round(convergence.scale)))
+
+        # Seleksi individu berdasarkan fitness
+        selected = rng.choice(len(population), size=population_size // 2, p=fitness_scores / fitness_scores.sum())
+
+        # Crossover (pertukaran pengawas antar dua jadwal)
+        n_pairs = len(selected) // 2
+        child1, child2 = crossover(population[selected[0:2 * n_pairs:2]], population[selected[1:2 * n_pairs:2]], rng)
+        new_population = np.empty((len(selected),) + population.shape[1:], dtype=np.intp)
+        new_population[0:2 * n_pairs:2] = child1
+        new_population[1:2 * n_pairs:2] = child2
+        if len(selected) % 2:
+            new_population[-1] = population[selected[-1]]
+        load = SupervisorLoad(problem, new_population)
+
+        # Mutasi (mengubah pengawas secara acak)
+        mutate(problem, new_population, load, rng, n_mutations)
+        population = new_population
+
+    return population, load, best_individual, best_fitness
+
+
+def solve_flow(problem):
+    # Penugasan pengawas optimal sebagai min-cost flow:
+    #   sumber -> dosen d: unit ke-k berbiaya W * (2k - 1) (konveks, jadi
+    #     total biaya = W * jumlah kuadrat beban; std minimum untuk total tetap)
+    #   dosen d -> (d, slot): kapasitas 1, dosen tidak bentrok dalam satu slot
+    #   (d, slot) -> baris r: biaya 0 jika d pengampu mata kuliah r
+    #   (d, slot) -> kumpulan slot -> baris r: biaya 1 untuk dosen lain
+    #   baris r -> sink: kapasitas = jumlah pengawas ruang
+    # W > jumlah seluruh unit, sehingga pemerataan beban selalu diutamakan dan
+    # jumlah pengampu hanya menjadi pemecah seri. Baris tetap (warm start)
+    # tidak diubah: bebannya menjadi beban awal dan slotnya ditandai sibuk.
+    n_dosen = problem.n_dosen
+    individual = np.full((problem.n_rows, problem.max_pengawas), -1, dtype=np.intp)
+    base = np.zeros(n_dosen, dtype=np.int64)
+    busy = [0] * problem.n_slot
+    if problem.fixed is not None:
+        for r in np.flatnonzero(problem.fixed[:, 0] >= 0):
+            ids = problem.fixed[r][problem.fixed[r] >= 0]
+            individual[r, :len(ids)] = ids
+            base[ids] += 1
+            busy[problem.slot_of_row[r]] |= _to_mask(ids)
+
+    rows = problem.free_rows
+    demand = int(problem.required[rows].sum())
+    if demand == 0:
+        return individual
+    weight = demand + 1
+    slots = sorted({int(problem.slot_of_row[r]) for r in rows})
+
+    source, sink = 0, 1
+    graph = MinCostFlow(2 + n_dosen)
+    row_node = {}
+    for r in rows:
+        row_node[r] = graph.add_node()
+        graph.add_edge(row_node[r], sink, int(problem.required[r]))
+
+    slot_rows, pool_edges, direct_edges = {}, [], []
+    for slot in slots:
+        slot_rows[slot] = [r for r in problem.rows_of_slot[slot] if r in row_node]
+        pool = graph.add_node()
+        for r in slot_rows[slot]:
+            graph.add_edge(pool, row_node[r], int(problem.required[r]))
+        for d in _mask_ids(problem.all_mask & ~busy[slot]):
+            node = graph.add_node()
+            graph.add_edge(2 + d, node, 1)
+            pool_edges.append((slot, d, graph.add_edge(node, pool, 1, 1)))
+            for r in slot_rows[slot]:
+                if problem.pengampu_mask[r] >> d & 1:
+                    direct_edges.append((r, d, graph.add_edge(node, row_node[r], 1)))
+
+    for d in range(n_dosen):
+        free_slots = sum(1 for slot in slots if not busy[slot] >> d & 1)
+        for k in range(int(base[d]) + 1, int(base[d]) + free_slots + 1):
+            graph.add_edge(source, 2 + d, 1, weight * (2 * k - 1))
+
+    flow, _ = graph.solve(source, sink, demand)
+    if flow < demand:
+        raise ValueError("Jumlah dosen tidak cukup untuk semua pengawas dalam satu slot")
+
+    # Susun kembali: pengampu dari sisi langsung, lalu dosen dari kumpulan
+    # slot mengisi sisa kebutuhan baris-baris slot itu (semuanya berbeda)
+    assigned = {r: [] for r in rows}
+    for r, d, e in direct_edges:
+        if graph.flow(e):
+            assigned[r].append(d)
+    pooled = {slot: [] for slot in slots}
+    for slot, d, e in pool_edges:
+        if graph.flow(e):
+            pooled[slot].append(d)
+    for slot in slots:
+        for r in slot_rows[slot]:
+            missing = int(problem.required[r]) - len(assigned[r])
+            assigned[r] += pooled[slot][:missing]
+            del pooled[slot][:missing]
+    for r, ids in assigned.items():
+        individual[r, :len(ids)] = sorted(ids)
+    return individual
+
+
+def to_schedule(problem, df_jadwal, individual):
+    # Konversi sekali ke DataFrame dengan kolom Pengawas
+    schedule = df_jadwal.copy()
+    schedule['Pengawas'] = problem.decode(individual)
+    return schedule
+
+
+def solve_ga(problem, generations=100, population_size=100, seed=None, history=None, convergence=None):
+    # GA pada problem yang sudah dienkode; mengembalikan (individu, fitness)
+    rng = np.random.default_rng(seed)
+    population = np.stack([generate_schedule(problem, rng) for _ in range(population_size)])
+    _, _, best_individual, best_fitness = evolve(problem, population, SupervisorLoad(problem, population),
+                                                 generations, population_size, rng, history=history,
+                                                 convergence=convergence)
+    # Individu terbaik dibebaskan dari penugasan ganda sebelum dipakai
+    if repair_clashes(problem, best_individual):
+        best_fitness = float(SupervisorLoad(problem, best_individual[None]).fitness()[0])
+    return best_individual, best_fitness
+
+
+def genetic_algorithm(instance, df_jadwal, generations=100, population_size=100, seed=None, history=None,
+                      convergence=None, fixed=None):
+    problem = PengawasProblem(instance, df_jadwal, fixed)
+    best_individual, best_fitness = solve_ga(problem, generations, population_size, seed, history, convergence)
+    return to_schedule(problem, df_jadwal, best_individual), best_fitness
+
+
+class PengawasIsland:
+    # Mesin GA pengawas untuk island.run_islands
+    def __init__(self, problem, population_size=100):
+        self.problem = problem
+        self.population_size = population_size
+
+    def init(self, seed):
+        rng = np.random.default_rng(seed)
+        return {
+            'population': np.stack([generate_schedule(self.problem, rng) for _ in range(self.population_size)]),
+            'rng': rng,
+            'best_individual': None,
+            'best_fitness': 0,
+        }
+
+    def evolve(self, island, generations, scale=1.0):
+        # Skala adaptif = jumlah baris yang dimutasi, seperti pada evolve()
+        population = island['population']
+        (island['population'], load,
+         island['best_individual'], island['best_fitness']) = evolve(
+            self.problem, population, SupervisorLoad(self.problem, population),
+            generations, self.population_size, island['rng'],
+            island['best_individual'], island['best_fitness'], n_mutations=max(1, int(round(scale))))
+        island['diversity'] = diversity(island['population'], int(np.argmax(load.fitness())))
+        return island
+
+    def emigrants(self, island, n):
+        fitness = SupervisorLoad(self.problem, island['population']).fitness()
+        return island['population'][np.argsort(-fitness, kind='stable')[:n]].copy()
+
+    def immigrate(self, island, migrants):
+        fitness = SupervisorLoad(self.problem, island['population']).fitness()
+        island['population'][np.argsort(fitness, kind='stable')[:len(migrants)]] = migrants
+
+
+# Fungsi untuk menghitung jumlah mengawas setiap pengawas pada setiap hari
+def count_supervisions_per_day(schedule, dosen_all):
+    # Satu entri per (pengawas, hari) tugas, dihitung dengan bincount atas
+    # kode dosen x hari; baris urut dosen_all, kolom urut kemunculan hari.
+    # Nama yang tidak ada di dosen_all diabaikan.
+    dosen = pd.Index(dosen_all)
+    days = pd.Index(schedule['Hari'].unique())
+    pengawas = [names.split(', ') for names in schedule['Pengawas']]
+    dosen_id = dosen.get_indexer([name for names in pengawas for name in names])
+    day_id = np.repeat(days.get_indexer(schedule['Hari']), [len(names) for names in pengawas])
+    known = dosen_id >= 0
+    counts = np.bincount(dosen_id[known] * len(days) + day_id[known], minlength=len(dosen) * len(days))
+    return pd.DataFrame(counts.reshape(len(dosen), len(days)), index=dosen, columns=days)
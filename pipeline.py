@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Tahapan penjadwalan ujian sebagai fungsi terpisah yang bisa di-cache:
+# persiapan input, sesi (GA), ruangan, pengawas (GA), alokasi kelas dan
+# penyusunan output Excel. Opsional warm start dari jadwal_ujian.xlsx
+# sebelumnya (lihat warmstart.py).
+
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+from cache import ResultCache, content_key
+from export import to_excel
+from ingest import read_workbook, read_jadwal
+from instance import ProblemInstance
+from instrument import Instrument
+from island import run_islands
+from sesi import SesiProblem, SesiIsland, genetic_algorithm as genetic_algorithm_sesi, max_fitness
+from anneal import simulated_annealing
+from ruang import generate_schedule, optimize_schedule, fitness
+from pengawas import (PengawasProblem, PengawasIsland, SupervisorLoad, genetic_algorithm as genetic_algorithm_pengawas,
+                      solve_flow, repair_clashes, to_schedule, count_supervisions_per_day, MAX_FITNESS)
+from stopping import from_params as convergence_from_params
+from alokasi import alokasi_mahasiswa
+from warmstart import WarmStart
+from decompose import pack_rooms, allocate_classes, assign_supervisors
+
+# Genetic Algorithm Parameters
+DEFAULT_PARAMS = {
+    'population_size': 50,
+    'generations': 100,
+    'mutation_rate': 0.1,
+    'crossover_rate': 0.7,
+    'pengawas_generations': 100,
+    'pengawas_population_size': 100,
+    'seed': 0,
+    # Mesin penempatan sesi (lihat SESI_SOLVERS): 'ga' atau 'anneal' (sekitar
+    # 3x waktu GA, fitness lebih baik; lihat anneal.py). Untuk 'anneal',
+    # generations = jumlah sweep dan population_size = jumlah rantai
+    'sesi_solver': 'ga',
+    'anneal_t_start': 10.0,
+    'anneal_t_end': 0.1,
+    # Island model: jumlah populasi paralel (1 = tanpa process pool,
+    # 0 = satu per core) dan interval migrasi dalam generasi
+    'islands': 1,
+    'migration_interval': 10,
+    # Penempatan ruangan: 'optimal' (pengepakan per slot) atau 'greedy'
+    'ruang_solver': 'optimal',
+    # Penugasan pengawas: 'ga' atau 'flow' (min-cost flow eksak, deterministik)
+    'pengawas_solver': 'ga',
+    # Penghentian GA: berhenti saat optimum teoretis tercapai (1/0), setelah
+    # `stagnation` generasi tanpa perbaikan (0 = mati), saat batas waktu
+    # total kedua GA dalam detik habis (0 = tanpa batas) atau saat keragaman
+    # populasi < min_diversity; adaptive_rates (1/0) menaikkan mutasi saat stagnasi
+    'stop_at_optimum': 1,
+    'stagnation': 0,
+    'time_budget': 0.0,
+    'min_diversity': 0.0,
+    'adaptive_rates': 0,
+    # Mode dekomposisi (1/0): ruangan dan alokasi kelas per slot, pengawas
+    # per hari + penyeimbangan global, paralel di process pool dengan
+    # decompose_workers proses (0 = satu per core, 1 = serial)
+    'decompose': 0,
+    'decompose_workers': 0,
+    # Sheet tambahan di workbook output: '' (tidak ada), 'hari' atau 'ruang'
+    'export_split': '',
+}
+
+# Cache hasil dibagi oleh semua sesi dalam satu proses; set UJIANDSB_CACHE_DIR
+# untuk menyimpan juga ke disk agar tidak hilang saat worker restart
+CACHE = ResultCache(max_entries=16, disk_dir=os.environ.get('UJIANDSB_CACHE_DIR'))
+# Folder cache hasil parsing workbook (Parquet per hash file), opsional
+INPUT_CACHE_DIR = os.environ.get('UJIANDSB_INPUT_CACHE_DIR')
+
+
+# Data input
+def read_input(file, cache_dir=INPUT_CACHE_DIR):
+    # Membaca berbagai sheet dari file Excel (bytes atau file-like) sekali
+    # buka; InputError jika sheet atau kolom wajib tidak sesuai
+    return read_workbook(file, cache_dir=cache_dir)
+
+
+def cache_key(data, params, previous=None):
+    # Kunci cache/job: isi file + parameter, plus hash jadwal sebelumnya
+    # untuk warm start
+    if previous:
+        params = {**params, 'previous': hashlib.sha256(previous).hexdigest()}
+    return content_key(data, **params)
+
+
+def sesi_ga(problem, params, history=None, convergence=None):
+    if params['islands'] != 1:
+        engine = SesiIsland(problem, params['population_size'], params['mutation_rate'], params['crossover_rate'])
+        best_individual, best_fitness, _ = run_islands(engine, params['islands'], params['generations'],
+                                                       params['migration_interval'], seed=params['seed'],
+                                                       history=history, convergence=convergence)
+    else:
+        best_individual, best_fitness, _ = genetic_algorithm_sesi(problem, params['population_size'], params['generations'],
+                                                                  params['mutation_rate'], params['crossover_rate'],
+                                                                  seed=params['seed'], history=history,
+                                                                  convergence=convergence)
+    return best_individual, best_fitness
+
+
+def sesi_anneal(problem, params, history=None, convergence=None):
+    best_individual, best_fitness, _ = simulated_annealing(problem, params['generations'], params['population_size'],
+                                                           params['anneal_t_start'], params['anneal_t_end'],
+                                                           seed=params['seed'], history=history,
+                                                           convergence=convergence)
+    return best_individual, best_fitness
+
+
+# Mesin penempatan sesi: fungsi (problem, params, history, convergence) ->
+# (individu terbaik, fitness). Anggaran iterasi diambil dari params
+# ('generations'), batas waktu dan target dari convergence.
+SESI_SOLVERS = {
+    'ga': sesi_ga,
+    'anneal': sesi_anneal,
+}
+
+
+def stage_sesi(instance, params, history=None, deadline=None, warm=None):
+    # Run the session placement engine
+    problem = SesiProblem(instance, None if warm is None else warm.sesi_fixed())
+    convergence = convergence_from_params(params, max_fitness(problem), deadline)
+    best_individual, best_fitness = SESI_SOLVERS[params['sesi_solver']](problem, params, history, convergence)
+    best_schedule = problem.decode(best_individual)
+
+    jadwal = pd.DataFrame(best_schedule)
+    jadwal.columns = ['Hari', 'Jam', 'Mata Kuliah', 'Semester']
+    jadwal.sort_values(by=['Hari', 'Jam', 'Mata Kuliah', 'Semester'], inplace=True)
+
+    jadwal_dan_makul = pd.merge(jadwal, instance.df_makul)
+    del jadwal_dan_makul['Dosen Pengampu']
+    del jadwal_dan_makul['Semester']
+    return jadwal_dan_makul, {'fitness': int(best_fitness), 'stop': convergence.report()}
+
+
+def stage_ruang(instance, jadwal_dan_makul, params, warm=None):
+    # Warm start: slot yang tidak berubah memakai penempatan lama, hanya
+    # slot lain yang dikemas ulang (kedua solver bekerja per slot)
+    fixed = {} if warm is None else warm.ruang_fixed(jadwal_dan_makul)
+    if fixed:
+        keys = pd.MultiIndex.from_arrays([jadwal_dan_makul['Hari'], jadwal_dan_makul['Jam']])
+        jadwal_dan_makul = jadwal_dan_makul[~keys.isin(list(fixed))]
+
+    if params['decompose']:
+        schedule, info = pack_rooms(instance, jadwal_dan_makul, params['ruang_solver'], params['decompose_workers'])
+    elif params['ruang_solver'] == 'greedy':
+        # generate_schedule deterministik, jadi cukup dipanggil sekali
+        schedule = generate_schedule(jadwal_dan_makul, instance)
+        info = {}
+    else:
+        schedule, info = optimize_schedule(jadwal_dan_makul, instance)
+    if fixed:
+        pinned = pd.DataFrame([row for rows in fixed.values() for row in rows], columns=schedule.columns)
+        schedule = pd.concat([schedule, pinned], ignore_index=True)
+    info['fitness'] = fitness(schedule, instance)
+
+    jadwal_makul_dan_ruang = pd.DataFrame(schedule).sort_values(by=['Hari', 'Waktu', 'Mata Kuliah'])
+    del jadwal_makul_dan_ruang['Kelas']
+    return jadwal_makul_dan_ruang, info
+
+
+def stage_pengawas(instance, jadwal_makul_dan_ruang, params, history=None, deadline=None, warm=None):
+    df_jadwal_ruang = jadwal_makul_dan_ruang[['Hari', 'Waktu', 'Mata Kuliah', 'Ruang']].copy()
+    makul_id = pd.Index(instance.makul).get_indexer(df_jadwal_ruang['Mata Kuliah'])
+    df_jadwal_ruang['Dosen Pengampu'] = instance.makul_pengampu[makul_id]
+
+    # Semua dosen unik dari daftar pengampu (diurutkan agar hasil bisa direproduksi)
+    dosen_all = instance.dosen
+
+    # Menjalankan algoritma genetika
+    fixed = None if warm is None else warm.pengawas_fixed(df_jadwal_ruang)
+    convergence = convergence_from_params(params, MAX_FITNESS, deadline)
+    extra = {}
+    if params['decompose']:
+        problem, best_individual, extra['balance_moves'] = assign_supervisors(instance, df_jadwal_ruang, params, fixed,
+                                                                              params['decompose_workers'])
+        best_fitness = SupervisorLoad(problem, best_individual[None]).fitness()[0]
+        best_schedule = to_schedule(problem, df_jadwal_ruang, best_individual)
+        convergence.reason = 'decomposed'
+    elif params['pengawas_solver'] == 'flow':
+        # Optimum eksak tanpa generasi GA; hasil tidak bergantung pada seed
+        problem = PengawasProblem(instance, df_jadwal_ruang, fixed)
+        best_individual = solve_flow(problem)
+        best_fitness = SupervisorLoad(problem, best_individual[None]).fitness()[0]
+        best_schedule = to_schedule(problem, df_jadwal_ruang, best_individual)
+        convergence.reason = 'optimal'
+    elif params['islands'] != 1:
+        problem = PengawasProblem(instance, df_jadwal_ruang, fixed)
+        engine = PengawasIsland(problem, params['pengawas_population_size'])
+        best_individual, best_fitness, _ = run_islands(engine, params['islands'], params['pengawas_generations'],
+                                                       params['migration_interval'], seed=params['seed'],
+                                                       history=history, convergence=convergence)
+        if repair_clashes(problem, best_individual):
+            best_fitness = SupervisorLoad(problem, best_individual[None]).fitness()[0]
+        best_schedule = to_schedule(problem, df_jadwal_ruang, best_individual)
+    else:
+        best_schedule, best_fitness = genetic_algorithm_pengawas(instance, df_jadwal_ruang,
+                                                                 generations=params['pengawas_generations'],
+                                                                 population_size=params['pengawas_population_size'],
+                                                                 seed=params['seed'], history=history,
+                                                                 convergence=convergence, fixed=fixed)
+
+    # Menghitung jumlah mengawas per hari untuk setiap dosen
+    supervision_counts = count_supervisions_per_day(best_schedule, dosen_all)
+    supervision_counts['Total'] = supervision_counts.sum(axis=1)
+
+    jadwal_lengkap = pd.DataFrame(best_schedule)
+    jadwal_lengkap['Jumlah Mahasiswa'] = jadwal_makul_dan_ruang['Jumlah Mahasiswa']
+
+    jadwal_lengkap = jadwal_lengkap[[
+                    'Hari',
+                    'Waktu',
+                    'Mata Kuliah',
+                    # 'Kelas',
+                    'Dosen Pengampu',
+                    'Pengawas',
+                    'Ruang',
+                    'Jumlah Mahasiswa',
+                    # 'Kapasitas',
+                    ]]
+    return jadwal_lengkap, supervision_counts, {'fitness': float(best_fitness), 'stop': convergence.report(), **extra}
+
+
+def stage_alokasi(jadwal_lengkap, jadwal_makul_dan_ruang, df_makul, workers=None):
+    # Menjalankan fungsi alokasi; workers (mode dekomposisi) = paralel per slot
+    if workers is None:
+        jadwal_terupdate = alokasi_mahasiswa(jadwal_lengkap, df_makul)
+    else:
+        jadwal_terupdate = allocate_classes(jadwal_lengkap, df_makul, workers)
+
+    a = pd.DataFrame(jadwal_terupdate)
+    a['Kapasitas'] = jadwal_makul_dan_ruang['Kapasitas']
+    return a
+
+
+def build_jadwal(instance, a):
+    slot_jadwal = instance.slot_jadwal().rename(columns={'Jam': 'Waktu'})
+
+    b = pd.merge(slot_jadwal, a, how='left', on=['Hari', 'Waktu', 'Ruang', 'Kapasitas'])
+    b = b.rename(columns={'Dosen Pengampu': 'Dosen'})
+    b['Lab'] = b['Lab'].replace('y', 'lab')
+    b = b[[
+                    'Hari',
+                    'Waktu',
+                    'Mata Kuliah',
+                    'Kelas',
+                    'Dosen',
+                    'Pengawas',
+                    'Ruang',
+                    'Lab',
+                    'Jumlah Mahasiswa',
+                    'Kapasitas',
+                    ]]
+    return b
+
+
+def run_pipeline(data, params=None, instrument=None, previous=None):
+    # previous: bytes jadwal_ujian.xlsx sebelumnya untuk warm start (opsional)
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    # Timer per tahap dan rekaman per generasi (lihat instrument.py)
+    instrument = instrument or Instrument()
+    # Batas waktu dibagi: GA sesi paling lama separuh, GA pengawas sisanya
+    start = time.perf_counter()
+    budget = params['time_budget']
+    sesi_deadline = start + budget / 2 if budget else None
+    pengawas_deadline = start + budget if budget else None
+
+    with instrument.profiling():
+        with instrument.stage('input'):
+            # Instance masalah dibangun sekali dan dipakai oleh semua tahap
+            instance = ProblemInstance(*read_input(data))
+            warm = None if previous is None else WarmStart(instance, read_jadwal(previous))
+        with instrument.stage('sesi'):
+            jadwal_dan_makul, sesi_info = stage_sesi(instance, params, instrument.history('sesi'), sesi_deadline,
+                                                     warm)
+        with instrument.stage('ruang'):
+            jadwal_makul_dan_ruang, ruang_info = stage_ruang(instance, jadwal_dan_makul, params, warm)
+        with instrument.stage('pengawas'):
+            jadwal_lengkap, supervision_counts, pengawas_info = stage_pengawas(instance, jadwal_makul_dan_ruang, params,
+                                                                               instrument.history('pengawas'),
+                                                                               pengawas_deadline, warm)
+        with instrument.stage('alokasi'):
+            a = stage_alokasi(jadwal_lengkap, jadwal_makul_dan_ruang, instance.df_makul,
+                              params['decompose_workers'] if params['decompose'] else None)
+            b = build_jadwal(instance, a)
+        with instrument.stage('export'):
+            excel = to_excel(b, supervision_counts, params['export_split'] or None)
+
+    return {
+        'instance': instance,
+        'df_sesi': instance.df_sesi,
+        'df_ruang': instance.df_ruang,
+        'df_makul': instance.df_makul,
+        'df_tidak_ujian': instance.df_tidak_ujian,
+        'df_butuh_lab': instance.df_butuh_lab,
+        'alokasi': a,
+        'jadwal': b,
+        'rekap': supervision_counts,
+        'sesi_info': sesi_info,
+        'ruang_info': ruang_info,
+        'pengawas_info': pengawas_info,
+        # Jumlah bagian yang dipertahankan dari jadwal sebelumnya per tahap
+        'warm_info': None if warm is None else warm.info,
+        'excel': excel,
+        'metrics': instrument.to_dict(),
+    }
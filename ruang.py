@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Penempatan ruangan ujian (tahap 2).
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# Bobot biaya pengepakan ruangan per slot (Hari, Jam): satu kursi kosong = 1
+SPLIT_COST = 10          # setiap ruang tambahan untuk satu mata kuliah
+LAB_PENALTY = 1000       # mata kuliah butuh lab ditempatkan di ruang non-lab
+LAB_RESERVE_COST = 1     # mata kuliah non-lab memakai ruang lab
+UNPLACED_PENALTY = 10000 # per mahasiswa yang tidak mendapat ruang
+
+
+class RoomScorer:
+    # Penilaian penempatan ruangan secara vektor: mask lab untuk ruang dan
+    # mata kuliah dihitung sekali, lalu bonus lab, penalti lab dan selisih
+    # kapasitas dihitung per kolom tanpa iterrows. Bisa menilai banyak
+    # kandidat jadwal sekaligus (ditumpuk dalam satu frame atau array).
+    __slots__ = ('rooms', 'room_capacity', 'room_is_lab', 'lab_rooms', 'butuh_lab')
+
+    def __init__(self, instance):
+        self.rooms = pd.Index(instance.ruang)
+        self.room_capacity = instance.ruang_capacity
+        self.room_is_lab = instance.ruang_is_lab
+        self.lab_rooms = pd.Index(self.rooms[self.room_is_lab])
+        self.butuh_lab = pd.Index(instance.makul[instance.makul_lab])
+
+    @staticmethod
+    def _terms(is_lab_course, in_lab_room, jumlah_mahasiswa, kapasitas_ruang):
+        # Selisih antara kapasitas ruangan dan jumlah mahasiswa
+        difference = kapasitas_ruang - jumlah_mahasiswa
+        # Bonus untuk mata kuliah lab di ruang lab, penalti jika di ruang non-lab
+        bonus = np.where(is_lab_course & in_lab_room, kapasitas_ruang - difference, 0)
+        penalty = np.where(is_lab_course & ~in_lab_room, 10, 0)
+        # Optimalisasi kapasitas: semakin kecil selisihnya, semakin baik
+        return bonus - penalty - difference
+
+    def row_scores(self, schedule):
+        return self._terms(
+            schedule['Mata Kuliah'].isin(self.butuh_lab).to_numpy(),
+            schedule['Ruang'].isin(self.lab_rooms).to_numpy(),
+            schedule['Jumlah Mahasiswa'].to_numpy().astype(np.int64),
+            schedule['Kapasitas'].to_numpy().astype(np.int64),
+        )
+
+    def score(self, schedule):
+        return int(self.row_scores(schedule).sum())
+
+    def score_many(self, schedules, key='Kandidat'):
+        # schedules: list DataFrame, atau satu DataFrame bertumpuk dengan
+        # kolom `key` berisi nomor kandidat 0..K-1. Hasil: array skor (K,)
+        if not isinstance(schedules, pd.DataFrame):
+            n_candidates = len(schedules)
+            schedules = pd.concat(schedules, keys=range(n_candidates), names=[key, None]).reset_index(level=0)
+        else:
+            n_candidates = int(schedules[key].max()) + 1 if len(schedules) else 0
+        return np.bincount(schedules[key].to_numpy(), weights=self.row_scores(schedules),
+                           minlength=n_candidates).astype(np.int64)
+
+    def score_arrays(self, is_lab_course, room, jumlah_mahasiswa):
+        # Versi array untuk loop pencarian: baris = kandidat, kolom = entri
+        # jadwal; `room` berisi indeks ruang pada df_ruang (-1 = kosong)
+        valid = room >= 0
+        room = np.where(valid, room, 0)
+        terms = self._terms(is_lab_course, self.room_is_lab[room], jumlah_mahasiswa, self.room_capacity[room])
+        return np.where(valid, terms, 0).sum(axis=-1)
+
+
+# STEP 2: Define fitness function to minimize the number of rooms with merged classes
+def fitness(schedule, instance):
+    return RoomScorer(instance).score(schedule)
+
+
+class RoomIndex:
+    # Ruangan lab dan non-lab yang sudah diurutkan berdasarkan kapasitas
+    # (terbesar dulu), ditambah indeks okupansi (Hari, Jam, Ruang)
+    __slots__ = ('lab_rooms', 'lab_capacity', 'non_lab_rooms', 'non_lab_capacity', 'occupied', '_cursor')
+
+    def __init__(self, instance):
+        df_ruang = instance.df_ruang
+        is_lab = instance.ruang_is_lab
+        df_ruang_lab = df_ruang[is_lab].sort_values(by='Kapasitas', ascending=False)
+        df_ruang_non_lab = df_ruang[~is_lab].sort_values(by='Kapasitas', ascending=False)
+        self.lab_rooms = df_ruang_lab['Ruang'].to_numpy()
+        self.lab_capacity = df_ruang_lab['Kapasitas'].to_numpy()
+        self.non_lab_rooms = df_ruang_non_lab['Ruang'].to_numpy()
+        self.non_lab_capacity = df_ruang_non_lab['Kapasitas'].to_numpy()
+        self.occupied = set()
+        # Posisi ruang pertama yang mungkin masih kosong per (Hari, Jam, daftar).
+        # Ruang selalu diambil berurutan dari depan, jadi kursor hanya maju dan
+        # total pencarian per slot linear terhadap jumlah ruang (amortised O(1)).
+        self._cursor = {}
+
+    def take(self, hari, jam, lab, remaining):
+        # Ambil ruang kosong berurutan sampai semua mahasiswa tertampung;
+        # menghasilkan (ruang, kapasitas, jumlah mahasiswa yang ditempatkan)
+        rooms, capacity = (self.lab_rooms, self.lab_capacity) if lab else (self.non_lab_rooms, self.non_lab_capacity)
+        key = (hari, jam, lab)
+        pos = self._cursor.get(key, 0)
+        assigned = []
+        while remaining > 0 and pos < len(rooms):
+            ruang = rooms[pos]
+            pos += 1
+            if (hari, jam, ruang) in self.occupied:
+                continue  # Skip if there's a conflict
+            students_assigned = min(remaining, capacity[pos - 1])
+            remaining -= students_assigned
+            if students_assigned > 0:
+                self.occupied.add((hari, jam, ruang))
+                assigned.append((ruang, capacity[pos - 1], students_assigned))
+        self._cursor[key] = pos
+        return assigned, remaining
+
+
+# Assign students to rooms based on capacity and lab requirements, prioritizing lab-required courses
+def generate_schedule(df_makul, instance):
+    schedule = []
+    index = RoomIndex(instance)
+    butuh_lab = set(instance.makul[instance.makul_lab])
+
+    # Group classes by Mata Kuliah and Hari-Waktu to combine if possible
+    total_students = df_makul.groupby(['Hari', 'Jam', 'Mata Kuliah'])['Jumlah Mahasiswa'].sum()
+
+    for (hari, jam, mata_kuliah), remaining_students in total_students.items():
+        # Prioritize lab rooms if the course needs it, non-lab rooms otherwise;
+        # the other kind is used only when the first is not enough
+        lab_needed = mata_kuliah in butuh_lab
+        for lab in (lab_needed, not lab_needed):
+            if remaining_students <= 0:
+                break
+            assigned, remaining_students = index.take(hari, jam, lab, remaining_students)
+            for assigned_room, room_capacity, students_assigned in assigned:
+                schedule.append([hari, jam, mata_kuliah, 'Gabungan', assigned_room, students_assigned, room_capacity])
+
+    return pd.DataFrame(schedule, columns=['Hari', 'Waktu', 'Mata Kuliah', 'Kelas', 'Ruang', 'Jumlah Mahasiswa', 'Kapasitas'])
+
+
+def _room_costs(lab_needed, room_is_lab):
+    # Biaya tambahan per ruang selain kursi kosong
+    if lab_needed:
+        return np.where(room_is_lab, SPLIT_COST, SPLIT_COST + LAB_PENALTY)
+    return np.where(room_is_lab, SPLIT_COST + LAB_RESERVE_COST, SPLIT_COST)
+
+
+def _best_cover(demand, capacity, room_cost):
+    # Knapsack 0/1 eksak: himpunan ruang dengan total kapasitas >= demand yang
+    # meminimalkan kursi kosong + biaya per ruang. Solusi optimal tidak pernah
+    # melebihi demand + kapasitas terbesar, sehingga tabel DP cukup sebesar itu.
+    # Mengembalikan (indeks ruang, biaya) atau (None, inf) jika tidak cukup.
+    if demand <= 0:
+        return np.empty(0, dtype=np.intp), 0
+    if capacity.sum() < demand:
+        return None, float('inf')
+    limit = int(demand + capacity.max())
+    best = np.full(limit + 1, np.inf)
+    best[0] = 0
+    take = np.zeros((len(capacity), limit + 1), dtype=bool)
+    for i, (c, w) in enumerate(zip(capacity, room_cost)):
+        c = int(min(c, limit))
+        candidate = best[:limit + 1 - c] + w
+        improved = candidate < best[c:]
+        take[i, c:] = improved
+        best[c:] = np.where(improved, candidate, best[c:])
+
+    totals = np.arange(limit + 1)
+    cost = np.where(totals >= demand, best + totals - demand, np.inf)
+    total = int(np.argmin(cost))
+    chosen = []
+    for i in range(len(capacity) - 1, -1, -1):
+        if take[i, total]:
+            chosen.append(i)
+            total -= int(min(capacity[i], limit))
+    # Ruang pertama tidak dihitung sebagai pemecahan
+    return np.array(chosen[::-1], dtype=np.intp), float(cost.min()) - SPLIT_COST
+
+
+def _uncovered_cost(demand, capacity):
+    # Biaya jika ruang tidak cukup: semua ruang dipakai (kapasitas terbaik
+    # yang bisa dicapai) dan sisa mahasiswa dikenai penalti
+    return max(len(capacity) - 1, 0) * SPLIT_COST + (demand - int(capacity.sum())) * UNPLACED_PENALTY
+
+
+def _pack_slot(courses, room_names, capacity, room_is_lab, max_orders=24):
+    # Mengemas mata kuliah dalam satu slot ke ruang yang tersedia. Setiap
+    # urutan mata kuliah diselesaikan berurutan dengan _best_cover pada sisa
+    # ruang; urutan termurah dipakai. GA sesi menaruh paling banyak
+    # sesi.MAX_PER_SLOT (2) mata kuliah per slot, jadi semua urutan selalu
+    # dicoba; max_orders = 4! hanya membatasi slot dengan > 4 mata kuliah.
+    # Batas bawah = jumlah optimum tiap mata kuliah jika ia boleh memakai
+    # semua ruang (relaksasi syarat ruang tidak boleh dipakai bersama),
+    # sehingga selisihnya adalah jarak maksimum dari optimum.
+    lower_bound = 0
+    for _, demand, lab_needed in courses:
+        _, cost = _best_cover(demand, capacity, _room_costs(lab_needed, room_is_lab))
+        lower_bound += cost if np.isfinite(cost) else _uncovered_cost(demand, capacity)
+
+    by_size = sorted(range(len(courses)), key=lambda k: (-courses[k][2], -courses[k][1]))
+    orders = itertools.islice(itertools.permutations(by_size), max_orders)
+    best = None
+    for order in orders:
+        free = np.ones(len(room_names), dtype=bool)
+        assignment, total = {}, 0
+        for k in order:
+            _, demand, lab_needed = courses[k]
+            rooms = np.flatnonzero(free)
+            chosen, cost = _best_cover(demand, capacity[rooms], _room_costs(lab_needed, room_is_lab[rooms]))
+            if chosen is None:
+                # Ruang tidak cukup: pakai semua sisa ruang
+                chosen = np.arange(len(rooms))
+                cost = _uncovered_cost(demand, capacity[rooms])
+            chosen = rooms[chosen]
+            free[chosen] = False
+            assignment[k] = chosen
+            total += cost
+        if best is None or total < best[1]:
+            best = (assignment, total)
+
+    return best[0], best[1], lower_bound
+
+
+def optimize_schedule(df_makul, instance):
+    # Penempatan ruangan optimal per slot (Hari, Jam): meminimalkan kursi
+    # kosong dan jumlah ruang pecahan dengan tetap menaruh mata kuliah lab di
+    # ruang lab. Mengembalikan jadwal berformat sama dengan generate_schedule
+    # beserta ringkasan biaya dan batas bawahnya.
+    room_names = instance.ruang
+    capacity = instance.ruang_capacity
+    room_is_lab = instance.ruang_is_lab
+    butuh_lab = set(instance.makul[instance.makul_lab])
+
+    schedule = []
+    total_cost, lower_bound = 0, 0
+    total_students = df_makul.groupby(['Hari', 'Jam', 'Mata Kuliah'])['Jumlah Mahasiswa'].sum()
+    for (hari, jam), slot in total_students.groupby(level=[0, 1], sort=True):
+        courses = [(mata_kuliah, int(n), mata_kuliah in butuh_lab)
+                   for (_, _, mata_kuliah), n in slot.items()]
+        assignment, cost, bound = _pack_slot(courses, room_names, capacity, room_is_lab)
+        total_cost += cost
+        lower_bound += bound
+
+        for k, (mata_kuliah, remaining_students, _) in enumerate(courses):
+            # Isi ruang dari kapasitas terbesar; ruang terakhir sebagian
+            for r in sorted(assignment[k], key=lambda r: -capacity[r]):
+                students_assigned = min(remaining_students, capacity[r])
+                remaining_students -= students_assigned
+                schedule.append([hari, jam, mata_kuliah, 'Gabungan', room_names[r], students_assigned, capacity[r]])
+
+    info = {'cost': total_cost, 'lower_bound': lower_bound, 'gap': total_cost - lower_bound}
+    return pd.DataFrame(schedule, columns=['Hari', 'Waktu', 'Mata Kuliah', 'Kelas', 'Ruang', 'Jumlah Mahasiswa', 'Kapasitas']), info
@@ -0,0 +1,527 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Algoritma genetika penjadwalan sesi ujian (tahap 1) berbasis NumPy.
+# Seluruh populasi disimpan sebagai satu array int (population_size, n_makul)
+# yang berisi indeks baris df_sesi untuk setiap mata kuliah, sehingga fitness,
+# cek kapasitas slot dan mutasi berjalan sekaligus untuk semua individu.
+# Bentrok antar mata kuliah (semester sama atau dosen pengampu bersama) dinilai
+# dari tabel jumlah mata kuliah per (slot, semester), (hari, semester) dan
+# (slot, dosen): k mata kuliah dalam satu sel = k * (k - 1) / 2 pasangan
+# bentrok, tanpa daftar pasangan yang tumbuh kuadrat dengan ukuran kelompok.
+
+import numpy as np
+
+from stopping import scaled_crossover_rate, scaled_mutation_rate
+
+# Maksimal mata kuliah dalam satu slot (Hari, Jam)
+MAX_PER_SLOT = 2
+
+# Penalti per bentrok dalam satu slot (setiap semester sama dan setiap dosen
+# pengampu bersama dihitung satu) dan per pasangan mata kuliah satu semester
+# pada hari yang sama
+CLASH_SLOT_PENALTY = 10
+CLASH_DAY_PENALTY = 1
+
+
+class SesiProblem:
+    # Vektor-vektor yang dihitung sekali per unggahan
+    __slots__ = (
+        'hari', 'jam', 'makul', 'semester',
+        'slot_of_sesi', 'day_of_sesi', 'day_capacity',
+        'sem_code', 'n_semester', 'lab',
+        'n_sesi', 'n_slot', 'n_hari', 'n_makul',
+        'fixed', 'free_genes', 'is_free',
+        'dosen_ptr', 'dosen_code', 'dosen_owner', 'n_dosen', 'pengampu', 'count_dtype',
+    )
+
+    def __init__(self, instance, fixed=None):
+        # Semua kode diambil dari instance.ProblemInstance
+        self.hari = instance.hari[instance.sesi_hari]
+        self.jam = instance.jam[instance.sesi_jam]
+        self.n_sesi = instance.n_sesi
+
+        # Slot (Hari, Jam) dan hari untuk setiap sesi
+        self.slot_of_sesi = instance.sesi_slot
+        self.n_slot = instance.n_slot
+        self.day_of_sesi = instance.sesi_hari
+        self.n_hari = instance.n_hari
+        # Jumlah sesi per hari (batas mata kuliah lab per hari)
+        self.day_capacity = np.bincount(self.day_of_sesi, minlength=self.n_hari)
+
+        # Satu gen per mata kuliah, urut seperti df_makul.groupby('Mata Kuliah')
+        self.makul = instance.makul
+        self.semester = instance.makul_semester
+        self.n_makul = instance.n_makul
+        self.n_semester = len(instance.semester)
+        self.sem_code = instance.makul_sem
+        self.lab = instance.makul_lab
+
+        # Dosen pengampu (CSR per mata kuliah, dari instance) dan mask
+        # (n_makul, n_dosen) untuk jumlah dosen bersama dua mata kuliah
+        self.dosen_ptr = instance.makul_dosen_ptr
+        self.dosen_code = instance.makul_dosen
+        self.dosen_owner = np.repeat(np.arange(self.n_makul), np.diff(self.dosen_ptr))
+        self.n_dosen = instance.n_dosen
+        self.pengampu = np.zeros((self.n_makul, self.n_dosen), dtype=bool)
+        self.pengampu[self.dosen_owner, self.dosen_code] = True
+        # Isi sel tabel jumlah (lihat _aggregates) tidak melebihi ukuran
+        # kelompok semester/dosen terbesar, jadi int8 cukup untuk data biasa
+        largest = max(np.bincount(self.sem_code).max(initial=0), np.bincount(self.dosen_code).max(initial=0))
+        self.count_dtype = np.int8 if largest <= np.iinfo(np.int8).max else np.int16
+
+        # Warm start: sesi tetap per mata kuliah (-1 = bebas dioptimasi).
+        # Gen tetap tidak pernah diubah oleh mutasi maupun perbaikan slot.
+        self.fixed = fixed
+        self.is_free = np.ones(self.n_makul, dtype=bool) if fixed is None else fixed < 0
+        self.free_genes = np.flatnonzero(self.is_free)
+
+    def decode(self, individual):
+        # Kembali ke format lama: list (Hari, Jam, Mata Kuliah, Semester)
+        return list(zip(self.hari[individual], self.jam[individual], self.makul, self.semester))
+
+
+def _random_valid_choice(valid, rng):
+    # Memilih satu kolom True secara acak untuk setiap baris
+    keys = rng.random(valid.shape)
+    keys[~valid] = -1.0
+    return keys.argmax(axis=1)
+
+
+def _row_bincount(codes, n_bins, weights=None):
+    # bincount per baris untuk array 2D kode (P, n) -> (P, n_bins)
+    n_rows = codes.shape[0]
+    offsets = (np.arange(n_rows) * n_bins)[:, None]
+    flat = (codes + offsets).ravel()
+    if weights is not None:
+        weights = np.broadcast_to(weights, codes.shape).ravel()
+    counts = np.bincount(flat, weights=weights, minlength=n_rows * n_bins)
+    return counts.reshape(n_rows, n_bins).astype(np.int64)
+
+
+def slot_counts(problem, population):
+    return _row_bincount(problem.slot_of_sesi[population], problem.n_slot)
+
+
+def generate_initial_population(problem, population_size, rng):
+    population = np.empty((population_size, problem.n_makul), dtype=np.intp)
+    counts = np.zeros((population_size, problem.n_slot), dtype=np.int64)
+    rows = np.arange(population_size)
+
+    if problem.fixed is not None:
+        pinned = np.flatnonzero(~problem.is_free)
+        population[:, pinned] = problem.fixed[pinned]
+        counts += np.bincount(problem.slot_of_sesi[problem.fixed[pinned]], minlength=problem.n_slot)
+
+    for makul in problem.free_genes:
+        # Sesi yang slotnya belum berisi 2 mata kuliah, untuk semua individu
+        valid = counts[:, problem.slot_of_sesi] < MAX_PER_SLOT
+        if not valid.any(axis=1).all():
+            raise ValueError("Jumlah sesi tidak cukup untuk seluruh mata kuliah")
+        sesi = _random_valid_choice(valid, rng)
+        population[:, makul] = sesi
+        counts[rows, problem.slot_of_sesi[sesi]] += 1
+
+    return population
+
+
+def _count_table(codes, n_bins, dtype):
+    # Tabel jumlah per baris (P, n_bins) dan jumlah pasangan kode sama per
+    # baris (sum k * (k - 1) / 2). Dihitung dari kode yang diurutkan per
+    # baris, jadi biayanya O(P * n) di luar pengisian nol tabel.
+    n_rows, n = codes.shape
+    table = np.zeros((n_rows, n_bins), dtype=dtype)
+    if n == 0:
+        return table, np.zeros(n_rows, dtype=np.int64)
+    codes = np.sort(codes, axis=1)
+    position = np.arange(n)
+    first = np.ones(codes.shape, dtype=bool)
+    first[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    run_start = np.maximum.accumulate(np.where(first, position, 0), axis=1)
+    pairs = (position - run_start).sum(axis=1, dtype=np.int64)
+    # Jumlah setiap kode ditulis di posisi terakhir run-nya
+    last = np.ones(codes.shape, dtype=bool)
+    last[:, :-1] = first[:, 1:]
+    cells = codes + (np.arange(n_rows) * n_bins)[:, None]
+    table.reshape(-1)[cells[last]] = (position - run_start + 1)[last]
+    return table, pairs
+
+
+def _aggregates(problem, population):
+    # Jumlah ujian per semester, jumlah mata kuliah lab per hari, tabel jumlah
+    # (slot, semester), (hari, semester) dan (slot, dosen) yang diratakan
+    # (indeks slot * n_semester + semester, dst.), serta total bentrok per
+    # slot dan per hari. Tabel memakai problem.count_dtype agar salinan state murah.
+    sem_codes = np.broadcast_to(problem.sem_code, population.shape)
+    semester_distribution = _row_bincount(sem_codes, problem.n_semester)
+    days = problem.day_of_sesi[population]
+    lab_constraints = _row_bincount(days, problem.n_hari, weights=problem.lab)
+    slots = problem.slot_of_sesi[population]
+    dtype = problem.count_dtype
+    slot_semester, slot_sem_pairs = _count_table(slots * problem.n_semester + problem.sem_code,
+                                                 problem.n_slot * problem.n_semester, dtype)
+    day_semester, day_clash = _count_table(days * problem.n_semester + problem.sem_code,
+                                           problem.n_hari * problem.n_semester, dtype)
+    slot_dosen, slot_dosen_pairs = _count_table(slots[:, problem.dosen_owner] * problem.n_dosen + problem.dosen_code,
+                                                problem.n_slot * problem.n_dosen, dtype)
+    return (semester_distribution, lab_constraints, slot_semester, day_semester, slot_dosen,
+            slot_sem_pairs + slot_dosen_pairs, day_clash)
+
+
+def _lab_penalty(problem, count, day):
+    return np.maximum(count - problem.day_capacity[day], 0) * 10
+
+
+def _gene_dosen(problem, genes):
+    # Pasangan (indeks gen, kode dosen) untuk setiap dosen pengampu gen `genes`
+    start = problem.dosen_ptr[genes]
+    degree = problem.dosen_ptr[genes + 1] - start
+    owner = np.repeat(np.arange(len(genes)), degree)
+    edges = np.repeat(start - np.cumsum(degree) + degree, degree) + np.arange(degree.sum())
+    return owner, problem.dosen_code[edges]
+
+
+def _score(problem, semester_distribution, lab_constraints, slot_clash, day_clash):
+    fitness = np.zeros(semester_distribution.shape[0], dtype=np.int64)
+
+    # Penalize if a semester has more than 2 hours of exams
+    fitness -= (np.maximum(semester_distribution - 2, 0) * 10).sum(axis=1)
+
+    # Penalize if lab constraints are violated
+    fitness -= (np.maximum(lab_constraints - problem.day_capacity, 0) * 10).sum(axis=1)
+
+    # Penalize course clashes in the same slot and same-semester exams on the same day
+    fitness -= CLASH_SLOT_PENALTY * slot_clash + CLASH_DAY_PENALTY * day_clash
+
+    # Reward for balancing semester distribution across days
+    sorted_counts = np.sort(semester_distribution, axis=1)
+    distinct = 1 + (np.diff(sorted_counts, axis=1) != 0).sum(axis=1)
+    fitness += problem.n_semester - distinct
+
+    return fitness
+
+
+def fitness_function(problem, population):
+    semester_distribution, lab_constraints, *_, slot_clash, day_clash = _aggregates(problem, population)
+    return _score(problem, semester_distribution, lab_constraints, slot_clash, day_clash)
+
+
+def _min_pairs(size, n_bins):
+    # Jumlah pasangan minimum dalam bin yang sama jika `size` mata kuliah dibagi rata ke n_bins
+    q, r = np.divmod(size, max(n_bins, 1))
+    return r * (q + 1) * q // 2 + (n_bins - r) * q * (q - 1) // 2
+
+
+def max_fitness(problem):
+    # Batas atas fitness: distribusi semester tidak bergantung pada jadwal;
+    # tanpa pelanggaran lab, tanpa bentrok dosen, dan mata kuliah setiap
+    # semester tersebar rata ke semua slot dan semua hari
+    semester_distribution = _aggregates(problem, np.zeros((1, problem.n_makul), dtype=np.intp))[0]
+    size = np.bincount(problem.sem_code, minlength=problem.n_semester)
+    slot_clash = _min_pairs(size, problem.n_slot).sum(keepdims=True)
+    day_clash = _min_pairs(size, problem.n_hari).sum(keepdims=True)
+    return int(_score(problem, semester_distribution, np.zeros((1, problem.n_hari), dtype=np.int64),
+                      slot_clash, day_clash)[0])
+
+
+def diversity(population, idx):
+    # Proporsi gen yang berbeda dari individu idx
+    return float((population != population[idx]).mean())
+
+
+class FitnessState:
+    # Agregat fitness per individu yang diperbarui secara inkremental.
+    # Memindahkan satu mata kuliah ke sesi lain hanya mengubah lab_constraints
+    # pada hari lama dan hari baru (semester gen tidak berubah) dan sel tabel
+    # jumlah untuk semester dan dosen pengampu gen itu di slot/hari lama dan
+    # baru, sehingga skor diperbarui dalam O(jumlah dosen gen).
+    __slots__ = ('problem', 'semester_distribution', 'lab_constraints', 'slot_semester', 'day_semester',
+                 'slot_dosen', 'slot_clash', 'day_clash', 'fitness')
+
+    def __init__(self, problem, population):
+        self.problem = problem
+        (self.semester_distribution, self.lab_constraints, self.slot_semester, self.day_semester,
+         self.slot_dosen, self.slot_clash, self.day_clash) = _aggregates(problem, population)
+        self.fitness = _score(problem, self.semester_distribution, self.lab_constraints,
+                              self.slot_clash, self.day_clash)
+
+    def take(self, idx):
+        # Salinan agregat untuk baris idx (misalnya induk terpilih)
+        state = FitnessState.__new__(FitnessState)
+        state.problem = self.problem
+        for name in FitnessState.__slots__[1:]:
+            setattr(state, name, getattr(self, name)[idx])
+        return state
+
+    def put(self, idx, other):
+        for name in FitnessState.__slots__[1:]:
+            getattr(self, name)[idx] = getattr(other, name)
+
+    def _lab_delta(self, rows, old_sesi, new_sesi, genes):
+        problem = self.problem
+        old_day = problem.day_of_sesi[old_sesi]
+        new_day = problem.day_of_sesi[new_sesi]
+        moved = problem.lab[genes] & (old_day != new_day)
+        old_count = self.lab_constraints[rows, old_day]
+        new_count = self.lab_constraints[rows, new_day]
+        penalty = (_lab_penalty(problem, old_count - 1, old_day) - _lab_penalty(problem, old_count, old_day)
+                   + _lab_penalty(problem, new_count + 1, new_day) - _lab_penalty(problem, new_count, new_day))
+        return np.where(moved, -penalty, 0)
+
+    def _cells(self, old_sesi, new_sesi, genes):
+        # Sel tabel lama dan baru untuk semester gen (per slot dan per hari)
+        # dan untuk setiap dosen pengampunya (per slot)
+        problem = self.problem
+        sem = problem.sem_code[genes]
+        old_slot, new_slot = problem.slot_of_sesi[old_sesi], problem.slot_of_sesi[new_sesi]
+        old_day, new_day = problem.day_of_sesi[old_sesi], problem.day_of_sesi[new_sesi]
+        owner, dosen = _gene_dosen(problem, genes)
+        return ((old_slot * problem.n_semester + sem, new_slot * problem.n_semester + sem),
+                (old_day * problem.n_semester + sem, new_day * problem.n_semester + sem),
+                owner, (old_slot[owner] * problem.n_dosen + dosen, new_slot[owner] * problem.n_dosen + dosen),
+                old_slot != new_slot, old_day != new_day)
+
+    def _clash_deltas(self, rows, cells):
+        # Perubahan (slot_clash, day_clash): gen yang pindah kehilangan k - 1
+        # pasangan di sel lama dan mendapat k pasangan di sel baru
+        (sem_slot, sem_day, owner, dosen_slot, slot_moved, day_moved) = cells
+        dosen_change = (self.slot_dosen[rows[owner], dosen_slot[1]].astype(np.int64)
+                        - self.slot_dosen[rows[owner], dosen_slot[0]] + 1)
+        slot_delta = (self.slot_semester[rows, sem_slot[1]].astype(np.int64) - self.slot_semester[rows, sem_slot[0]]
+                      + 1 + np.bincount(owner, weights=dosen_change, minlength=len(rows)).astype(np.int64))
+        day_delta = self.day_semester[rows, sem_day[1]].astype(np.int64) - self.day_semester[rows, sem_day[0]] + 1
+        return np.where(slot_moved, slot_delta, 0), np.where(day_moved, day_delta, 0)
+
+    def delta(self, rows, old_sesi, new_sesi, genes):
+        # Perubahan skor jika gen `genes` pada baris `rows` dipindah dari
+        # old_sesi ke new_sesi, tanpa mengubah state (baris boleh berulang)
+        slot_delta, day_delta = self._clash_deltas(rows, self._cells(old_sesi, new_sesi, genes))
+        return (self._lab_delta(rows, old_sesi, new_sesi, genes)
+                - CLASH_SLOT_PENALTY * slot_delta - CLASH_DAY_PENALTY * day_delta)
+
+    def swap_delta(self, rows, sesi_a, sesi_b, genes_a, genes_b):
+        # Perubahan skor jika sesi gen genes_a (di sesi_a) dan genes_b (di
+        # sesi_b) ditukar. Jumlah dua delta tunggal menghitung pasangan a-b dua
+        # kali di sisi yang salah (setiap gen melihat gen lain masih di tempat
+        # lama), jadi dikoreksi 2x bobot pasangan jika slot/harinya berbeda;
+        # dua mata kuliah lab yang bertukar hari tidak mengubah jumlah lab.
+        problem = self.problem
+        delta = self.delta(rows, sesi_a, sesi_b, genes_a) + self.delta(rows, sesi_b, sesi_a, genes_b)
+        same_sem = problem.sem_code[genes_a] == problem.sem_code[genes_b]
+        shared = (problem.pengampu[genes_a] & problem.pengampu[genes_b]).sum(axis=1)
+        slot_moved = problem.slot_of_sesi[sesi_a] != problem.slot_of_sesi[sesi_b]
+        day_moved = problem.day_of_sesi[sesi_a] != problem.day_of_sesi[sesi_b]
+        delta += np.where(slot_moved, 2 * CLASH_SLOT_PENALTY * (same_sem + shared), 0)
+        delta += np.where(day_moved, 2 * CLASH_DAY_PENALTY * same_sem, 0)
+        both_lab = problem.lab[genes_a] & problem.lab[genes_b]
+        delta -= np.where(both_lab, self._lab_delta(rows, sesi_a, sesi_b, genes_a)
+                          + self._lab_delta(rows, sesi_b, sesi_a, genes_b), 0)
+        return delta
+
+    def apply(self, rows, old_sesi, new_sesi, genes):
+        # Terapkan perpindahan gen ke agregat dan skor (baris harus unik).
+        # Mengembalikan delta skor.
+        problem = self.problem
+        cells = self._cells(old_sesi, new_sesi, genes)
+        slot_delta, day_delta = self._clash_deltas(rows, cells)
+        delta = (self._lab_delta(rows, old_sesi, new_sesi, genes)
+                 - CLASH_SLOT_PENALTY * slot_delta - CLASH_DAY_PENALTY * day_delta)
+        self.fitness[rows] += delta
+        self.slot_clash[rows] += slot_delta
+        self.day_clash[rows] += day_delta
+        lab = problem.lab[genes].astype(np.int64)
+        self.lab_constraints[rows, problem.day_of_sesi[old_sesi]] -= lab
+        self.lab_constraints[rows, problem.day_of_sesi[new_sesi]] += lab
+        (sem_slot, sem_day, owner, dosen_slot, _, _) = cells
+        for table, (old, new), at in ((self.slot_semester, sem_slot, rows), (self.day_semester, sem_day, rows),
+                                      (self.slot_dosen, dosen_slot, rows[owner])):
+            np.subtract.at(table, (at, old), 1)
+            np.add.at(table, (at, new), 1)
+        return delta
+
+
+def _repair(problem, children, cut, rng):
+    # Perbaiki slot yang berisi lebih dari 2 mata kuliah dengan memindahkan
+    # gen dari bagian hasil silang (posisi >= cut) ke sesi yang slotnya masih
+    # kosong. Jumlah slot dijaga secara inkremental; setiap putaran mengurangi
+    # kelebihan minimal satu per anak, jadi jumlah putaran <= total kelebihan.
+    counts = slot_counts(problem, children)
+    genes = np.arange(children.shape[1])
+    repairs = 0
+
+    while True:
+        over = counts > MAX_PER_SLOT
+        rows = np.flatnonzero(over.any(axis=1))
+        if rows.size == 0:
+            return repairs
+
+        slots = problem.slot_of_sesi[children[rows]]
+        in_over = over[rows[:, None], slots]
+        in_over &= problem.is_free
+        candidates = in_over & (genes >= cut[rows, None])
+        # Induk yang tidak valid: boleh memindahkan gen bebas mana pun di slot penuh
+        no_suffix = ~candidates.any(axis=1)
+        candidates[no_suffix] = in_over[no_suffix]
+
+        free = counts[rows][:, problem.slot_of_sesi] < MAX_PER_SLOT
+        if not free.any(axis=1).all():
+            raise ValueError("Jumlah sesi tidak cukup untuk seluruh mata kuliah")
+
+        gene = _random_valid_choice(candidates, rng)
+        new_sesi = _random_valid_choice(free, rng)
+        counts[rows, slots[np.arange(rows.size), gene]] -= 1
+        counts[rows, problem.slot_of_sesi[new_sesi]] += 1
+        children[rows, gene] = new_sesi
+        repairs += rows.size
+
+
+def crossover(problem, parents1, parents2, rng):
+    # One-point crossover per pasangan, lalu perbaikan slot yang penuh,
+    # sehingga anak selalu memenuhi batas 2 mata kuliah per slot
+    n_pairs, n_makul = parents1.shape
+    cut = rng.integers(0, n_makul, size=n_pairs)
+    left = np.arange(n_makul) < cut[:, None]
+    child1 = np.where(left, parents1, parents2)
+    child2 = np.where(left, parents2, parents1)
+    repairs = _repair(problem, child1, cut, rng) + _repair(problem, child2, cut, rng)
+    return child1, child2, repairs
+
+
+def mutate(problem, population, mutation_rate, rng, state=None):
+    # Mutasi in-place: satu gen per individu terpilih dipindah ke sesi lain
+    # yang slotnya masih berisi kurang dari 2 mata kuliah. Jika state
+    # diberikan, fitness ikut diperbarui secara inkremental.
+    rows = np.flatnonzero(rng.random(population.shape[0]) < mutation_rate)
+    if rows.size == 0 or problem.free_genes.size == 0:
+        return rows[:0]
+    mutate_idx = problem.free_genes[rng.integers(0, problem.free_genes.size, size=rows.size)]
+    counts = slot_counts(problem, population[rows])
+    valid = counts[:, problem.slot_of_sesi] < MAX_PER_SLOT
+    has_valid = valid.any(axis=1)
+    new_sesi = _random_valid_choice(valid, rng)
+    rows, mutate_idx, new_sesi = rows[has_valid], mutate_idx[has_valid], new_sesi[has_valid]
+    if state is not None:
+        state.apply(rows, population[rows, mutate_idx], new_sesi, mutate_idx)
+    population[rows, mutate_idx] = new_sesi
+    return rows
+
+
+def violations(problem, state, idx):
+    # Jumlah pelanggaran individu idx: semester dengan > 2 ujian, hari
+    # dengan mata kuliah lab melebihi jumlah sesi, dan bentrok dalam satu slot
+    return int((state.semester_distribution[idx] > 2).sum()
+               + (state.lab_constraints[idx] > problem.day_capacity).sum()
+               + state.slot_clash[idx])
+
+
+def evolve(problem, population, state, generations, mutation_rate, crossover_rate, rng,
+           best_individual=None, best_fitness=float('-inf'), history=None, convergence=None):
+    # Menjalankan sejumlah generasi dari populasi yang sudah ada; dipakai oleh
+    # genetic_algorithm dan oleh island model (island.py) per epoch migrasi.
+    # convergence (stopping.Convergence) dapat menghentikan loop lebih awal
+    # dan mengatur laju mutasi/crossover.
+    if history is None:
+        history = []
+    base_mutation_rate, base_crossover_rate = mutation_rate, crossover_rate
+
+    for _ in range(generations):
+        population_fitness = state.fitness
+
+        # Keep track of the best individual
+        best_idx = int(np.argmax(population_fitness))
+        if population_fitness[best_idx] > best_fitness:
+            best_individual = population[best_idx].copy()
+            best_fitness = int(population_fitness[best_idx])
+
+        if convergence is not None:
+            if convergence.update(best_fitness, lambda: diversity(population, best_idx)):
+                break
+            mutation_rate = convergence.mutation_rate(base_mutation_rate)
+            crossover_rate = convergence.crossover_rate(base_crossover_rate)
+
+        # Selection: pasangan induk dipilih acak dari populasi
+        n_pairs = len(population) // 2
+        idx1 = rng.integers(0, len(population), size=n_pairs)
+        idx2 = rng.integers(0, len(population), size=n_pairs)
+        parents1, parents2 = population[idx1], population[idx2]
+        state1, state2 = state.take(idx1), state.take(idx2)
+        do_crossover = rng.random(n_pairs) < crossover_rate
+        repairs = 0
+        if do_crossover.any():
+            c1, c2, repairs = crossover(problem, parents1[do_crossover], parents2[do_crossover], rng)
+            parents1[do_crossover] = c1
+            parents2[do_crossover] = c2
+            # Anak hasil crossover dihitung ulang penuh, sisanya mewarisi state induk
+            state1.put(do_crossover, FitnessState(problem, c1))
+            state2.put(do_crossover, FitnessState(problem, c2))
+
+        new_population = np.empty((2 * n_pairs, problem.n_makul), dtype=np.intp)
+        new_population[0::2] = parents1
+        new_population[1::2] = parents2
+        new_state = state.take(np.zeros(2 * n_pairs, dtype=np.intp))
+        new_state.put(slice(0, None, 2), state1)
+        new_state.put(slice(1, None, 2), state2)
+        mutate(problem, new_population, mutation_rate, rng, new_state)
+
+        history.append({
+            'generation': len(history),
+            'best_fitness': int(population_fitness[best_idx]),
+            'mean_fitness': float(population_fitness.mean()),
+            'violations': violations(problem, state, best_idx),
+            'repairs': repairs,
+        })
+        population, state = new_population, new_state
+
+    return population, state, best_individual, best_fitness
+
+
+def genetic_algorithm(problem, population_size=50, generations=100,
+                      mutation_rate=0.1, crossover_rate=0.7, seed=None, history=None, convergence=None):
+    rng = np.random.default_rng(seed)
+    population = generate_initial_population(problem, population_size, rng)
+    if history is None:
+        history = []
+    _, _, best_individual, best_fitness = evolve(problem, population, FitnessState(problem, population),
+                                                 generations, mutation_rate, crossover_rate, rng,
+                                                 history=history, convergence=convergence)
+    return best_individual, best_fitness, history
+
+
+class SesiIsland:
+    # Mesin GA sesi untuk island.run_islands: satu pulau = satu populasi
+    # dengan seed sendiri, berevolusi beberapa generasi per epoch
+    def __init__(self, problem, population_size=50, mutation_rate=0.1, crossover_rate=0.7):
+        self.problem = problem
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+
+    def init(self, seed):
+        rng = np.random.default_rng(seed)
+        return {
+            'population': generate_initial_population(self.problem, self.population_size, rng),
+            'rng': rng,
+            'best_individual': None,
+            'best_fitness': float('-inf'),
+            'history': [],
+        }
+
+    def evolve(self, island, generations, scale=1.0):
+        population = island['population']
+        population, state, island['best_individual'], island['best_fitness'] = evolve(
+            self.problem, population, FitnessState(self.problem, population), generations,
+            scaled_mutation_rate(self.mutation_rate, scale), scaled_crossover_rate(self.crossover_rate, scale),
+            island['rng'], island['best_individual'], island['best_fitness'], island['history'])
+        island['population'] = population
+        island['diversity'] = diversity(population, int(np.argmax(state.fitness)))
+        return island
+
+    def emigrants(self, island, n):
+        # Individu terbaik dari populasi saat ini
+        order = np.argsort(-fitness_function(self.problem, island['population']), kind='stable')
+        return island['population'][order[:n]].copy()
+
+    def immigrate(self, island, migrants):
+        # Migran menggantikan individu terburuk
+        order = np.argsort(fitness_function(self.problem, island['population']), kind='stable')
+        island['population'][order[:len(migrants)]] = migrants
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Penghentian GA berbasis konvergensi. Dicek sekali per generasi (atau per
+# epoch pada island model): berhenti jika fitness terbaik sudah mencapai
+# target (optimum teoretis), tidak membaik selama `stagnation` generasi,
+# batas waktu terlampaui, atau keragaman populasi di bawah `min_diversity`.
+# Opsional: laju mutasi dinaikkan dan crossover diturunkan selama stagnasi
+# (lebih banyak eksplorasi), lalu dikembalikan begitu ada perbaikan.
+
+import time
+
+# Setiap ADAPT_WINDOW generasi tanpa perbaikan, skala mutasi dikali ADAPT_FACTOR
+ADAPT_WINDOW = 5
+ADAPT_FACTOR = 1.5
+MAX_SCALE = 4.0
+
+
+def scaled_mutation_rate(rate, scale):
+    return min(rate * scale, 1.0)
+
+
+def scaled_crossover_rate(rate, scale):
+    return rate / scale
+
+
+class Convergence:
+    def __init__(self, target=None, stagnation=0, deadline=None, min_diversity=0.0, adaptive=False):
+        # deadline: waktu time.perf_counter() absolut, None = tanpa batas
+        self.target = target
+        self.stagnation = stagnation
+        self.deadline = deadline
+        self.min_diversity = min_diversity
+        self.adaptive = adaptive
+        self.best = float('-inf')
+        self.generation = 0
+        self.since_improvement = 0
+        self.scale = 1.0
+        self.reason = 'generations'
+        self.start = time.perf_counter()
+
+    def update(self, best_fitness, diversity=None, step=1):
+        # Dipanggil setelah fitness generasi dihitung; True = hentikan.
+        # diversity: fungsi tanpa argumen, hanya dipanggil jika min_diversity diset
+        self.generation += step
+        if best_fitness > self.best:
+            self.best = best_fitness
+            self.since_improvement = 0
+            self.scale = 1.0
+        else:
+            self.since_improvement += step
+            if self.adaptive and self.since_improvement % ADAPT_WINDOW < step:
+                self.scale = min(self.scale * ADAPT_FACTOR, MAX_SCALE)
+
+        if self.target is not None and best_fitness >= self.target - 1e-12:
+            self.reason = 'target'
+        elif self.stagnation and self.since_improvement >= self.stagnation:
+            self.reason = 'stagnation'
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.reason = 'time_budget'
+        elif self.min_diversity and diversity is not None and diversity() < self.min_diversity:
+            self.reason = 'diversity'
+        else:
+            return False
+        return True
+
+    def mutation_rate(self, rate):
+        return scaled_mutation_rate(rate, self.scale)
+
+    def crossover_rate(self, rate):
+        return scaled_crossover_rate(rate, self.scale)
+
+    def report(self):
+        return {
+            'reason': self.reason,
+            'generation': self.generation,
+            'seconds': time.perf_counter() - self.start,
+        }
+
+
+def from_params(params, target, deadline=None):
+    # Convergence dari parameter pipeline (lihat DEFAULT_PARAMS)
+    return Convergence(
+        target=target if params['stop_at_optimum'] else None,
+        stagnation=params['stagnation'],
+        deadline=deadline,
+        min_diversity=params['min_diversity'],
+        adaptive=bool(params['adaptive_rates']),
+    )
@@ -0,0 +1,28 @@
+# Modul aplikasi berada di root repositori (tanpa paket), jadi root
+# ditambahkan ke sys.path agar tes bisa mengimpornya langsung.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TEMPLATE_PATH = os.path.join(ROOT, 'Template Plot Ujian DSB.xlsx')
+
+
+@pytest.fixture(scope='session')
+def template_bytes():
+    with open(TEMPLATE_PATH, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='session', params=['template', 'kecil'])
+def workbook(request, template_bytes):
+    # Workbook input: template bawaan dan data sintetis 'kecil'
+    if request.param == 'template':
+        return template_bytes
+    from bench import PRESETS, synthetic_sheets, workbook_bytes
+    return workbook_bytes(synthetic_sheets(**PRESETS['kecil']))
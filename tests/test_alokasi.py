@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from alokasi import alokasi_mahasiswa
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from pipeline import DEFAULT_PARAMS, stage_ruang, stage_sesi
+
+
+def _baseline_alokasi_mahasiswa(jadwal_lengkap, df_makul):
+    # Alokasi kelas versi awal (ujiandsb.py sebelum KelasIndex), sebagai acuan
+    jadwal_updated = jadwal_lengkap.copy()
+    sisa_mahasiswa = {}
+    kelas_semester = {}
+    for mata_kuliah, group in df_makul.groupby('Mata Kuliah'):
+        sisa_mahasiswa[mata_kuliah] = group[['Kelas', 'Jumlah Mahasiswa']].set_index('Kelas').to_dict()['Jumlah Mahasiswa']
+        kelas_semester[mata_kuliah] = group[['Kelas', 'Semester']].set_index('Kelas').to_dict()['Semester']
+
+    for idx, row in jadwal_updated.iterrows():
+        mata_kuliah = row['Mata Kuliah']
+        ruangan_mahasiswa = row['Jumlah Mahasiswa']
+        if mata_kuliah not in sisa_mahasiswa:
+            continue
+        kelas_info = sisa_mahasiswa[mata_kuliah]
+        semester_info = kelas_semester[mata_kuliah]
+        kelas_assigned = []
+
+        found_exact_match = False
+        for kelas, jumlah_mahasiswa in list(kelas_info.items()):
+            if jumlah_mahasiswa == ruangan_mahasiswa and jumlah_mahasiswa > 0:
+                kelas_assigned.append(f"{semester_info[kelas]}{kelas} ({jumlah_mahasiswa})")
+                kelas_info[kelas] -= jumlah_mahasiswa
+                found_exact_match = True
+                break
+
+        if not found_exact_match:
+            for kelas, jumlah_mahasiswa in sorted(kelas_info.items(), key=lambda x: -x[1]):
+                if ruangan_mahasiswa == 0:
+                    break
+                if jumlah_mahasiswa > 0:
+                    semester = semester_info[kelas]
+                    if jumlah_mahasiswa <= ruangan_mahasiswa:
+                        kelas_assigned.append(f"{semester}{kelas} ({jumlah_mahasiswa})")
+                        ruangan_mahasiswa -= jumlah_mahasiswa
+                        kelas_info[kelas] -= jumlah_mahasiswa
+                    else:
+                        kelas_assigned.append(f"{semester}{kelas} ({ruangan_mahasiswa})")
+                        kelas_info[kelas] -= ruangan_mahasiswa
+                        ruangan_mahasiswa = 0
+
+        jadwal_updated.at[idx, 'Kelas'] = ", ".join(kelas_assigned)
+    return jadwal_updated
+
+
+@pytest.mark.parametrize('preset', ['kecil', 'sedang'])
+@pytest.mark.parametrize('ruang_solver', ['greedy', 'optimal'])
+def test_alokasi_matches_baseline(preset, ruang_solver):
+    instance = ProblemInstance(*synthetic_sheets(**PRESETS[preset]))
+    params = {**DEFAULT_PARAMS, 'generations': 10, 'ruang_solver': ruang_solver}
+    jadwal_dan_makul, _ = stage_sesi(instance, params)
+    jadwal, _ = stage_ruang(instance, jadwal_dan_makul, params)
+    jadwal = jadwal.reset_index(drop=True)
+
+    expected = _baseline_alokasi_mahasiswa(jadwal, instance.df_makul)['Kelas']
+    assert alokasi_mahasiswa(jadwal, instance.df_makul)['Kelas'].tolist() == expected.tolist()
+
+
+def test_alokasi_exact_match_and_split():
+    df_makul = pd.DataFrame({
+        'Mata Kuliah': ['A', 'A', 'A', 'B'],
+        'Semester': [3, 3, 3, 5],
+        'Kelas': ['A', 'B', 'C', 'A'],
+        'Jumlah Mahasiswa': [30, 25, 40, 10],
+    })
+    jadwal = pd.DataFrame({
+        'Mata Kuliah': ['A', 'A', 'A', 'B', 'X'],
+        'Jumlah Mahasiswa': [25, 50, 20, 10, 5],
+    })
+    expected = _baseline_alokasi_mahasiswa(jadwal, df_makul)['Kelas']
+    hasil = alokasi_mahasiswa(jadwal, df_makul)['Kelas']
+    assert hasil.tolist()[:4] == expected.tolist()[:4] == ['3B (25)', '3C (40), 3A (10)', '3A (20)', '5A (10)']
+    # Mata kuliah yang tidak ada di df_makul tidak dialokasikan
+    assert pd.isna(hasil.iloc[4]) and pd.isna(expected.iloc[4])
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from anneal import simulated_annealing
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from sesi import MAX_PER_SLOT, SesiProblem, fitness_function, generate_initial_population, slot_counts
+
+
+@pytest.fixture(scope='module')
+def instance():
+    return ProblemInstance(*synthetic_sheets(**PRESETS['sedang']))
+
+
+def _check(problem, individual, fitness):
+    assert (slot_counts(problem, individual[None]) <= MAX_PER_SLOT).all()
+    assert fitness == fitness_function(problem, individual[None])[0]
+
+
+def test_anneal_returns_valid_schedule_not_worse_than_start(instance):
+    problem = SesiProblem(instance)
+    start = fitness_function(problem, generate_initial_population(problem, 8, np.random.default_rng(3)))
+    best, fitness, history = simulated_annealing(problem, sweeps=20, n_chains=8, seed=3)
+    _check(problem, best, fitness)
+    assert fitness >= start.max()
+    assert fitness >= max(record['best_fitness'] for record in history)
+    assert len(history) == 20
+
+
+def test_anneal_keeps_fixed_genes(instance):
+    free = SesiProblem(instance)
+    fixed = generate_initial_population(free, 1, np.random.default_rng(4))[0]
+    fixed[::2] = -1
+    problem = SesiProblem(instance, fixed)
+    best, fitness, _ = simulated_annealing(problem, sweeps=10, n_chains=4, seed=4)
+    _check(problem, best, fitness)
+    pinned = fixed >= 0
+    np.testing.assert_array_equal(best[pinned], fixed[pinned])
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import bench
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+
+STAGES = ['input', 'sesi', 'ruang', 'pengawas', 'alokasi']
+
+
+def test_synthetic_sheets_are_seeded():
+    first, again, other = (synthetic_sheets(**PRESETS['kecil'], seed=seed) for seed in (3, 3, 4))
+    for a, b in zip(first, again):
+        assert_frame_equal(a, b)
+    assert not all(a.equals(b) for a, b in zip(first, other))
+
+
+@pytest.mark.parametrize('preset', sorted(PRESETS))
+def test_synthetic_sheets_match_preset_size(preset):
+    size = PRESETS[preset]
+    instance = ProblemInstance(*synthetic_sheets(**size))
+    assert instance.n_sesi == size['n_sessions']
+    assert instance.n_ruang == size['n_rooms']
+    assert instance.n_makul == size['n_courses'] - 2
+    assert instance.n_dosen <= size['n_lecturers']
+
+
+def test_run_stages_reports_every_stage():
+    data = bench.workbook_bytes(synthetic_sheets(**PRESETS['kecil']))
+    stages, size = bench.run_stages(data, {'generations': 5, 'pengawas_generations': 5}, memory=False)
+    assert list(stages) == STAGES
+    assert all(metrics['wall_s'] >= 0 and metrics['peak_mb'] is None for metrics in stages.values())
+    for stage in ('sesi', 'pengawas'):
+        assert stages[stage]['generations'] <= 5
+        assert 'fitness' in stages[stage] and 'stop' in stages[stage]
+    assert size['n_makul'] == PRESETS['kecil']['n_courses'] - 2
+
+
+def test_main_writes_and_compares_results(tmp_path, capsys):
+    output = str(tmp_path / 'bench.jsonl')
+    argv = ['--preset', 'kecil', '--no-memory', '--generations', '5', '--pengawas-generations', '5',
+            '--output', output]
+    assert bench.main(argv) == 0
+    assert bench.main(argv + ['--compare', output]) == 0
+
+    with open(output) as f:
+        records = [json.loads(line) for line in f]
+    assert [record['name'] for record in records] == ['kecil-0', 'kecil-0']
+    assert list(records[0]['stages']) == STAGES
+    assert bench.load_baseline(output, 'kecil-0') == records[1]
+    assert ' x' in capsys.readouterr().out
+
+
+def test_main_rejects_unknown_engine(capsys):
+    assert bench.main(['--engines', 'ga,tidak-ada']) == 2
+    assert 'tidak-ada' in capsys.readouterr().err
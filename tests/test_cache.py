@@ -0,0 +1,67 @@
+import threading
+import time
+
+from cache import ResultCache, content_key
+
+
+def test_content_key_depends_on_data_and_params():
+    key = content_key(b'isi', seed=1, generations=100)
+    assert key == content_key(b'isi', generations=100, seed=1)
+    assert key != content_key(b'isi', seed=2, generations=100)
+    assert key != content_key(b'lain', seed=1, generations=100)
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    cache = ResultCache(max_entries=1, disk_dir=str(tmp_path), max_disk_entries=2)
+    for i, key in enumerate('abc'):
+        cache.put(key, {'hasil': i})
+        time.sleep(0.01)
+    assert len(list(tmp_path.glob('*.pkl'))) == 2
+
+    fresh = ResultCache(disk_dir=str(tmp_path))
+    assert fresh.get('a') is None
+    assert fresh.get('b') == {'hasil': 1}
+    assert fresh.get('c') == {'hasil': 2}
+
+
+def test_get_or_compute_counts_hits_and_misses():
+    cache = ResultCache()
+    assert cache.get_or_compute('k', lambda: 'nilai') == 'nilai'
+    assert cache.get_or_compute('k', lambda: 'lain') == 'nilai'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_concurrent_requests_compute_once():
+    cache = ResultCache()
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return 'hasil'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+               for _ in range(4)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['hasil'] * 4
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (3, 1)
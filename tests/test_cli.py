@@ -0,0 +1,16 @@
+import shutil
+
+import pytest
+
+from cli import main
+from conftest import TEMPLATE_PATH
+
+
+def test_previous_rejected_for_several_inputs(tmp_path, capsys):
+    for name in ('a.xlsx', 'b.xlsx'):
+        shutil.copy(TEMPLATE_PATH, tmp_path / name)
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path), '--previous', str(tmp_path / 'a.xlsx'), '-o', str(tmp_path / 'out')])
+    assert excinfo.value.code == 2
+    assert '--previous' in capsys.readouterr().err
+    assert not (tmp_path / 'out').exists()
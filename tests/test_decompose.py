@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from alokasi import alokasi_mahasiswa
+from bench import PRESETS, synthetic_sheets, workbook_bytes
+from decompose import allocate_classes, assign_supervisors, pack_rooms
+from instance import ProblemInstance
+from pengawas import PengawasProblem, SupervisorLoad, solve_flow
+from pipeline import DEFAULT_PARAMS, read_input, stage_pengawas, stage_ruang, stage_sesi
+from ruang import generate_schedule, optimize_schedule
+
+PARAMS = {**DEFAULT_PARAMS, 'generations': 20, 'pengawas_generations': 20}
+
+
+@pytest.fixture(scope='module')
+def stages():
+    # Keluaran tahap sesi/ruang/pengawas serial untuk data sintetis 'sedang'
+    instance = ProblemInstance(*read_input(workbook_bytes(synthetic_sheets(**PRESETS['sedang'])), cache_dir=None))
+    jadwal_dan_makul, _ = stage_sesi(instance, PARAMS)
+    jadwal_makul_dan_ruang, _ = stage_ruang(instance, jadwal_dan_makul, PARAMS)
+    jadwal_lengkap, _, _ = stage_pengawas(instance, jadwal_makul_dan_ruang, PARAMS)
+    return instance, jadwal_dan_makul, jadwal_makul_dan_ruang, jadwal_lengkap
+
+
+def _df_jadwal_ruang(instance, jadwal_makul_dan_ruang):
+    df = jadwal_makul_dan_ruang[['Hari', 'Waktu', 'Mata Kuliah', 'Ruang']].copy()
+    df['Dosen Pengampu'] = instance.makul_pengampu[pd.Index(instance.makul).get_indexer(df['Mata Kuliah'])]
+    return df
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_pack_rooms_matches_serial(stages, workers):
+    instance, jadwal_dan_makul, _, _ = stages
+    expected, expected_info = optimize_schedule(jadwal_dan_makul, instance)
+    schedule, info = pack_rooms(instance, jadwal_dan_makul, 'optimal', workers)
+    assert_frame_equal(schedule, expected)
+    assert info == expected_info
+
+    schedule, _ = pack_rooms(instance, jadwal_dan_makul, 'greedy', workers)
+    assert_frame_equal(schedule, generate_schedule(jadwal_dan_makul, instance))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_allocate_classes_matches_serial(stages, workers):
+    instance, _, _, jadwal_lengkap = stages
+    expected = alokasi_mahasiswa(jadwal_lengkap, instance.df_makul)
+    assert_frame_equal(allocate_classes(jadwal_lengkap, instance.df_makul, workers), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('solver', ['ga', 'flow'])
+def test_assign_supervisors_serial_and_parallel_agree(stages, solver):
+    instance, _, jadwal_makul_dan_ruang, _ = stages
+    df_jadwal = _df_jadwal_ruang(instance, jadwal_makul_dan_ruang)
+    params = {**PARAMS, 'pengawas_solver': solver}
+    _, serial, _ = assign_supervisors(instance, df_jadwal, params, workers=1)
+    problem, parallel, _ = assign_supervisors(instance, df_jadwal, params, workers=2)
+    np.testing.assert_array_equal(parallel, serial)
+
+    # Setiap baris mendapat jumlah pengawas yang diminta, tanpa bentrok slot
+    assert ((parallel >= 0).sum(axis=1) == problem.required).all()
+    for slot in range(problem.n_slot):
+        ids = parallel[problem.rows_of_slot[slot]]
+        ids = ids[ids >= 0]
+        assert len(ids) == len(np.unique(ids))
+
+
+def test_assign_supervisors_flow_is_optimal(stages):
+    # Flow per hari + balance mencapai optimum flow global
+    instance, _, jadwal_makul_dan_ruang, _ = stages
+    df_jadwal = _df_jadwal_ruang(instance, jadwal_makul_dan_ruang)
+    problem, individual, _ = assign_supervisors(instance, df_jadwal, {**PARAMS, 'pengawas_solver': 'flow'}, workers=1)
+    expected = SupervisorLoad(problem, solve_flow(PengawasProblem(instance, df_jadwal))[None]).fitness()[0]
+    assert SupervisorLoad(problem, individual[None]).fitness()[0] == pytest.approx(expected)
@@ -0,0 +1,39 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from export import export, to_excel
+
+JADWAL = pd.DataFrame({
+    'Hari': ['Senin', 'Senin', 'Selasa'],
+    'Waktu': ['07.30 - 09.30', '10.00 - 12.00', '07.30 - 09.30'],
+    'Mata Kuliah': ['A', np.nan, 'B'],
+    'Jumlah Mahasiswa': [30, np.nan, 12],
+})
+REKAP = pd.DataFrame({'Senin': [1, 0], 'Selasa': [0, 1]}, index=['D1', 'D2'])
+
+
+def test_excel_round_trip():
+    sheets = pd.read_excel(io.BytesIO(to_excel(JADWAL, REKAP, split='hari')), sheet_name=None, index_col=None)
+    assert list(sheets) == ['Jadwal', 'Rekap Jaga', 'Senin', 'Selasa']
+    assert_frame_equal(sheets['Jadwal'], JADWAL, check_dtype=False)
+    assert_frame_equal(sheets['Rekap Jaga'].set_index('Unnamed: 0').rename_axis(None), REKAP)
+    assert len(sheets['Senin']) == 2
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet'])
+def test_single_table_round_trip_matches_excel(fmt):
+    read = {'csv': pd.read_csv, 'parquet': pd.read_parquet}[fmt]
+    table = read(io.BytesIO(export(JADWAL, REKAP, fmt)))
+    excel = pd.read_excel(io.BytesIO(export(JADWAL, REKAP, 'xlsx')), sheet_name='Jadwal')
+    assert_frame_equal(table, excel, check_dtype=False)
+    assert_frame_equal(table, JADWAL, check_dtype=False)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet'])
+def test_split_rejected_for_single_table_formats(fmt):
+    with pytest.raises(ValueError):
+        export(JADWAL, REKAP, fmt, split='hari')
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from pengawas import PengawasProblem, SupervisorLoad, generate_schedule, mutate as mutate_pengawas
+import sesi
+from anneal import simulated_annealing
+from sesi import FitnessState, SesiProblem, fitness_function, generate_initial_population, max_fitness, mutate
+
+
+@pytest.fixture(scope='module')
+def instance():
+    return ProblemInstance(*synthetic_sheets(**PRESETS['sedang']))
+
+
+def test_fitness_state_matches_full_evaluation(instance):
+    problem = SesiProblem(instance)
+    rng = np.random.default_rng(1)
+    population = generate_initial_population(problem, 40, rng)
+    state = FitnessState(problem, population)
+    for _ in range(30):
+        mutate(problem, population, 0.5, rng, state)
+        np.testing.assert_array_equal(state.fitness, fitness_function(problem, population))
+
+
+def test_fitness_state_delta_matches_apply(instance):
+    problem = SesiProblem(instance)
+    rng = np.random.default_rng(2)
+    population = generate_initial_population(problem, 20, rng)
+    state = FitnessState(problem, population)
+    rows = np.arange(20)
+    genes = rng.integers(0, problem.n_makul, size=20)
+    new_sesi = rng.integers(0, problem.n_sesi, size=20)
+    old_sesi = population[rows, genes]
+    delta = state.delta(rows, old_sesi, new_sesi, genes)
+    before = fitness_function(problem, population)
+    population[rows, genes] = new_sesi
+    np.testing.assert_array_equal(fitness_function(problem, population) - before, delta)
+
+
+def _pair_clashes(instance, individual):
+    # Referensi per pasangan mata kuliah: bentrok slot = semester sama + dosen
+    # bersama di slot yang sama, bentrok hari = semester sama di hari yang sama
+    slot = instance.sesi_slot[individual]
+    day = instance.sesi_hari[individual]
+    dosen = [set(instance.pengampu_ids(m)) for m in range(instance.n_makul)]
+    slot_clash = day_clash = 0
+    for a in range(instance.n_makul):
+        for b in range(a + 1, instance.n_makul):
+            same_sem = int(instance.makul_sem[a] == instance.makul_sem[b])
+            if slot[a] == slot[b]:
+                slot_clash += same_sem + len(dosen[a] & dosen[b])
+            if day[a] == day[b]:
+                day_clash += same_sem
+    return slot_clash, day_clash
+
+
+def test_clash_penalties_match_pair_reference(instance, monkeypatch):
+    problem = SesiProblem(instance)
+    population = generate_initial_population(problem, 5, np.random.default_rng(5))
+    state = FitnessState(problem, population)
+    reference = np.array([_pair_clashes(instance, individual) for individual in population])
+    np.testing.assert_array_equal(state.slot_clash, reference[:, 0])
+    np.testing.assert_array_equal(state.day_clash, reference[:, 1])
+
+    monkeypatch.setattr(sesi, 'CLASH_SLOT_PENALTY', 0)
+    monkeypatch.setattr(sesi, 'CLASH_DAY_PENALTY', 0)
+    without_clash = fitness_function(problem, population)
+    monkeypatch.undo()
+    expected = (without_clash - sesi.CLASH_SLOT_PENALTY * reference[:, 0]
+                - sesi.CLASH_DAY_PENALTY * reference[:, 1])
+    np.testing.assert_array_equal(fitness_function(problem, population), expected)
+
+
+def test_swap_delta_matches_full_evaluation(instance):
+    problem = SesiProblem(instance)
+    rng = np.random.default_rng(6)
+    population = generate_initial_population(problem, 30, rng)
+    state = FitnessState(problem, population)
+    for _ in range(20):
+        rows = np.arange(30)
+        genes_a = rng.integers(0, problem.n_makul, size=30)
+        genes_b = rng.integers(0, problem.n_makul, size=30)
+        sesi_a, sesi_b = population[rows, genes_a], population[rows, genes_b]
+        delta = state.swap_delta(rows, sesi_a, sesi_b, genes_a, genes_b)
+        before = fitness_function(problem, population)
+        applied = state.apply(rows, sesi_a, sesi_b, genes_a)
+        population[rows, genes_a] = sesi_b
+        applied += state.apply(rows, sesi_b, sesi_a, genes_b)
+        population[rows, genes_b] = sesi_a
+        np.testing.assert_array_equal(fitness_function(problem, population) - before, delta)
+        np.testing.assert_array_equal(applied, delta)
+        np.testing.assert_array_equal(state.fitness, fitness_function(problem, population))
+
+
+def test_max_fitness_is_an_upper_bound(instance):
+    problem = SesiProblem(instance)
+    population = generate_initial_population(problem, 200, np.random.default_rng(7))
+    bound = max_fitness(problem)
+    assert fitness_function(problem, population).max() <= bound
+    # Pada data 'sedang' batas ini tercapai
+    _, best_fitness, _ = simulated_annealing(problem, sweeps=100, n_chains=100, seed=0)
+    assert best_fitness == bound
+
+
+def _full_fitness(problem, individual):
+    # Perhitungan penuh dari kolom Pengawas, seperti sebelum SupervisorLoad
+    count = {dosen: 0 for dosen in problem.dosen_all}
+    for pengawas in problem.decode(individual):
+        for p in pengawas.split(', '):
+            count[p] += 1
+    return 1 / (1 + np.std(list(count.values())))
+
+
+def test_supervisor_load_matches_full_recompute(instance):
+    rng = np.random.default_rng(3)
+    rooms = instance.df_ruang['Ruang'].to_numpy()
+    df_jadwal = pd.DataFrame({
+        'Hari': np.repeat(instance.hari[:3], 4),
+        'Waktu': np.tile(['08.00', '08.00', '10.00', '10.00'], 3),
+        'Mata Kuliah': rng.choice(instance.makul, size=12),
+        'Ruang': np.tile(rooms[:2], 6),
+    })
+    problem = PengawasProblem(instance, df_jadwal)
+    population = np.stack([generate_schedule(problem, rng) for _ in range(10)])
+    load = SupervisorLoad(problem, population)
+    for _ in range(20):
+        mutate_pengawas(problem, population, load, rng, n_rows=2)
+        expected = [_full_fitness(problem, individual) for individual in population]
+        np.testing.assert_allclose(load.fitness(), expected)
@@ -0,0 +1,26 @@
+import io
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from ingest import SHEETS, InputError, read_workbook
+
+
+def test_read_workbook_matches_read_excel(workbook):
+    expected = pd.read_excel(io.BytesIO(workbook), sheet_name=list(SHEETS))
+    for name, df in zip(SHEETS, read_workbook(workbook)):
+        assert_frame_equal(df, expected[name], obj=name)
+
+
+def test_missing_sheet_is_reported():
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        pd.DataFrame({'Hari': ['Senin'], 'Jam': ['08.00']}).to_excel(writer, sheet_name='Sesi', index=False)
+    with pytest.raises(InputError, match='Ruangan'):
+        read_workbook(output.getvalue())
+
+
+def test_not_a_workbook():
+    with pytest.raises(InputError):
+        read_workbook(b'bukan xlsx')
@@ -0,0 +1,33 @@
+import pytest
+
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+
+
+@pytest.fixture
+def instance():
+    return ProblemInstance(*synthetic_sheets(**PRESETS['kecil']))
+
+
+def test_frames_are_copies(instance):
+    df_makul = instance.df_makul
+    df_makul.loc[:, 'Jumlah Mahasiswa'] = 0
+    df_makul.drop(columns='Kelas', inplace=True)
+    assert 'Kelas' in instance.df_makul
+    assert (instance.df_makul['Jumlah Mahasiswa'] > 0).all()
+
+
+def test_input_frames_are_not_shared():
+    sheets = synthetic_sheets(**PRESETS['kecil'])
+    instance = ProblemInstance(*sheets)
+    sheets[1].loc[:, 'Kapasitas'] = 0
+    assert (instance.df_ruang['Kapasitas'] > 0).all()
+
+
+def test_arrays_and_attributes_are_frozen(instance):
+    with pytest.raises(ValueError):
+        instance.ruang_capacity[0] = 0
+    with pytest.raises(AttributeError):
+        instance.n_makul = 0
+    with pytest.raises(AttributeError):
+        instance.df_makul = None
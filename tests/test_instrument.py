@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from bench import PRESETS, synthetic_sheets, workbook_bytes
+from instrument import Instrument
+from pipeline import run_pipeline
+
+
+def test_stage_times_and_emits_even_on_error():
+    events = []
+    instrument = Instrument(lambda event, stage, record: events.append((event, stage, record)))
+    with instrument.stage('sesi'):
+        pass
+    with pytest.raises(RuntimeError):
+        with instrument.stage('ruang'):
+            raise RuntimeError
+    assert list(instrument.timings) == ['sesi', 'ruang']
+    assert [(event, stage) for event, stage, _ in events] == [
+        ('stage_start', 'sesi'), ('stage_end', 'sesi'), ('stage_start', 'ruang'), ('stage_end', 'ruang')]
+    assert events[1][2] == {'seconds': instrument.timings['sesi']}
+
+
+def test_history_forwards_generations_and_sums_repairs():
+    events = []
+    instrument = Instrument(lambda event, stage, record: events.append((event, stage, record)))
+    history = instrument.history('sesi')
+    history.append({'generation': 1, 'best_fitness': -3, 'repairs': 2})
+    history.append({'generation': 2, 'best_fitness': -1, 'repairs': 1})
+    instrument.history('pengawas').append({'generation': 1, 'best_fitness': 0.5})
+
+    assert len(history) == 2 and history[1]['generation'] == 2
+    assert [(event, stage) for event, stage, _ in events] == [('generation', 'sesi')] * 2 + [('generation', 'pengawas')]
+    metrics = instrument.to_dict()
+    assert metrics['repairs'] == {'sesi': 3, 'pengawas': 0}
+    assert metrics['generations'][0] == {'stage': 'sesi', 'generation': 1, 'best_fitness': -3, 'repairs': 2}
+    assert json.loads(instrument.to_json()) == metrics
+    assert instrument.to_csv().splitlines()[0] == 'stage,generation,best_fitness,repairs'
+
+
+def test_profile_report_only_when_profiling():
+    assert Instrument().profile_report() == ''
+    instrument = Instrument(profile=True)
+    with instrument.profiling():
+        sorted(range(1000))
+    assert 'function calls' in instrument.profile_report()
+
+
+def test_pipeline_reports_stages_and_generations():
+    events = []
+    instrument = Instrument(lambda event, stage, record: events.append((event, stage, record)))
+    data = workbook_bytes(synthetic_sheets(**PRESETS['kecil']))
+    hasil = run_pipeline(data, {'generations': 5, 'pengawas_generations': 5, 'stop_at_optimum': 0},
+                         instrument=instrument)
+
+    stages = ['input', 'sesi', 'ruang', 'pengawas', 'alokasi', 'export']
+    assert [stage for event, stage, _ in events if event == 'stage_start'] == stages
+    assert list(instrument.timings) == stages
+    generations = [(stage, record['generation']) for event, stage, record in events if event == 'generation']
+    assert generations == [(record['stage'], record['generation']) for record in instrument.generations]
+    assert {stage for stage, _ in generations} == {'sesi', 'pengawas'}
+    assert hasil['metrics'] == instrument.to_dict()
@@ -0,0 +1,38 @@
+from island import run_islands
+from stopping import ADAPT_FACTOR, Convergence
+
+
+class FlatEngine:
+    # Pulau tanpa perbaikan fitness; mencatat skala laju yang diterima
+    def __init__(self, diversity=1.0):
+        self.diversity = diversity
+        self.scales = []
+
+    def init(self, seed):
+        return {'best_individual': seed, 'best_fitness': 0.0, 'diversity': self.diversity}
+
+    def evolve(self, island, generations, scale=1.0):
+        self.scales.append(scale)
+        return island
+
+    def emigrants(self, island, n):
+        return []
+
+    def immigrate(self, island, migrants):
+        pass
+
+
+def test_min_diversity_stops_islands():
+    convergence = Convergence(min_diversity=0.5)
+    run_islands(FlatEngine(diversity=0.1), 2, generations=50, migration_interval=5, max_workers=1,
+                convergence=convergence)
+    assert convergence.reason == 'diversity'
+    assert convergence.generation == 5
+
+
+def test_adaptive_scale_reaches_islands():
+    engine = FlatEngine()
+    convergence = Convergence(adaptive=True)
+    run_islands(engine, 2, generations=20, migration_interval=5, max_workers=1, convergence=convergence)
+    # Epoch pertama memperbaiki fitness (-inf -> 0), setelah itu stagnasi
+    assert engine.scales == [1.0, 1.0, 1.0, 1.0, ADAPT_FACTOR, ADAPT_FACTOR, ADAPT_FACTOR ** 2, ADAPT_FACTOR ** 2]
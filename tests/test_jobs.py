@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from bench import PRESETS, synthetic_sheets, workbook_bytes
+from cache import ResultCache
+from jobs import CANCELLED, DONE, FINISHED, RUNNING, JobManager
+
+DATA = workbook_bytes(synthetic_sheets(**PRESETS['kecil']))
+PARAMS = {'generations': 10, 'pengawas_generations': 10}
+
+
+def _wait(predicate, timeout=120):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.05)
+
+
+@pytest.fixture(scope='module')
+def manager():
+    manager = JobManager(max_workers=1, cache=ResultCache())
+    yield manager
+    manager.shutdown()
+
+
+def test_submit_and_poll(manager):
+    job = manager.submit(DATA, PARAMS)
+    assert job.id == manager.job_id(DATA, PARAMS)
+    assert manager.submit(DATA, PARAMS) is job
+    _wait(lambda: job.status in FINISHED)
+
+    assert job.status == DONE, job.error
+    assert job.progress == 1.0
+    assert job.result['excel'][:2] == b'PK'
+    assert manager.get(job.id) is job
+    # Hasil masuk cache: manager baru langsung selesai tanpa worker
+    fresh = JobManager(max_workers=1, cache=manager.cache)
+    cached = fresh.submit(DATA, PARAMS)
+    assert cached.status == DONE and cached.future is None
+
+
+def test_progress_events_reach_the_job(manager):
+    params = {**PARAMS, 'seed': 1}
+    job = manager.submit(DATA, params)
+    progress = []
+    while job.status not in FINISHED:
+        progress.append(job.progress)
+        time.sleep(0.01)
+    assert job.status == DONE, job.error
+    assert progress == sorted(progress)
+    # Semua rekaman per generasi yang dikirim worker akhirnya diterima
+    expected = job.result['metrics']['generations']
+    _wait(lambda: len(job.generations) == len(expected), timeout=10)
+    assert job.generations == expected
+
+
+def test_profile_report_returned_with_result(manager):
+    job = manager.submit(DATA, PARAMS, profile=True)
+    assert job.id.endswith('-profil')
+    _wait(lambda: job.status in FINISHED)
+    assert job.status == DONE, job.error
+    assert 'function calls' in job.result['profile']
+
+
+def test_cancel_running_and_pending(manager):
+    running = manager.submit(DATA, {**PARAMS, 'generations': 100000})
+    pending = manager.submit(DATA, {**PARAMS, 'generations': 100001})
+    _wait(lambda: running.status == RUNNING)
+    pending.cancel()
+    running.cancel()
+    _wait(lambda: running.status in FINISHED and pending.status in FINISHED)
+    assert running.status == CANCELLED
+    assert pending.status == CANCELLED
+    assert running.result is None and pending.result is None
+    # Job yang dibatalkan boleh dikirim ulang
+    assert manager.submit(DATA, {**PARAMS, 'generations': 100000}) is not running
+    manager.cancel(running.id)
@@ -0,0 +1,90 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from instance import ProblemInstance
+from mincostflow import MinCostFlow
+from pengawas import PengawasProblem, clashes, solve_flow
+
+
+def _instance(n_dosen=5):
+    dosen = [f'D{d}' for d in range(n_dosen)]
+    df_sesi = pd.DataFrame({'Hari': ['Senin', 'Senin', 'Selasa'], 'Jam': ['08.00', '10.00', '08.00']})
+    df_ruang = pd.DataFrame({'Ruang': ['R1', 'R2', 'R3'], 'Jumlah Pengawas': [1, 2, 1],
+                             'Kapasitas': [30, 60, 30], 'Lab': [None, None, 'y']})
+    df_makul = pd.DataFrame({
+        'Mata Kuliah': ['A', 'B', 'C', 'D'],
+        'Semester': [1, 3, 5, 7],
+        'Dosen Pengampu': [dosen[0], f'{dosen[0]}, {dosen[1]}', dosen[2], dosen[-1]],
+        'Kelas': ['A'] * 4,
+        'Jumlah Mahasiswa': [30] * 4,
+    })
+    return ProblemInstance(df_sesi, df_ruang, df_makul, pd.DataFrame({'Tidak Ujian': []}),
+                           pd.DataFrame({'Butuh Lab': []}))
+
+
+JADWAL = pd.DataFrame({
+    'Hari': ['Senin', 'Senin', 'Senin', 'Senin', 'Selasa', 'Selasa'],
+    'Waktu': ['08.00', '08.00', '10.00', '10.00', '08.00', '08.00'],
+    'Mata Kuliah': ['A', 'B', 'B', 'C', 'D', 'A'],
+    'Ruang': ['R1', 'R2', 'R1', 'R3', 'R2', 'R3'],
+})
+
+
+def _objective(problem, individual):
+    # (jumlah kuadrat beban, jumlah pengawas bukan pengampu): urutan prioritas solve_flow
+    load = np.bincount(individual[individual >= 0], minlength=problem.n_dosen)
+    outsiders = sum(not problem.pengampu_mask[r] >> int(d) & 1
+                    for r in range(problem.n_rows) for d in individual[r][individual[r] >= 0])
+    return int((load ** 2).sum()), outsiders
+
+
+def _brute_force(problem):
+    choices = []
+    for r in range(problem.n_rows):
+        if problem.fixed is not None and problem.fixed[r, 0] >= 0:
+            choices.append([tuple(problem.fixed[r][problem.fixed[r] >= 0])])
+        else:
+            choices.append(list(itertools.combinations(range(problem.n_dosen), int(problem.required[r]))))
+    best = None
+    for rows in itertools.product(*choices):
+        individual = np.full((problem.n_rows, problem.max_pengawas), -1, dtype=np.intp)
+        for r, ids in enumerate(rows):
+            individual[r, :len(ids)] = ids
+        if clashes(problem, individual):
+            continue
+        objective = _objective(problem, individual)
+        if best is None or objective < best:
+            best = objective
+    return best
+
+
+@pytest.mark.parametrize('n_dosen', [3, 4, 5])
+def test_solve_flow_is_optimal_without_clashes(n_dosen):
+    problem = PengawasProblem(_instance(n_dosen), JADWAL)
+    individual = solve_flow(problem)
+    assert clashes(problem, individual) == 0
+    assert ((individual >= 0).sum(axis=1) == problem.required).all()
+    assert _objective(problem, individual) == _brute_force(problem)
+
+
+def test_solve_flow_keeps_fixed_rows():
+    fixed = np.full((len(JADWAL), 2), -1, dtype=np.intp)
+    fixed[1] = [0, 1]
+    problem = PengawasProblem(_instance(4), JADWAL, fixed)
+    individual = solve_flow(problem)
+    np.testing.assert_array_equal(individual[1], [0, 1])
+    assert clashes(problem, individual) == 0
+    assert _objective(problem, individual) == _brute_force(problem)
+
+
+def test_min_cost_flow_small_graph():
+    # Dua jalur s-t: biaya 1 (kapasitas 2) dan biaya 3 (kapasitas 2)
+    graph = MinCostFlow(4)
+    graph.add_edge(0, 1, 2, 1)
+    graph.add_edge(0, 2, 2, 3)
+    graph.add_edge(1, 3, 2)
+    graph.add_edge(2, 3, 2)
+    assert graph.solve(0, 3, 3) == (3, 5)
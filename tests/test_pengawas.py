@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from pengawas import (PengawasProblem, _mask_ids, _to_mask, assign_pengawas, clashes, count_supervisions_per_day,
+                      generate_schedule)
+
+
+@pytest.fixture(scope='module')
+def problem():
+    instance = ProblemInstance(*synthetic_sheets(**PRESETS['sedang']))
+    rooms = instance.df_ruang['Ruang'].to_numpy()
+    rng = np.random.default_rng(0)
+    df_jadwal = pd.DataFrame({
+        'Hari': np.repeat(instance.hari[:3], 6),
+        'Waktu': np.tile(np.repeat(['08.00', '10.00'], 3), 3),
+        'Mata Kuliah': rng.choice(instance.makul, size=18),
+        'Ruang': np.tile(rooms[:3], 6),
+    })
+    return PengawasProblem(instance, df_jadwal)
+
+
+def test_generate_schedule_fills_rows_without_clashes(problem):
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        individual = generate_schedule(problem, rng)
+        np.testing.assert_array_equal((individual >= 0).sum(axis=1), problem.required)
+        assert clashes(problem, individual) == 0
+
+
+def test_encode_decode_round_trip(problem):
+    individual = generate_schedule(problem, np.random.default_rng(2))
+    column = problem.decode(individual)
+    assert all(len(pengawas.split(', ')) == n for pengawas, n in zip(column, problem.required))
+    np.testing.assert_array_equal(problem.encode(column), individual)
+
+
+@pytest.mark.parametrize('ids', [[], [0], [3, 1, 64], list(range(0, 200, 7))])
+def test_mask_round_trip(ids):
+    mask = _to_mask(ids)
+    assert mask.bit_count() == len(ids)
+    assert _mask_ids(mask) == sorted(ids)
+
+
+def test_assign_pengawas_prefers_free_pengampu(problem):
+    rng = np.random.default_rng(3)
+    for r in range(problem.n_rows):
+        pengampu = set(_mask_ids(problem.pengampu_mask[r]))
+        # Pengampu yang sibuk tidak boleh dipilih; sisanya dipakai jika cukup
+        busy = _to_mask(sorted(pengampu)[:1])
+        selected, new_busy = assign_pengawas(problem, r, busy, rng)
+        selected = set(selected.tolist())
+        assert len(selected) == problem.required[r]
+        assert not selected & set(_mask_ids(busy))
+        assert new_busy == busy | _to_mask(selected)
+        if len(pengampu) - 1 >= problem.required[r]:
+            assert selected <= pengampu
+
+
+def test_assign_pengawas_falls_back_to_other_dosen(problem):
+    rng = np.random.default_rng(4)
+    r = 0
+    busy = problem.pengampu_mask[r]
+    selected, _ = assign_pengawas(problem, r, busy, rng)
+    assert len(selected) == problem.required[r]
+    assert not set(selected.tolist()) & set(_mask_ids(busy))
+
+
+def _count_reference(schedule, dosen_all):
+    # Implementasi iterrows sebelumnya
+    counts = {dosen: {hari: 0 for hari in schedule['Hari'].unique()} for dosen in dosen_all}
+    for _, row in schedule.iterrows():
+        for pengawas in row['Pengawas'].split(', '):
+            if pengawas in counts:
+                counts[pengawas][row['Hari']] += 1
+    return pd.DataFrame(counts).transpose()
+
+
+@pytest.mark.parametrize('n_rows', [0, 1, 40])
+def test_count_supervisions_matches_iterrows(n_rows):
+    rng = np.random.default_rng(n_rows)
+    dosen_all = np.array([f'D{i}' for i in range(8)], dtype=object)
+    names = list(dosen_all) + ['Luar']
+    schedule = pd.DataFrame({
+        'Hari': rng.choice(['Senin', 'Selasa', 'Rabu'], size=n_rows),
+        'Pengawas': [', '.join(rng.choice(names, size=rng.integers(1, 4), replace=False)) for _ in range(n_rows)],
+    })
+    expected = _count_reference(schedule, dosen_all)
+    actual = count_supervisions_per_day(schedule, dosen_all)
+    assert list(actual.index) == list(dosen_all)
+    assert list(actual.columns) == list(schedule['Hari'].unique())
+    if n_rows:
+        assert_frame_equal(actual, expected, check_dtype=False, check_index_type=False, check_column_type=False)
+    assert actual.to_numpy().sum() == sum(p in set(dosen_all) for ps in schedule['Pengawas'] for p in ps.split(', '))
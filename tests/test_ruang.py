@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from pipeline import DEFAULT_PARAMS, stage_sesi
+from ruang import SPLIT_COST, UNPLACED_PENALTY, RoomScorer, _pack_slot, fitness, generate_schedule
+
+ROOMS = np.array(['A', 'B', 'C'])
+CAPACITY = np.array([30, 20, 10])
+IS_LAB = np.array([False, True, False])
+
+
+@pytest.mark.parametrize('courses', [
+    [('X', 25, False)],
+    [('X', 40, False), ('Y', 15, True)],
+    # Ruang tidak cukup untuk satu mata kuliah / untuk seluruh slot
+    [('X', 80, False)],
+    [('X', 50, False), ('Y', 25, False)],
+])
+def test_pack_slot_cost_not_below_lower_bound(courses):
+    _, cost, lower_bound = _pack_slot(courses, ROOMS, CAPACITY, IS_LAB)
+    assert cost >= lower_bound
+
+
+def test_pack_slot_uncovered_course_is_tight():
+    _, cost, lower_bound = _pack_slot([('X', 80, False)], ROOMS, CAPACITY, IS_LAB)
+    assert cost == lower_bound == 2 * SPLIT_COST + 20 * UNPLACED_PENALTY
+
+
+def _baseline_generate_schedule(df_makul, df_ruang, df_butuh_lab):
+    # Penempatan greedy versi awal (ujiandsb.py sebelum RoomIndex), sebagai acuan
+    schedule = []
+    df_ruang_lab = df_ruang[df_ruang['Lab'] == 'y'].sort_values(by='Kapasitas', ascending=False).copy()
+    df_ruang_non_lab = df_ruang[df_ruang['Lab'] != 'y'].sort_values(by='Kapasitas', ascending=False).copy()
+
+    def fill(rooms, hari, jam, mata_kuliah, remaining_students):
+        for _, room_row in rooms.iterrows():
+            if remaining_students <= 0:
+                break
+            if [s for s in schedule if s[0] == hari and s[1] == jam and s[4] == room_row['Ruang']]:
+                continue
+            students_assigned = min(remaining_students, room_row['Kapasitas'])
+            remaining_students -= students_assigned
+            if students_assigned > 0:
+                schedule.append([hari, jam, mata_kuliah, 'Gabungan', room_row['Ruang'], students_assigned,
+                                 room_row['Kapasitas']])
+        return remaining_students
+
+    for (hari, jam, mata_kuliah), group in df_makul.groupby(['Hari', 'Jam', 'Mata Kuliah']):
+        remaining_students = group['Jumlah Mahasiswa'].sum()
+        lab_needed = mata_kuliah in df_butuh_lab['Butuh Lab'].values
+        first, second = (df_ruang_lab, df_ruang_non_lab) if lab_needed else (df_ruang_non_lab, df_ruang_lab)
+        remaining_students = fill(first, hari, jam, mata_kuliah, remaining_students)
+        if remaining_students > 0:
+            fill(second, hari, jam, mata_kuliah, remaining_students)
+
+    return pd.DataFrame(schedule, columns=['Hari', 'Waktu', 'Mata Kuliah', 'Kelas', 'Ruang', 'Jumlah Mahasiswa',
+                                           'Kapasitas'])
+
+
+@pytest.mark.parametrize('preset', ['kecil', 'sedang'])
+def test_greedy_room_index_matches_baseline(preset):
+    instance = ProblemInstance(*synthetic_sheets(**PRESETS[preset]))
+    jadwal_dan_makul, _ = stage_sesi(instance, {**DEFAULT_PARAMS, 'generations': 10})
+    # Slot yang sesak: semua mata kuliah dalam beberapa slot pertama, agar
+    # ruang lab dan non-lab sama-sama habis
+    crowded = jadwal_dan_makul.assign(Jam=jadwal_dan_makul['Jam'].iloc[0], Hari=jadwal_dan_makul['Hari'].iloc[0])
+    for df in (jadwal_dan_makul, crowded):
+        expected = _baseline_generate_schedule(df, instance.df_ruang, instance.df_butuh_lab)
+        assert_frame_equal(generate_schedule(df, instance), expected, check_dtype=False)
+
+
+def _baseline_fitness(schedule, df_ruang, df_butuh_lab):
+    # Fitness ruang versi awal (iterrows), sebagai acuan RoomScorer
+    lab_rooms = df_ruang[df_ruang['Lab'] == 'y']['Ruang'].values
+    fitness_score = 0
+    for _, row in schedule.iterrows():
+        is_lab_course = row['Mata Kuliah'] in df_butuh_lab['Butuh Lab'].values
+        difference = row['Kapasitas'] - row['Jumlah Mahasiswa']
+        if is_lab_course and row['Ruang'] in lab_rooms:
+            fitness_score += row['Kapasitas'] - difference
+        elif is_lab_course:
+            fitness_score -= 10
+        fitness_score -= difference
+    return fitness_score
+
+
+def test_room_scorer_matches_baseline_fitness():
+    instance = ProblemInstance(*synthetic_sheets(**PRESETS['sedang']))
+    jadwal_dan_makul, _ = stage_sesi(instance, {**DEFAULT_PARAMS, 'generations': 10})
+    crowded = jadwal_dan_makul.assign(Jam=jadwal_dan_makul['Jam'].iloc[0], Hari=jadwal_dan_makul['Hari'].iloc[0])
+    schedules = [generate_schedule(df, instance) for df in (jadwal_dan_makul, crowded)]
+    expected = [_baseline_fitness(s, instance.df_ruang, instance.df_butuh_lab) for s in schedules]
+    assert [fitness(s, instance) for s in schedules] == expected
+
+    scorer = RoomScorer(instance)
+    np.testing.assert_array_equal(scorer.score_many(schedules), expected)
+    stacked = pd.concat([s.assign(Kandidat=k) for k, s in enumerate(schedules)], ignore_index=True)
+    np.testing.assert_array_equal(scorer.score_many(stacked), expected)
+
+    # Bentuk array: kandidat dipadatkan ke panjang yang sama dengan ruang -1
+    width = max(len(s) for s in schedules)
+    is_lab_course = np.zeros((2, width), dtype=bool)
+    room = np.full((2, width), -1)
+    jumlah = np.zeros((2, width), dtype=np.int64)
+    for k, s in enumerate(schedules):
+        n = len(s)
+        is_lab_course[k, :n] = s['Mata Kuliah'].isin(instance.makul[instance.makul_lab])
+        room[k, :n] = pd.Index(instance.ruang).get_indexer(s['Ruang'])
+        jumlah[k, :n] = s['Jumlah Mahasiswa']
+    np.testing.assert_array_equal(scorer.score_arrays(is_lab_course, room, jumlah), expected)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from sesi import (MAX_PER_SLOT, SesiProblem, crossover, fitness_function, generate_initial_population,
+                  genetic_algorithm, slot_counts)
+
+
+@pytest.fixture(scope='module')
+def instance():
+    return ProblemInstance(*synthetic_sheets(**PRESETS['sedang']))
+
+
+def test_ga_returns_valid_reproducible_schedule(instance):
+    problem = SesiProblem(instance)
+    best, fitness, history = genetic_algorithm(problem, 30, 25, seed=5)
+    again, _, _ = genetic_algorithm(problem, 30, 25, seed=5)
+    np.testing.assert_array_equal(best, again)
+
+    assert best.shape == (problem.n_makul,) and best.dtype.kind == 'i'
+    assert (slot_counts(problem, best[None]) <= MAX_PER_SLOT).all()
+    assert fitness == fitness_function(problem, best[None])[0]
+    assert len(history) == 25
+    assert fitness >= max(record['best_fitness'] for record in history)
+
+
+def test_decode_follows_instance_codes(instance):
+    problem = SesiProblem(instance)
+    individual = generate_initial_population(problem, 1, np.random.default_rng(6))[0]
+    df_sesi = instance.df_sesi
+    for sesi, (hari, jam, makul, semester) in zip(individual, problem.decode(individual)):
+        assert (hari, jam) == (df_sesi['Hari'].iloc[sesi], df_sesi['Jam'].iloc[sesi])
+    assert [row[2] for row in problem.decode(individual)] == list(instance.makul)
+    assert [row[3] for row in problem.decode(individual)] == list(instance.makul_semester)
+
+
+def test_too_few_sessions_is_reported():
+    df_sesi, *rest = synthetic_sheets(**PRESETS['kecil'])
+    problem = SesiProblem(ProblemInstance(df_sesi.head(2), *rest))
+    with pytest.raises(ValueError, match="sesi tidak cukup"):
+        generate_initial_population(problem, 4, np.random.default_rng(0))
+
+
+def _excess(problem, population):
+    return np.maximum(slot_counts(problem, population) - MAX_PER_SLOT, 0).sum()
+
+
+@pytest.mark.parametrize('warm', [False, True], ids=['bebas', 'warm'])
+def test_crossover_children_respect_slots_and_fixed_genes(instance, warm):
+    problem = SesiProblem(instance)
+    fixed = None
+    if warm:
+        fixed = generate_initial_population(problem, 1, np.random.default_rng(1))[0]
+        fixed[1::2] = -1
+        problem = SesiProblem(instance, fixed)
+    rng = np.random.default_rng(2)
+    parents1 = generate_initial_population(problem, 50, rng)
+    parents2 = generate_initial_population(problem, 50, rng)
+
+    # Titik potong yang sama seperti di crossover (rng pertama kali dipakai di sana)
+    cut = np.random.default_rng(3).integers(0, problem.n_makul, size=50)
+    left = np.arange(problem.n_makul) < cut[:, None]
+    raw1, raw2 = np.where(left, parents1, parents2), np.where(left, parents2, parents1)
+
+    child1, child2, repairs = crossover(problem, parents1, parents2, np.random.default_rng(3))
+    for raw, child in ((raw1, child1), (raw2, child2)):
+        assert (slot_counts(problem, child) <= MAX_PER_SLOT).all()
+        # Hanya gen bebas di bagian hasil silang yang dipindah
+        changed = child != raw
+        assert not (changed & left).any()
+        assert not changed[:, ~problem.is_free].any()
+        if fixed is not None:
+            pinned = fixed >= 0
+            np.testing.assert_array_equal(child[:, pinned], np.broadcast_to(fixed[pinned], child[:, pinned].shape))
+    # Setiap perbaikan memindah satu gen dari slot berlebih ke slot yang belum penuh
+    assert repairs == _excess(problem, raw1) + _excess(problem, raw2)
+    assert repairs == (child1 != raw1).sum() + (child2 != raw2).sum()
+    assert repairs > 0
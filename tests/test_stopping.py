@@ -0,0 +1,135 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pengawas
+import sesi
+from bench import PRESETS, synthetic_sheets
+from instance import ProblemInstance
+from pipeline import DEFAULT_PARAMS
+from stopping import ADAPT_FACTOR, ADAPT_WINDOW, MAX_SCALE, Convergence, from_params
+
+
+@pytest.fixture(scope='module')
+def instance():
+    return ProblemInstance(*synthetic_sheets(**PRESETS['kecil']))
+
+
+@pytest.fixture(scope='module')
+def pengawas_problem(instance):
+    rooms = instance.df_ruang['Ruang'].to_numpy()
+    df_jadwal = pd.DataFrame({
+        'Hari': np.repeat(instance.hari[:2], 4),
+        'Waktu': np.tile(['08.00', '08.00', '10.00', '10.00'], 2),
+        'Mata Kuliah': instance.makul[:8],
+        'Ruang': np.tile(rooms[:2], 4),
+    })
+    return pengawas.PengawasProblem(instance, df_jadwal)
+
+
+def test_adaptive_scale_grows_while_stagnating_and_resets():
+    convergence = Convergence(adaptive=True)
+    convergence.update(0.0)
+    scales = []
+    for _ in range(8 * ADAPT_WINDOW):
+        convergence.update(0.0)
+        scales.append(convergence.scale)
+    assert scales[ADAPT_WINDOW - 2] == 1.0
+    assert scales[ADAPT_WINDOW - 1] == ADAPT_FACTOR
+    assert scales[2 * ADAPT_WINDOW - 1] == ADAPT_FACTOR ** 2
+    assert scales[-1] == MAX_SCALE
+    assert convergence.mutation_rate(0.1) == pytest.approx(0.1 * MAX_SCALE)
+    assert convergence.mutation_rate(0.5) == 1.0
+    assert convergence.crossover_rate(0.8) == pytest.approx(0.8 / MAX_SCALE)
+
+    assert not convergence.update(1.0)
+    assert convergence.scale == 1.0 and convergence.since_improvement == 0
+
+
+def test_from_params_follows_pipeline_switches():
+    params = {**DEFAULT_PARAMS, 'stop_at_optimum': 0, 'stagnation': 7, 'min_diversity': 0.2, 'adaptive_rates': 1}
+    convergence = from_params(params, target=5, deadline=12.0)
+    assert convergence.target is None
+    assert (convergence.stagnation, convergence.deadline, convergence.min_diversity) == (7, 12.0, 0.2)
+    assert convergence.adaptive
+    assert from_params(DEFAULT_PARAMS, target=5).target == 5
+
+
+def test_sesi_ga_stops_at_target(instance):
+    problem = sesi.SesiProblem(instance)
+    convergence = Convergence(target=sesi.max_fitness(problem))
+    _, best_fitness, history = sesi.genetic_algorithm(problem, 50, 200, seed=0, convergence=convergence)
+    assert convergence.reason == 'target'
+    assert best_fitness == convergence.target
+    assert len(history) == convergence.generation - 1 < 200
+
+
+def test_sesi_ga_stops_on_stagnation(instance):
+    problem = sesi.SesiProblem(instance)
+    convergence = Convergence(stagnation=4)
+    _, best_fitness, _ = sesi.genetic_algorithm(problem, 20, 500, seed=0, convergence=convergence)
+    assert convergence.reason == 'stagnation'
+    assert convergence.since_improvement == 4 and convergence.best == best_fitness
+
+
+@pytest.mark.parametrize('convergence, reason', [
+    (lambda: Convergence(deadline=time.perf_counter()), 'time_budget'),
+    (lambda: Convergence(min_diversity=1.1), 'diversity'),
+])
+def test_both_gas_stop_after_first_generation(instance, pengawas_problem, convergence, reason):
+    sesi_convergence = convergence()
+    _, _, history = sesi.genetic_algorithm(sesi.SesiProblem(instance), 20, 50, seed=0, convergence=sesi_convergence)
+    assert (sesi_convergence.reason, sesi_convergence.generation, len(history)) == (reason, 1, 0)
+
+    pengawas_convergence = convergence()
+    history = []
+    pengawas.solve_ga(pengawas_problem, 50, 20, seed=0, history=history, convergence=pengawas_convergence)
+    assert (pengawas_convergence.reason, pengawas_convergence.generation, len(history)) == (reason, 1, 1)
+
+
+def _record_scale(monkeypatch):
+    # Skala Convergence setelah setiap update
+    scales = []
+    update = Convergence.update
+
+    def recording(self, *args, **kwargs):
+        stop = update(self, *args, **kwargs)
+        scales.append(self.scale)
+        return stop
+
+    monkeypatch.setattr(Convergence, 'update', recording)
+    return scales
+
+
+def test_sesi_ga_scales_mutation_rate(instance, monkeypatch):
+    scales = _record_scale(monkeypatch)
+    rates = []
+    mutate = sesi.mutate
+
+    def recording(problem, population, mutation_rate, rng, state):
+        rates.append(mutation_rate)
+        return mutate(problem, population, mutation_rate, rng, state)
+
+    monkeypatch.setattr(sesi, 'mutate', recording)
+    # Target tidak tercapai agar stagnasi di sekitar optimum terjadi
+    sesi.genetic_algorithm(sesi.SesiProblem(instance), 20, 80, mutation_rate=0.1, seed=0,
+                           convergence=Convergence(adaptive=True))
+    assert max(scales) > 1.0
+    assert rates == pytest.approx([min(0.1 * scale, 1.0) for scale in scales])
+
+
+def test_pengawas_ga_scales_mutated_rows(pengawas_problem, monkeypatch):
+    scales = _record_scale(monkeypatch)
+    n_rows = []
+    mutate = pengawas.mutate
+
+    def recording(problem, population, load, rng, n_rows_=1):
+        n_rows.append(n_rows_)
+        return mutate(problem, population, load, rng, n_rows_)
+
+    monkeypatch.setattr(pengawas, 'mutate', recording)
+    pengawas.solve_ga(pengawas_problem, 80, 20, seed=0, convergence=Convergence(adaptive=True))
+    assert max(scales) > 1.0
+    assert n_rows == [max(1, int(round(scale))) for scale in scales]
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('streamlit')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ['numpy', 'pandas', 'openpyxl', 'xlsxwriter', 'pyarrow', 'pipeline', 'jobs', 'export']
+
+# Dijalankan di proses baru agar sys.modules belum terisi oleh test lain
+SCRIPT = f"""
+import sys
+import ujiandsb
+{{call}}
+print('loaded:' + ','.join(name for name in {HEAVY!r} if name in sys.modules))
+"""
+
+
+@pytest.mark.parametrize('call', ['', 'ujiandsb.main()'])
+def test_ui_defers_pipeline_imports(call):
+    result = subprocess.run([sys.executable, '-c', SCRIPT.format(call=call)], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == 'loaded:'
@@ -0,0 +1,28 @@
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bench import PRESETS, synthetic_sheets, workbook_bytes
+from pipeline import run_pipeline
+
+
+@pytest.mark.parametrize('params', [{}, {'islands': 2, 'migration_interval': 5}, {'pengawas_solver': 'flow'}],
+                         ids=['ga', 'islands', 'flow'])
+def test_unchanged_input_pins_everything(workbook, params):
+    params = {'generations': 20, 'pengawas_generations': 20, **params}
+    first = run_pipeline(workbook, params)
+    again = run_pipeline(workbook, params, previous=first['excel'])
+
+    for stage, info in again['warm_info'].items():
+        assert info['pinned'] == info['total'], stage
+    columns = ['Hari', 'Waktu', 'Mata Kuliah', 'Pengawas', 'Ruang', 'Jumlah Mahasiswa']
+    key = ['Hari', 'Waktu', 'Ruang']
+    expected = first['jadwal'].dropna(subset=['Mata Kuliah'])[columns].sort_values(key).reset_index(drop=True)
+    actual = again['jadwal'].dropna(subset=['Mata Kuliah'])[columns].sort_values(key).reset_index(drop=True)
+    assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_ga_schedule_has_no_double_booking():
+    hasil = run_pipeline(workbook_bytes(synthetic_sheets(**PRESETS['sedang'])), {'generations': 20})
+    jadwal = hasil['jadwal'].dropna(subset=['Mata Kuliah'])
+    pengawas = jadwal.assign(Pengawas=jadwal['Pengawas'].str.split(', ')).explode('Pengawas')
+    assert not pengawas.duplicated(['Hari', 'Waktu', 'Pengawas']).any()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Warm start dari jadwal_ujian.xlsx sebelumnya: setiap tahap memakai hasil
+# lama sebagai titik awal dan hanya bagian yang terdampak perubahan input
+# yang dioptimasi ulang.
+#   - sesi: mata kuliah yang sesi lamanya masih ada tetap di sesi itu;
+#     mata kuliah baru (atau yang sesinya hilang) diacak oleh GA.
+#   - ruang: slot (Hari, Jam) yang isi mata kuliah dan jumlah mahasiswanya
+#     sama, dan ruang lamanya masih ada dengan kapasitas sama, dipakai apa
+#     adanya; slot lain dikemas ulang.
+#   - pengawas: baris (Hari, Waktu, Ruang, Mata Kuliah) yang sama tetap
+#     diawasi dosen lama selama dosennya masih ada, jumlahnya sesuai ruang
+#     dan tidak bentrok; sisanya dicari oleh GA.
+
+import numpy as np
+
+from sesi import MAX_PER_SLOT
+
+
+class WarmStart:
+    def __init__(self, instance, df_jadwal):
+        # df_jadwal: sheet 'Jadwal' sebelumnya (ingest.read_jadwal), baris
+        # ruang kosong dibuang
+        self.instance = instance
+        self.previous = df_jadwal.dropna(subset=['Mata Kuliah'])
+        self.info = {}
+
+    def _record(self, stage, pinned, total):
+        self.info[stage] = {'pinned': int(pinned), 'total': int(total)}
+
+    def sesi_fixed(self):
+        # Sesi tetap per mata kuliah (urut instance.makul), -1 = bebas
+        instance = self.instance
+        sesi_of = {}
+        for s in range(instance.n_sesi):
+            sesi_of.setdefault((instance.hari[instance.sesi_hari[s]], instance.jam[instance.sesi_jam[s]]), s)
+        first = self.previous.drop_duplicates('Mata Kuliah')
+        placed = dict(zip(first['Mata Kuliah'], zip(first['Hari'], first['Waktu'])))
+
+        fixed = np.full(instance.n_makul, -1, dtype=np.intp)
+        used = np.zeros(instance.n_slot, dtype=np.intp)
+        for m, mata_kuliah in enumerate(instance.makul):
+            s = sesi_of.get(placed.get(mata_kuliah))
+            if s is None:
+                continue
+            slot = instance.sesi_slot[s]
+            # Batas 2 mata kuliah per slot tetap dijaga
+            if used[slot] < MAX_PER_SLOT:
+                fixed[m] = s
+                used[slot] += 1
+        self._record('sesi', (fixed >= 0).sum(), instance.n_makul)
+        return fixed
+
+    def ruang_fixed(self, jadwal_dan_makul):
+        # Penempatan lama untuk slot yang tidak berubah: (hari, jam) -> list
+        # baris berformat ruang.optimize_schedule
+        instance = self.instance
+        rooms = {ruang: (capacity, is_lab) for ruang, capacity, is_lab
+                 in zip(instance.ruang, instance.ruang_capacity, instance.ruang_is_lab)}
+        demand = jadwal_dan_makul.groupby(['Hari', 'Jam', 'Mata Kuliah'])['Jumlah Mahasiswa'].sum()
+        current = {slot: dict(zip(group.index.get_level_values(2), group.to_numpy()))
+                   for slot, group in demand.groupby(level=[0, 1], sort=False)}
+
+        fixed = {}
+        for (hari, waktu), group in self.previous.groupby(['Hari', 'Waktu'], sort=False):
+            courses = current.get((hari, waktu))
+            previous = group.groupby('Mata Kuliah')['Jumlah Mahasiswa'].sum()
+            if courses is None or courses != previous.to_dict():
+                continue
+            rows = []
+            # Kolom Lab opsional: jika ada, status lab ruang juga harus sama
+            labs = group['Lab'].eq('lab') if 'Lab' in group else [None] * len(group)
+            for mata_kuliah, ruang, jumlah, kapasitas, lab in zip(group['Mata Kuliah'], group['Ruang'],
+                                                                 group['Jumlah Mahasiswa'], group['Kapasitas'], labs):
+                room = rooms.get(ruang)
+                if (room is None or room[0] != kapasitas or jumlah > kapasitas
+                        or (lab is not None and room[1] != lab)):
+                    break
+                rows.append([hari, waktu, mata_kuliah, 'Gabungan', ruang, int(jumlah), room[0]])
+            else:
+                # Urutan seperti optimize_schedule: per mata kuliah, kapasitas terbesar dulu
+                rows.sort(key=lambda row: (row[2], -row[6]))
+                fixed[(hari, waktu)] = rows
+        self._record('ruang', len(fixed), len(current))
+        return fixed
+
+    def pengawas_fixed(self, df_jadwal):
+        # Matriks id pengawas lama per baris df_jadwal (-1 = bebas)
+        instance = self.instance
+        dosen_id = {dosen: i for i, dosen in enumerate(instance.dosen)}
+        required_by_room = dict(zip(instance.ruang, instance.ruang_pengawas.tolist()))
+        required = [required_by_room[ruang] for ruang in df_jadwal['Ruang']]
+        pengawas = dict(zip(zip(self.previous['Hari'], self.previous['Waktu'], self.previous['Ruang'],
+                                self.previous['Mata Kuliah']), self.previous['Pengawas']))
+
+        fixed = np.full((len(df_jadwal), max(required, default=0)), -1, dtype=np.intp)
+        busy = {}
+        keys = zip(df_jadwal['Hari'], df_jadwal['Waktu'], df_jadwal['Ruang'], df_jadwal['Mata Kuliah'])
+        for r, key in enumerate(keys):
+            names = pengawas.get(key)
+            if not isinstance(names, str):
+                continue
+            ids = [dosen_id.get(name) for name in names.split(', ')]
+            slot = busy.setdefault(key[:2], set())
+            if None in ids or len(set(ids)) != len(ids) or len(ids) != required[r] or slot.intersection(ids):
+                continue
+            fixed[r, :len(ids)] = ids
+            slot.update(ids)
+        self._record('pengawas', (fixed[:, 0] >= 0).sum() if len(fixed) else 0, len(df_jadwal))
+        return fixed